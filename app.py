@@ -9,25 +9,42 @@
 import streamlit as st
 import requests
 import xml.etree.ElementTree as ET
-import json
-import time
 import re
-import os
+import unicodedata
+import hashlib
+import importlib.util
 from datetime import datetime
-from io import BytesIO
-import zipfile
+import io
+import tempfile
 import pandas as pd
-import PyPDF2
-import pdfplumber
-from typing import List, Set, Dict, Optional, Tuple, Any, cast
+from typing import List, Set, Dict, Optional, Tuple, Any, Callable, Iterable, Iterator, cast
 from dataclasses import dataclass
-from functools import lru_cache
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
-import base64
-import urllib.parse
-from collections import defaultdict, deque
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson  # 선택사항: JSON 직렬화 가속
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree as lxml_etree  # 선택사항: 대용량 상세 XML 파싱 가속
+except ImportError:
+    lxml_etree = None
+
+# 태그에 '법령명'이 들어간 요소 (lxml 사용 시 C 구현 XPath로 한 번에 선택)
+LAW_NAME_ELEMENTS_XPATH = (
+    lxml_etree.XPath("descendant-or-self::*[contains(name(), '법령명')]")
+    if lxml_etree is not None else None
+)
+
+try:
+    import re2  # 선택사항: 법령명 추출 정규식 가속 (google-re2, 선형 시간 매칭)
+except ImportError:
+    re2 = None
 
 # 로깅 설정
 logging.basicConfig(
@@ -44,6 +61,98 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ===== 유틸리티 =====
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """UTF-8 JSON bytes 생성 - orjson이 있으면 사용, 없으면 표준 json
+
+    기본은 2칸 들여쓰기이며, compact=True면 공백 없이 한 줄로 직렬화합니다.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option)
+
+    import json  # orjson 미설치 시에만 필요
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def loads_json(data: Any) -> Any:
+    """JSON 파싱 - orjson이 있으면 사용, 없으면 표준 json (오류는 모두 ValueError 계열)"""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    import json
+    return json.loads(data)
+
+
+def truncate_text(text: str, limit: int) -> str:
+    """미리보기용 축약 - limit자를 넘을 때만 잘라서 '...'을 붙임"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def parse_xml(data: bytes, huge_tree: bool = False) -> ET.Element:
+    """API 응답 XML 파싱 - lxml이 있으면 사용, 없으면 xml.etree
+
+    lxml 요소도 find/findall/findtext/itertext를 동일하게 지원하므로
+    파싱 이후 코드는 그대로 사용합니다. 구문 오류는 ET.ParseError로 변환하여
+    호출부의 기존 예외 처리를 유지합니다.
+
+    huge_tree=True는 libxml2의 대용량·깊은 문서 제한을 해제하므로, 본문·별표 텍스트가
+    매우 큰 법령/행정규칙 상세 응답에만 사용합니다 (검색 응답 등은 기본 제한 유지).
+    """
+    if lxml_etree is not None:
+        try:
+            if huge_tree:
+                # 파서 객체는 스레드 간 공유하지 않도록 호출마다 생성
+                return lxml_etree.fromstring(data, parser=lxml_etree.XMLParser(huge_tree=True))
+            return lxml_etree.fromstring(data)
+        except lxml_etree.XMLSyntaxError as e:
+            raise ET.ParseError(str(e)) from e
+    return ET.fromstring(data)
+
+
+def compile_law_pattern(pattern: str) -> Any:
+    """법령명 추출 패턴 컴파일 - google-re2가 있으면 사용, 없으면 re
+
+    RE2는 백트래킹 없이 입력 길이에 비례한 시간으로 매칭하므로 대용량 PDF 텍스트에서도
+    최악의 경우가 없습니다. 패턴은 re.MULTILINE | re.IGNORECASE와 같은 의미의 인라인
+    플래그로 컴파일하며, RE2가 지원하지 않는 구문이면 re로 컴파일합니다.
+    두 엔진의 매치 객체 모두 finditer/group을 지원하므로 호출부는 동일합니다.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(f"(?mi){pattern}")
+        except re2.error:
+            logger.debug(f"RE2 미지원 패턴, re 사용: {pattern}")
+    return re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+
+
+def extract_pdf_text_pdfium(file) -> str:
+    """pypdfium2(PDFium)로 PDF 텍스트 추출 - 레이아웃 분석 없이 페이지 텍스트만 읽음
+
+    pdfplumber(pdfminer.six)보다 훨씬 빠르며, 법령명 추출에는 페이지 텍스트면 충분합니다.
+    PDFium은 스레드 안전하지 않으므로 페이지는 순차 처리하되, 파일 객체 대신
+    메모리 버퍼를 넘겨 페이지 로딩 중 Python 읽기 콜백이 호출되지 않도록 합니다.
+    """
+    import pypdfium2 as pdfium  # PDF 업로드 시에만 필요하므로 지연 임포트
+
+    data = file.getvalue() if hasattr(file, 'getvalue') else file.read()
+    pdf = pdfium.PdfDocument(data)
+    try:
+        page_texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            if page_text:
+                page_texts.append(page_text.replace('\r\n', '\n') + "\n")
+        return ''.join(page_texts)
+    finally:
+        pdf.close()
+
+
 # ===== 설정 클래스 =====
 @dataclass
 class APIConfig:
@@ -55,14 +164,16 @@ class APIConfig:
     ADMIN_RULE_DETAIL_URL = "https://www.law.go.kr/DRF/lawService.do"  # 행정규칙도 동일 서비스 사용
     
     # API 설정
-    DEFAULT_DELAY = 0.3  # API 호출 간격 (초)
     MAX_RETRIES = 3      # 최대 재시도 횟수
     TIMEOUT = 30         # 타임아웃 (초)
-    MAX_CONCURRENT = 5   # 최대 동시 요청 수
+    MAX_CONCURRENT = 5   # 최대 동시 요청 수 (세션 연결 풀 크기로도 강제됨)
     
     # 페이지당 결과 수
     RESULTS_PER_PAGE = 100
 
+    # 진행률 UI 갱신 최대 횟수 (항목 수와 무관하게 websocket 메시지 수 제한)
+    MAX_PROGRESS_UPDATES = 50
+
 
 class LawPatterns:
     """법령명 추출 패턴을 관리하는 클래스 - 개선된 버전"""
@@ -78,6 +189,17 @@ class LawPatterns:
         '고시', '훈령', '예규', '지침', '분류', '업무규정', '감독규정'
     }
     
+    # 법령 타입 중 하나라도 포함되는지 한 번의 탐색으로 검사
+    LAW_TYPE_PATTERN = re.compile('|'.join(
+        re.escape(law_type) for law_type in sorted(LAW_TYPES, key=len, reverse=True)
+    ))
+    
+    # 법령명에 남아 있으면 안 되는 카테고리 접두어
+    CATEGORY_PREFIXES = ('행정규칙', '법령')
+    
+    # 문서 구조 분석용 카테고리 키워드 (순서대로 검사)
+    CATEGORY_KEYWORDS = ('상하위법', '관련법령', '행정규칙', '법령')
+    
     # 행정규칙 키워드
     ADMIN_KEYWORDS = {
         '규정', '고시', '훈령', '예규', '지침', '세칙', '기준', '요령', '지시'
@@ -112,22 +234,80 @@ class LawPatterns:
         r'([가-힣]+(?:\s+)?분류)(?:\s|$)',
     ]
 
+    # 미리 컴파일된 패턴 - 호출마다 re 모듈 캐시를 조회하지 않도록 함
+    # 접두어 패턴을 순서대로 한 번씩 적용하는 것과 같은 단일 패턴 (한 번의 치환으로 처리)
+    COMBINED_PREFIX_PATTERN = re.compile(
+        '^' + ''.join(f"(?:{pattern.lstrip('^')})?" for pattern in PREFIX_PATTERNS)
+    )
+    # 하나의 alternation으로 합치지 않음: 합친 패턴은 위치마다 먼저 매칭된 분기만 남기고
+    # 그 구간을 소비하므로, 같은 구간에 여러 패턴이 겹쳐 찾던 법령명(예: '...분류', '...감독규정')이 누락됨.
+    # 대신 아래 LAW_PATTERN_KEYWORDS로 텍스트에 해당할 수 없는 패턴의 탐색을 건너뜀
+    COMPILED_LAW_PATTERNS = [compile_law_pattern(pattern) for pattern in LAW_PATTERNS]
+
+    # LAW_PATTERNS 각각이 매칭되려면 반드시 포함해야 하는 문자열 (순서 동일)
+    # 텍스트에 하나도 없으면 해당 패턴의 정규식 탐색을 건너뜀
+    LAW_PATTERN_KEYWORDS = [
+        ('[시행',),
+        ('규정',),
+        ('시행세칙',),
+        ('규정',),
+        ('법',),
+        ('시행령',),
+        ('시행규칙',),
+        ('고시', '훈령', '예규', '지침'),
+        ('분류',),
+    ]
+
 
 # ===== 파일에서 법령명 추출 클래스 =====
 class EnhancedLawFileExtractor:
     """개선된 법령명 추출 클래스"""
+
+    # 시행 정보 ([시행 2024. 1. 1.]) 패턴
+    ENFORCEMENT_INFO_PATTERN = re.compile(r'\s*\[시행[^\]]+\]')
+    ENFORCEMENT_DATE_PATTERN = re.compile(r'\[시행\s*\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\.\]')
+    # AI 응답의 목록 번호/기호
+    LIST_MARKER_PATTERN = re.compile(r'^[\d\-\.\*\•\·]+\s*')
+    # 공백 정리와 표기 표준화를 한 번의 치환으로 처리 (텍스트 정규화 / 법령명 정제)
+    TEXT_NORMALIZE_PATTERN = re.compile(r'\s+|에관한|및|·|，')
+    TEXT_REPLACEMENTS = {
+        '에관한': '에 관한',
+        '및': ' 및 ',
+        '·': '·',  # 중점 통일
+        '，': ',',  # 쉼표 통일
+    }
+    LAW_NAME_CLEAN_PATTERN = re.compile(r'\s+|검사및|에관한')
+    LAW_NAME_REPLACEMENTS = {
+        '검사및': '검사 및 ',
+        '에관한': '에 관한 ',
+    }
+
+    # AI 보강: 요청당 텍스트 길이(글자/토큰), 문서당 최대 요청 수, 동시 요청 수
+    AI_CHUNK_SIZE = 3000
+    AI_CHUNK_TOKENS = 1500  # tiktoken 설치 시 토큰 기준 분할
+    AI_MAX_CHUNKS = 8
+    AI_MAX_CONCURRENT = 4
+
+    # AI 요청 설정
+    AI_MODEL = "gpt-4o-mini"
+    AI_MAX_OUTPUT_TOKENS = 800
+    AI_SYSTEM_PROMPT = "한국 법령 전문가. 법령체계도에서 법령명을 정확히 추출하고, 특수문자 변환과 사용자 의도를 파악합니다."
     
-    def __init__(self, use_ai: bool = False, api_key: Optional[str] = None):
+    def __init__(self, use_ai: bool = False, api_key: Optional[str] = None,
+                 defer_ai: bool = False):
         self.patterns = LawPatterns()
         self.use_ai = use_ai
         self.api_key = api_key
+        # defer_ai: AI 보강을 즉시 호출하지 않고 Batch API로 모아서 제출
+        self.defer_ai = defer_ai
+        self.deferred_ai_inputs: List[Tuple[str, Set[str]]] = []
         self.logger = logging.getLogger(self.__class__.__name__)
         
     def extract_from_file(self, file, file_type: str) -> List[str]:
         """파일 타입에 따른 추출 메서드 디스패치"""
         extractors = {
             'pdf': self._extract_from_pdf,
-            'xlsx': self._extract_from_excel,
+            'xlsx': self._extract_from_xlsx,
             'xls': self._extract_from_excel,
             'md': self._extract_from_markdown,
             'txt': self._extract_from_text
@@ -146,7 +326,10 @@ class EnhancedLawFileExtractor:
             laws = self._extract_laws_from_text(text)
             
             if self.use_ai and self.api_key:
-                laws = self._enhance_with_ai(text, laws)
+                if self.defer_ai:
+                    self.deferred_ai_inputs.append((text, set(laws)))
+                else:
+                    laws = self._enhance_with_ai(text, laws)
                 
             return sorted(list(laws))
             
@@ -156,29 +339,49 @@ class EnhancedLawFileExtractor:
             return []
     
     def _read_pdf_content(self, file) -> str:
-        """PDF 내용 읽기 - pdfplumber 우선, 실패시 PyPDF2"""
-        text = ""
-        
-        # pdfplumber 시도
+        """PDF 내용 읽기 - pypdfium2 우선, 실패시 PyPDF2, pdfplumber 순으로 폴백
+
+        pdfplumber는 레이아웃 분석을 하는 가장 느린 추출기이므로 마지막 수단으로만 사용
+        """
+        # pypdfium2 시도 (C 기반, 가장 빠름)
         try:
-            with pdfplumber.open(file) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
+            text = extract_pdf_text_pdfium(file)
+            if text.strip():
+                return text
         except Exception as e:
-            self.logger.warning(f"pdfplumber 실패: {e}")
+            self.logger.warning(f"pypdfium2 실패: {e}")
+        file.seek(0)
+
+        # PDF 라이브러리는 폴백이 필요할 때만 지연 임포트
+        import pdfplumber
+        import PyPDF2
+
+        # 페이지 텍스트는 리스트에 모아 마지막에 한 번만 결합 (문자열 += 반복 재할당 방지)
+        page_texts: List[str] = []
         
-        # PyPDF2 폴백
+        # PyPDF2 시도 (레이아웃 분석 없음)
         try:
-            file.seek(0)
             pdf_reader = PyPDF2.PdfReader(file)
             for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+                page_texts.append(page.extract_text() + "\n")
+            text = ''.join(page_texts)
+            if text.strip():
+                return text
         except Exception as e:
-            self.logger.error(f"PyPDF2도 실패: {e}")
+            self.logger.warning(f"PyPDF2 실패: {e}")
+        
+        # pdfplumber 폴백
+        try:
+            file.seek(0)
+            page_texts = []
+            with pdfplumber.open(file) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        page_texts.append(page_text + "\n")
+            return ''.join(page_texts)
+        except Exception as e:
+            self.logger.error(f"pdfplumber도 실패: {e}")
             raise
     
     def _extract_laws_from_text(self, text: str) -> Set[str]:
@@ -194,44 +397,24 @@ class EnhancedLawFileExtractor:
             text = text.replace(exclude_keyword, '\n')
         
         # 패턴 매칭으로 법령명 추출
-        for pattern in self.patterns.LAW_PATTERNS:
-            matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
-                law_name = self._clean_law_name(match)
-                if self._validate_law_name(law_name):
+        for pattern, keywords in zip(self.patterns.COMPILED_LAW_PATTERNS,
+                                     self.patterns.LAW_PATTERN_KEYWORDS):
+            if not any(keyword in text for keyword in keywords):
+                continue
+            # 패턴마다 캡처 그룹이 하나 - 결과 리스트를 만들지 않고 순회
+            for match in pattern.finditer(text):
+                law_name = self._clean_law_name(match.group(1))
+                # 모든 패턴의 캡처 그룹은 법령 타입(법/규정/세칙/분류/고시 등)으로 끝나고 정제 후에도 유지됨
+                if self._validate_law_name(law_name, has_law_type=True):
                     laws.add(law_name)
         
         # 라인별 추가 처리
+        # 제외 키워드는 위에서 모두 줄바꿈으로 바뀌었으므로 라인에 다시 나타나지 않음
         for line in text.split('\n'):
             line = line.strip()
-            
-            # 제외 키워드가 포함된 라인은 분할 처리
-            contains_exclude = False
-            for exclude_keyword in self.patterns.EXCLUDE_KEYWORDS:
-                if exclude_keyword in line:
-                    # 제외 키워드 앞뒤로 분할
-                    parts = line.split(exclude_keyword)
-                    for part in parts:
-                        part = part.strip()
-                        if part and part not in self.patterns.EXCLUDE_KEYWORDS:
-                            # 각 부분에서 법령명 추출
-                            for law_type in self.patterns.LAW_TYPES:
-                                if law_type in part:
-                                    law_name = self._extract_law_name_from_line(part, law_type)
-                                    if law_name and self._validate_law_name(law_name):
-                                        laws.add(law_name)
-                    contains_exclude = True
-                    break
-            
-            if contains_exclude:
-                continue
                 
             # 접두어 제거
-            for prefix_pattern in self.patterns.PREFIX_PATTERNS:
-                line = re.sub(prefix_pattern, '', line)
-            
-            if line in self.patterns.EXCLUDE_KEYWORDS:
-                continue
+            line = self.patterns.COMBINED_PREFIX_PATTERN.sub('', line)
             
             # 법령 타입별 매칭
             for law_type in self.patterns.LAW_TYPES:
@@ -245,23 +428,31 @@ class EnhancedLawFileExtractor:
         
         return laws
     
+    @staticmethod
+    def _substitute_in_one_pass(pattern: re.Pattern, replacements: Dict[str, str], text: str) -> str:
+        """공백 정리(앞뒤 제거, 연속 공백 축약)와 문자열 치환을 한 번의 스캔으로 수행"""
+        end = len(text)
+        
+        def replace(match: re.Match) -> str:
+            token = match.group()
+            if token in replacements:
+                return replacements[token]
+            # 공백: 앞뒤는 제거하고 중간은 한 칸으로
+            return '' if match.start() == 0 or match.end() == end else ' '
+        
+        return pattern.sub(replace, text)
+    
     def _normalize_text(self, text: str) -> str:
-        """텍스트 정규화"""
-        # 연속 공백 제거
-        text = ' '.join(text.split())
-        
-        # 표준화
-        replacements = {
-            '에관한': '에 관한',
-            '및': ' 및 ',
-            '·': '·',  # 중점 통일
-            '，': ',',  # 쉼표 통일
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-            
-        return text
+        """텍스트 정규화 (NFC 조합형 통일 + 연속 공백 제거 + 표기 표준화)
+
+        PDF 등에서 한글이 자모 분리형(NFD)으로 추출되면 [가-힣] 패턴에 매칭되지 않고,
+        같은 법령명이 서로 다른 문자열로 중복 추출되므로 패턴 매칭 전에 한 번 조합형으로 통일
+        """
+        if not unicodedata.is_normalized('NFC', text):
+            text = unicodedata.normalize('NFC', text)
+        return self._substitute_in_one_pass(
+            self.TEXT_NORMALIZE_PATTERN, self.TEXT_REPLACEMENTS, text
+        )
     
     def _clean_law_name(self, law_name: str) -> str:
         """법령명 정제"""
@@ -269,23 +460,15 @@ class EnhancedLawFileExtractor:
             law_name = str(law_name)
         
         # 시행 정보 제거
-        law_name = re.sub(r'\s*\[시행[^\]]+\]', '', law_name)
+        law_name = self.ENFORCEMENT_INFO_PATTERN.sub('', law_name)
         
         # 접두어 제거
-        for prefix_pattern in self.patterns.PREFIX_PATTERNS:
-            law_name = re.sub(prefix_pattern, '', law_name)
-        
-        # 앞뒤 공백 제거
-        law_name = law_name.strip()
-        
-        # 연속된 공백을 하나로
-        law_name = ' '.join(law_name.split())
+        law_name = self.patterns.COMBINED_PREFIX_PATTERN.sub('', law_name)
         
-        # 붙어있는 형태 정규화
-        law_name = re.sub(r'검사및', '검사 및 ', law_name)
-        law_name = re.sub(r'에관한', '에 관한 ', law_name)
-        
-        return law_name
+        # 앞뒤 공백 제거, 연속된 공백을 하나로, 붙어있는 형태 정규화
+        return self._substitute_in_one_pass(
+            self.LAW_NAME_CLEAN_PATTERN, self.LAW_NAME_REPLACEMENTS, law_name
+        )
     
     def _extract_law_name_from_line(self, line: str, law_type: str) -> Optional[str]:
         """라인에서 법령명 추출"""
@@ -316,8 +499,12 @@ class EnhancedLawFileExtractor:
         
         return line[start:end].strip()
     
-    def _validate_law_name(self, law_name: str) -> bool:
-        """법령명 유효성 검증"""
+    def _validate_law_name(self, law_name: str, has_law_type: bool = False) -> bool:
+        """법령명 유효성 검증
+
+        has_law_type: 법령 타입 접미사로 끝나야 매칭되는 LAW_PATTERNS 결과처럼
+        법령 타입 포함이 이미 보장된 경우 True (법령 타입 탐색 생략)
+        """
         # 길이 체크
         if len(law_name) < 3 or len(law_name) > 100:
             return False
@@ -326,16 +513,12 @@ class EnhancedLawFileExtractor:
         if law_name in self.patterns.EXCLUDE_KEYWORDS:
             return False
             
-        # 한글 포함 체크
-        if not re.search(r'[가-힣]', law_name):
-            return False
-            
-        # 법령 타입 포함 체크
-        if not any(law_type in law_name for law_type in self.patterns.LAW_TYPES):
+        # 접두어가 남아있는 경우 제거 (정규식보다 저렴한 부분 문자열 검사를 먼저 수행)
+        if any(prefix in law_name for prefix in self.patterns.CATEGORY_PREFIXES):
             return False
             
-        # 접두어가 남아있는 경우 제거
-        if any(pattern in law_name for pattern in ['행정규칙', '법령']):
+        # 법령 타입 포함 체크 - 법령 타입은 모두 한글이므로 한글 포함 여부도 함께 보장됨
+        if not has_law_type and not self.patterns.LAW_TYPE_PATTERN.search(law_name):
             return False
             
         return True
@@ -347,107 +530,114 @@ class EnhancedLawFileExtractor:
         # 정렬하여 긴 것부터 처리
         sorted_laws = sorted(laws, key=len, reverse=True)
         
+        # 채택된 법령명을 구분자로 이어 붙인 문자열 - 부분 문자열 검사를
+        # 법령명마다 파이썬 루프를 도는 대신 C 수준 문자열 탐색 한 번으로 처리
+        accepted_blob = ''
+        
         for law in sorted_laws:
-            # 부분 문자열 체크
-            is_substring = False
-            for existing in processed:
-                if law in existing and law != existing:
-                    is_substring = True
-                    break
-                    
-            if not is_substring:
-                # 최종 정규화
-                law = law.strip()
-                law = ' '.join(law.split())  # 연속 공백 제거
-                
-                # 접두어 최종 제거
-                for prefix_pattern in self.patterns.PREFIX_PATTERNS:
-                    law = re.sub(prefix_pattern, '', law)
+            # 부분 문자열 체크 (자신과 동일한 법령명 하나는 허용)
+            if accepted_blob.count(law) > (1 if law in processed else 0):
+                continue
                 
+            # 최종 정규화
+            law = law.strip()
+            law = ' '.join(law.split())  # 연속 공백 제거
+            
+            # 접두어 최종 제거
+            law = self.patterns.COMBINED_PREFIX_PATTERN.sub('', law)
+            
+            if law not in processed:
                 processed.add(law)
+                accepted_blob += '\x01' + law
                 
         return processed
     
+    def _create_openai_client(self):
+        """OpenAI 클라이언트 생성 - 라이브러리 또는 유효한 API 키가 없으면 None"""
+        # OpenAI 라이브러리 체크
+        if not is_openai_available():
+            self.logger.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
+            return None
+        
+        # API 키 유효성 검증 개선
+        if not self.api_key:
+            self.logger.warning("API 키가 설정되지 않았습니다.")
+            return None
+        
+        # API 키 정리 (공백 제거, 특수문자 확인)
+        cleaned_key = self.api_key.strip()
+        
+        # API 키 형식 검증
+        if not (cleaned_key.startswith('sk-') or cleaned_key.startswith('sess-')):
+            self.logger.warning(f"유효하지 않은 API 키 형식")
+            return None
+        
+        self.logger.info(f"OpenAI API 키 사용 중: {cleaned_key[:10]}...")
+        
+        # 키별로 공유되는 OpenAI 클라이언트 사용
+        return get_openai_client(cleaned_key)
+    
+    def _create_ai_request_body(self, sample: str, laws: Set[str], text: str,
+                                doc_structure: str) -> Dict[str, Any]:
+        """구간 하나에 대한 chat.completions 요청 본문 (즉시 호출과 Batch API 공용)"""
+        # 프롬프트 구성 - 강화된 버전
+        prompt = self._create_enhanced_ai_prompt(sample, laws, text, doc_structure)
+        return {
+            "model": self.AI_MODEL,
+            "messages": [
+                {"role": "system", "content": self.AI_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0,
+            "max_tokens": self.AI_MAX_OUTPUT_TOKENS
+        }
+    
     def _enhance_with_ai(self, text: str, laws: Set[str]) -> Set[str]:
         """AI를 활용한 법령명 추출 개선 - 강화된 버전"""
         try:
-            # OpenAI 라이브러리 체크
-            try:
-                from openai import OpenAI
-            except ImportError:
-                self.logger.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
-                return laws
-            
-            # API 키 유효성 검증 개선
-            if not self.api_key:
-                self.logger.warning("API 키가 설정되지 않았습니다.")
+            client = self._create_openai_client()
+            if client is None:
                 return laws
             
-            # API 키 정리 (공백 제거, 특수문자 확인)
-            cleaned_key = self.api_key.strip()
-            
-            # API 키 형식 검증
-            if not (cleaned_key.startswith('sk-') or cleaned_key.startswith('sess-')):
-                self.logger.warning(f"유효하지 않은 API 키 형식")
-                return laws
-            
-            self.logger.info(f"OpenAI API 키 사용 중: {cleaned_key[:10]}...")
-            
-            # OpenAI 클라이언트 생성 (키 재설정)
-            client = OpenAI(
-                api_key=cleaned_key,
-                max_retries=2,
-                timeout=30.0
-            )
-            
             # API 키 테스트를 위한 간단한 호출
             try:
-                # 텍스트 샘플링 (토큰 제한)
-                sample = text[:3000]
+                # 텍스트를 구간별로 나누어 (토큰 제한) 문서 전체를 대상으로 추출
+                chunks = self._split_text_for_ai(text)
                 
-                # 프롬프트 구성 - 강화된 버전
-                prompt = self._create_enhanced_ai_prompt(sample, laws, text)
+                # 문서 구조 분석은 모든 구간 프롬프트에서 공유
+                doc_structure = self._analyze_document_structure(text)
                 
-                # API 호출 - 안전한 방식으로
-                try:
-                    response = client.chat.completions.create(
-                        model="gpt-5",
-                        messages=[
-                            {"role": "system", "content": "한국 법령 전문가. 법령체계도에서 법령명을 정확히 추출하고, 특수문자 변환과 사용자 의도를 파악합니다."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.1,
-                        max_tokens=1500
-                    )
-
+                def extract_chunk(sample: str) -> Set[str]:
+                    request_body = self._create_ai_request_body(sample, laws, text, doc_structure)
+                    
+                    # API 호출 - 일시적 오류 재시도는 클라이언트(max_retries)가 처리하고,
+                    # 그 밖의 실패는 아래 failed_chunks로 집계
+                    response = client.chat.completions.create(**request_body)
+                    
                     # 응답 파싱
-                    ai_laws = self._parse_ai_response_enhanced(response.choices[0].message.content)
-
-                    self.logger.info(f"AI가 추가로 {len(ai_laws - laws)}개의 법령을 찾았습니다.")
-
-                    # 결과 병합
-                    return laws.union(ai_laws)
-
-                except Exception as chat_error:
-                    # gpt-5 실패 시 재시도
-                    try:
-                        response = client.chat.completions.create(
-                            model="gpt-5",
-                            messages=[
-                                {"role": "system", "content": "한국 법령 전문가. 법령체계도에서 법령명을 정확히 추출하고, 특수문자 변환과 사용자 의도를 파악합니다."},
-                                {"role": "user", "content": prompt}
-                            ],
-                            temperature=0.1,
-                            max_tokens=1500
-                        )
-
-                        ai_laws = self._parse_ai_response_enhanced(response.choices[0].message.content)
-                        self.logger.info(f"GPT-5로 {len(ai_laws - laws)}개의 법령을 추가로 찾았습니다.")
-                        return laws.union(ai_laws)
-
-                    except:
-                        self.logger.warning("AI 기능을 사용할 수 없습니다. 기본 추출만 수행합니다.")
-                        return laws
+                    return self._parse_ai_response_enhanced(response.choices[0].message.content)
+                
+                # 구간별 요청을 병렬로 전송 (네트워크 대기 시간 중첩)
+                ai_laws: Set[str] = set()
+                failed_chunks = 0
+                with ThreadPoolExecutor(max_workers=min(len(chunks), self.AI_MAX_CONCURRENT)) as executor:
+                    futures = [executor.submit(extract_chunk, chunk) for chunk in chunks]
+                    for future in futures:
+                        try:
+                            ai_laws.update(future.result())
+                        except Exception as chat_error:
+                            failed_chunks += 1
+                            self.logger.warning(f"AI 구간 처리 실패: {chat_error}")
+                
+                if failed_chunks == len(chunks):
+                    self.logger.warning("AI 기능을 사용할 수 없습니다. 기본 추출만 수행합니다.")
+                    return laws
+                
+                self.logger.info(f"AI가 추가로 {len(ai_laws - laws)}개의 법령을 찾았습니다.")
+                
+                # 결과 병합
+                return laws.union(ai_laws)
                 
             except Exception as api_error:
                 error_msg = str(api_error)
@@ -465,10 +655,119 @@ class EnhancedLawFileExtractor:
             self.logger.error(f"AI 처리 오류: {e}")
             return laws
     
-    def _create_enhanced_ai_prompt(self, sample: str, existing_laws: Set[str], full_text: str) -> str:
+    # ===== OpenAI Batch API (지연 처리 - 비용 절감, 분당 요청 한도 회피) =====
+    def build_ai_batch_requests(self, file_key: str, text: str,
+                                laws: Set[str]) -> List[Dict[str, Any]]:
+        """파일 하나의 AI 보강 요청을 Batch API JSONL 항목으로 변환"""
+        doc_structure = self._analyze_document_structure(text)
+        return [
+            {
+                "custom_id": f"{file_key}::{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._create_ai_request_body(chunk, laws, text, doc_structure)
+            }
+            for index, chunk in enumerate(self._split_text_for_ai(text))
+        ]
+    
+    def submit_ai_batch(self, batch_requests: List[Dict[str, Any]]) -> Optional[str]:
+        """Batch API에 요청 제출 - 배치 ID 반환 (실패 시 None)"""
+        client = self._create_openai_client()
+        if client is None or not batch_requests:
+            return None
+        
+        try:
+            # JSONL: 요청마다 한 줄(compact) JSON
+            jsonl = b'\n'.join(dumps_json(request, compact=True) for request in batch_requests)
+            input_file = client.files.create(
+                file=("law_extraction_batch.jsonl", jsonl),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            self.logger.info(f"AI 배치 제출: {batch.id} ({len(batch_requests)}건)")
+            return batch.id
+        except Exception as e:
+            self.logger.error(f"AI 배치 제출 오류: {e}")
+            return None
+    
+    def fetch_ai_batch_results(self, batch_id: str) -> Tuple[str, Optional[Dict[str, Set[str]]], int]:
+        """배치 상태 조회 - 완료 시 파일 키별 AI 추출 법령명과 실패한 요청 수 반환"""
+        client = self._create_openai_client()
+        if client is None:
+            return 'unavailable', None, 0
+        
+        try:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status != 'completed':
+                return batch.status, None, 0
+            
+            results: Dict[str, Set[str]] = defaultdict(set)
+            failed_requests = 0
+            for item in self._iter_batch_file_lines(client, batch.output_file_id):
+                file_key = item.get('custom_id', '').rsplit('::', 1)[0]
+                response = item.get('response') or {}
+                if item.get('error') or response.get('status_code') != 200:
+                    failed_requests += 1
+                    continue
+                content = response['body']['choices'][0]['message']['content']
+                results[file_key].update(self._parse_ai_response_enhanced(content))
+            
+            # 요청 단위 오류는 출력 파일이 아닌 별도 오류 파일에 기록됨
+            failed_requests += sum(1 for _ in self._iter_batch_file_lines(client, batch.error_file_id))
+            if failed_requests:
+                self.logger.warning(f"AI 배치 {batch_id}: 실패한 요청 {failed_requests}건")
+            
+            return batch.status, dict(results), failed_requests
+        except Exception as e:
+            self.logger.error(f"AI 배치 조회 오류: {e}")
+            return 'error', None, 0
+    
+    @staticmethod
+    def _iter_batch_file_lines(client, file_id: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """배치 출력/오류 파일(JSONL)의 각 줄을 파싱하여 반환 - 파일이 없으면 아무것도 반환하지 않음"""
+        if not file_id:
+            return
+        for line in client.files.content(file_id).text.splitlines():
+            if line.strip():
+                yield loads_json(line)
+    
+    def _split_text_for_ai(self, text: str) -> List[str]:
+        """AI 요청용 텍스트 구간 분할 - 구간 수는 AI_MAX_CHUNKS로 제한
+
+        tiktoken이 있으면 토큰 경계로 나누어 요청 크기를 정확히 제한하고,
+        없으면 글자 수 기준으로 나눕니다.
+        """
+        try:
+            import tiktoken  # 선택사항
+        except ImportError:
+            tiktoken = None
+        
+        if tiktoken is not None:
+            try:
+                encoding = tiktoken.encoding_for_model(self.AI_MODEL)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+            tokens = encoding.encode(text)
+            size = self.AI_CHUNK_TOKENS
+            chunks = [
+                encoding.decode(tokens[i:i + size])
+                for i in range(0, len(tokens), size)
+            ][:self.AI_MAX_CHUNKS]
+        else:
+            size = self.AI_CHUNK_SIZE
+            chunks = [text[i:i + size] for i in range(0, len(text), size)][:self.AI_MAX_CHUNKS]
+        return chunks or ['']
+
+    def _create_enhanced_ai_prompt(self, sample: str, existing_laws: Set[str], full_text: str,
+                                   doc_structure: Optional[str] = None) -> str:
         """강화된 AI 프롬프트 생성"""
         # 문서 구조 분석
-        doc_structure = self._analyze_document_structure(full_text)
+        if doc_structure is None:
+            doc_structure = self._analyze_document_structure(full_text)
         
         return f"""당신은 한국 법령 전문가입니다. 다음 법령체계도 문서에서 법령명을 정확히 추출하세요.
 
@@ -494,16 +793,13 @@ class EnhancedLawFileExtractor:
 - 특수문자가 포함된 법령명 (예: 심의·징계위원회)
 - 긴 법령명 (예: 근로기준법 및 공인노무사법에 따른 과태료의 가중처분에 관한 세부 지침)
 
-법령명만 한 줄에 하나씩 출력하세요:"""
+다음 JSON 형식으로만 출력하세요: {{"laws": ["법령명", ...]}}"""
     
     def _analyze_document_structure(self, text: str) -> str:
         """문서 구조 분석"""
         lines = text.split('\n')
         structure_info = []
         
-        # 카테고리 키워드
-        category_keywords = ['상하위법', '관련법령', '행정규칙', '법령']
-        
         current_category = None
         for line in lines:
             line = line.strip()
@@ -511,32 +807,37 @@ class EnhancedLawFileExtractor:
                 continue
             
             # 카테고리 감지
-            for keyword in category_keywords:
+            for keyword in self.patterns.CATEGORY_KEYWORDS:
                 if keyword in line and len(line) < 20:  # 짧은 라인에서만
                     current_category = keyword
                     structure_info.append(f"[{keyword} 섹션 시작]")
                     break
             
             # 날짜 패턴 감지
-            if re.search(r'\[시행\s*\d{4}\.\s*\d{1,2}\.\s*\d{1,2}\.\]', line):
+            if self.ENFORCEMENT_DATE_PATTERN.search(line):
                 structure_info.append(f"날짜가 포함된 법령 발견: {line[:50]}...")
         
         return '\n'.join(structure_info[:10])  # 최대 10개까지만
     
     def _parse_ai_response_enhanced(self, response: str) -> Set[str]:
-        """강화된 AI 응답 파싱"""
+        """강화된 AI 응답 파싱 - JSON 모드 응답 우선, 실패 시 줄 단위 파싱"""
         laws = set()
         
-        for line in response.strip().split('\n'):
+        try:
+            candidates = loads_json(response).get('laws', [])
+            candidates = [c for c in candidates if isinstance(c, str)]
+        except (ValueError, AttributeError):
+            candidates = response.strip().split('\n')
+        
+        for line in candidates:
             line = line.strip()
             
             # 번호, 기호 제거
-            line = re.sub(r'^[\d\-\.\*\•\·]+\s*', '', line)
+            line = self.LIST_MARKER_PATTERN.sub('', line)
             line = line.strip('"\'')
             
             # 접두어 제거
-            for prefix_pattern in self.patterns.PREFIX_PATTERNS:
-                line = re.sub(prefix_pattern, '', line)
+            line = self.patterns.COMBINED_PREFIX_PATTERN.sub('', line)
             
             # 특수문자 정규화
             line = self._normalize_law_name_for_ai(line)
@@ -575,17 +876,42 @@ class EnhancedLawFileExtractor:
         laws = set()
         
         try:
-            excel_file = pd.ExcelFile(file)
-            
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(file, sheet_name=sheet_name)
-                
-                # 모든 셀의 텍스트 수집
-                text = self._collect_excel_text(df)
+            # 통합 문서는 한 번만 열고 시트별로 파싱 (시트마다 파일 전체를 다시 읽지 않음)
+            with pd.ExcelFile(file) as excel_file:
+                for sheet_name in excel_file.sheet_names:
+                    df = excel_file.parse(sheet_name)
+                    
+                    # 모든 셀의 텍스트 수집
+                    text = self._collect_excel_text(df)
+                    
+                    # 법령명 추출
+                    sheet_laws = self._extract_laws_from_text(text)
+                    laws.update(sheet_laws)
                 
-                # 법령명 추출
-                sheet_laws = self._extract_laws_from_text(text)
-                laws.update(sheet_laws)
+        except Exception as e:
+            self.logger.error(f"Excel 추출 오류: {e}")
+            st.error(f"Excel 파일 처리 중 오류: {str(e)}")
+            
+        return sorted(list(laws))
+    
+    def _extract_from_xlsx(self, file) -> List[str]:
+        """xlsx 파일에서 법령명 추출 - openpyxl 읽기 전용 모드로 셀 값만 순회
+
+        DataFrame(열별 dtype 추론) 없이 행 단위로 스트리밍하며, 수집 순서와 머리글 처리는
+        pandas 경로(_extract_from_excel)와 같게 유지합니다.
+        """
+        import openpyxl  # xlsx 업로드 시에만 필요
+
+        laws = set()
+        
+        try:
+            workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+            try:
+                for worksheet in workbook.worksheets:
+                    text = self._collect_sheet_text(worksheet.iter_rows(values_only=True))
+                    laws.update(self._extract_laws_from_text(text))
+            finally:
+                workbook.close()
                 
         except Exception as e:
             self.logger.error(f"Excel 추출 오류: {e}")
@@ -593,12 +919,30 @@ class EnhancedLawFileExtractor:
             
         return sorted(list(laws))
     
+    def _collect_sheet_text(self, rows: Iterable[Tuple[Any, ...]]) -> str:
+        """시트 행(값 튜플)에서 문자열 셀 텍스트 수집
+
+        pandas와 같이 첫 행은 머리글로 보고 제외하며, 열 순서대로 결합합니다.
+        """
+        rows = iter(rows)
+        next(rows, None)
+        
+        columns: Dict[int, List[str]] = defaultdict(list)
+        for row in rows:
+            for index, value in enumerate(row):
+                if isinstance(value, str):
+                    columns[index].append(value)
+                    
+        return '\n'.join(value for index in sorted(columns) for value in columns[index])
+    
     def _collect_excel_text(self, df: pd.DataFrame) -> str:
         """DataFrame에서 텍스트 수집"""
         texts = []
         
-        for column in df.columns:
-            for value in df[column].dropna():
+        # 문자열은 object/string 열에만 있으므로 숫자·날짜 열은 건너뜀
+        text_df = df.select_dtypes(include=['object', 'string'])
+        for column in text_df.columns:
+            for value in text_df[column].dropna():
                 if isinstance(value, str):
                     texts.append(value)
                     
@@ -625,22 +969,160 @@ class EnhancedLawFileExtractor:
             return []
 
 
+# ===== 검색 결과 캐시 =====
+class _EmptyResultNotCached(Exception):
+    """빈 결과 - 검색/조회 메서드는 실패 시에도 빈 값을 반환하므로 캐시하지 않음
+
+    result에는 캐시하지 않은 반환값을 담아 호출자가 그대로 사용할 수 있게 함
+    """
+
+    def __init__(self, result: Any = None):
+        super().__init__()
+        self.result = result
+
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def _cached_law_search(_collector: 'LawCollectorAPI', oc_code: str,
+                       target: str, query: str) -> List[Any]:
+    """(기관코드, 검색 대상, 검색어) 단위로 검색 결과 캐시 - Streamlit 재실행 간 재사용
+
+    lsDelegated 대상은 법령 ID로 위임 법령명 목록을 조회합니다.
+    실패한 요청은 예외로 전달되어 캐시되지 않습니다. 응답 파싱 실패(HTML/오류 응답)도 빈 목록으로
+    돌아오므로 빈 결과는 _EmptyResultNotCached로 전달하여 캐시하지 않습니다.
+    """
+    if target == 'lsDelegated':
+        results = _collector._fetch_delegated_admin_rules(query)
+    elif target == 'admrul':
+        results = _collector._fetch_admin_rule(query)
+    else:
+        results = _collector._fetch_general_law(query)
+    if not results:
+        raise _EmptyResultNotCached(results)
+    return results
+
+
+# 호출 인자나 고정값으로 채워지는 상세 정보 필드 - 나머지가 모두 비어 있으면 파싱 실패로 봄
+DETAIL_ARGUMENT_FIELDS = frozenset({'law_id', 'law_msn', 'law_name', 'law_type', 'data_type', 'is_admin_rule'})
+
+
+def _is_empty_detail(detail: Dict[str, Any]) -> bool:
+    """상세 파서는 오류(HTML/오류 응답 등)를 삼키고 빈 상세 정보를 반환하므로 응답에서 채운 값이 있는지 확인"""
+    return not any(value for key, value in detail.items() if key not in DETAIL_ARGUMENT_FIELDS)
+
+
+# 상세 정보는 일련번호(MST/ID)별로 변하지 않으므로 오래 보존하되, 개정·오류 응답에 대비해 7일 후 만료
+@st.cache_data(ttl=7 * 24 * 3600, max_entries=512, show_spinner=False)
+def _cached_law_detail(_collector: 'LawCollectorAPI', oc_code: str, law_id: str,
+                       law_msn: str, law_name: str, is_admin_rule: bool) -> Dict[str, Any]:
+    """법령 상세 정보 캐시 - 일련번호(MST/ID)별 본문은 변하지 않으므로 재수집 시 재사용
+
+    실패한 요청은 예외로, 파싱에 실패한 빈 상세 정보는 _EmptyResultNotCached로 전달되어 캐시되지 않습니다.
+    """
+    if is_admin_rule:
+        detail = _collector._fetch_admin_rule_detail(law_id, law_msn, law_name)
+    else:
+        detail = _collector._fetch_general_law_detail(law_id, law_msn, law_name)
+    if _is_empty_detail(detail):
+        raise _EmptyResultNotCached(detail)
+    return detail
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_typed_search(_collector: 'LawCollectorAPI', oc_code: str,
+                         data_type: str, query: str) -> List[Dict[str, Any]]:
+    """자치법규/판례/결정례/해석례/재결례/조약 검색 결과 캐시"""
+    results = _collector._fetch_by_type(query, data_type)
+    if not results:
+        raise _EmptyResultNotCached()
+    return results
+
+
+@st.cache_data(ttl=7 * 24 * 3600, max_entries=512, show_spinner=False)
+def _cached_typed_detail(_collector: 'LawCollectorAPI', oc_code: str, data_type: str,
+                         item_id: str, item_msn: str, item_name: str) -> Dict[str, Any]:
+    """자치법규/판례/결정례/해석례/재결례/조약 상세 정보 캐시"""
+    detail = _collector._fetch_detail_by_type(data_type, item_id, item_msn, item_name)
+    if detail is None or _is_empty_detail(detail):
+        raise _EmptyResultNotCached(detail)
+    return detail
+
+
+@st.cache_resource(show_spinner=False)
+def get_collector(oc_code: str) -> 'LawCollectorAPI':
+    """기관코드별 수집기 공유 - 재실행마다 HTTP 세션(연결 풀)을 새로 만들지 않음
+
+    수집기는 세션 외에 요청별 상태를 갖지 않으므로 재실행·사용자 간에 공유해도 안전합니다.
+    """
+    return LawCollectorAPI(oc_code)
+
+
+@lru_cache(maxsize=None)
+def is_openai_available() -> bool:
+    """openai 라이브러리 설치 여부 - 모듈을 import하지 않고 확인"""
+    return importlib.util.find_spec('openai') is not None
+
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key: str):
+    """API 키별 OpenAI 클라이언트 공유 - 요청마다 클라이언트(연결 풀)를 새로 만들지 않음"""
+    from openai import OpenAI  # AI 기능 사용 시에만 필요
+
+    return OpenAI(
+        api_key=api_key,
+        max_retries=2,
+        timeout=30.0
+    )
+
+
 # ===== 법령 수집 API 클래스 =====
 class LawCollectorAPI:
     """개선된 법령 수집 API 클래스 - 정확한 검색 모드 추가"""
+
+    # 조문 텍스트 패턴 (제N조(의M) (제목) 내용)
+    ARTICLE_TEXT_PATTERN = re.compile(r'(제\d+조(?:의\d+)?)\s*(?:\((.*?)\))?\s*(.*?)(?=제\d+조|$)', re.DOTALL)
+    # 텍스트 블록을 법령명 후보 단위로 나누는 구분자
+    LAW_NAME_SEGMENT_SPLIT_PATTERN = re.compile(r'[\n\r,;·•▶\-]')
+    CONTROL_CHAR_PATTERN = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')  # XML에 허용되지 않는 제어 문자
+    # 관련 법령 후보명 정규화용 (공백 축약, 괄호 설명 제거, 시행 정보 제거)
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    PARENTHESIZED_PATTERN = re.compile(r'\(.*?\)')
+    ENFORCEMENT_TAG_PATTERN = re.compile(r'\[시행[^\]]*\]')
+    URL_PARENTHESIZED_PATTERN = re.compile(r'\([^)]*\)')  # PDF URL용 법령명에서 제거할 괄호
+    # 수집 결과에 항상 리스트로 채워 두는 필드 (이후에는 기본값 없이 law[key]로 접근)
+    DETAIL_LIST_FIELDS = ('articles', 'supplementary_provisions', 'attachments')
+    # 상세 XML에서 './/태그'로 전체 하위 트리를 탐색하던 태그 - 문서를 한 번 순회하며 함께 수집
+    DETAIL_INDEX_TAGS = ('조문내용', '부칙내용', '별표', '별지')
+    # 관련 법령명을 담는 섹션 태그
+    RELATED_LAW_TAGS = frozenset({'관련법령', '관계법령', '연관법령', '법령체계도', '모법령', '하위법령'})
+    RELATED_SECTIONS_KEY = 'related_sections'  # 인덱스에서 관련 법령 섹션 요소 목록의 키
+    LAW_NAME_ELEMENTS_KEY = 'law_name_elements'  # 인덱스에서 태그에 '법령명'이 들어간 요소 목록의 키
+
+    # 계층 확장 시 행정규칙 후보로 간주하는 접미사
+    ADMIN_CANDIDATE_SUFFIXES = [
+        '감독규정',
+        '감독업무시행세칙',
+        '업무시행세칙',
+        '감독규정 시행세칙',
+        '감독규정시행세칙',
+        '규정',
+        '고시',
+        '훈령',
+        '예규',
+        '지침'
+    ]
     
     def __init__(self, oc_code: str):
         self.oc_code = oc_code
         self.config = APIConfig()
         self.logger = logging.getLogger(self.__class__.__name__)
         self.session = self._create_session()
-        self._cache = {}  # 검색 결과 캐시
         self.patterns = LawPatterns()
-        
-    @lru_cache(maxsize=128)
-    def _get_cached_search_result(self, law_name: str) -> Optional[str]:
-        """캐시된 검색 결과 반환"""
-        return None  # 실제 구현시 캐시 로직 추가
+        # 일반 법령/행정규칙 단일 검색(API 호출 1회) 전용 스레드 풀 - 수집기와 함께 재사용
+        # 이 풀의 작업은 다른 작업을 기다리지 않으므로 다른 풀의 작업 안에서 제출해도 교착되지 않음
+        self._search_executor = ThreadPoolExecutor(
+            max_workers=self.config.MAX_CONCURRENT,
+            thread_name_prefix='law-search'
+        )
         
     def _create_session(self) -> requests.Session:
         """재사용 가능한 세션 생성"""
@@ -662,12 +1144,30 @@ class LawCollectorAPI:
             status_forcelist=[429, 500, 502, 503, 504]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # 병렬 요청 수만큼 keep-alive 연결을 유지하여 요청마다 새 연결을 맺지 않도록 함
+        # pool_block=True: 연결이 모두 사용 중이면 반납될 때까지 대기하므로,
+        # 호출 간 고정 지연(sleep) 없이 동시 요청 수를 MAX_CONCURRENT로 제한
+        adapter = HTTPAdapter(
+            pool_connections=self.config.MAX_CONCURRENT,
+            pool_maxsize=self.config.MAX_CONCURRENT,
+            pool_block=True,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
+        # 응답 헤더에 charset이 없으면 response.text가 본문 전체로 인코딩을 추정하므로 UTF-8로 지정
+        session.hooks['response'].append(self._default_to_utf8)
+        
         return session
     
+    @staticmethod
+    def _default_to_utf8(response: requests.Response, *args, **kwargs) -> requests.Response:
+        """charset이 명시되지 않은 응답의 인코딩을 UTF-8로 지정 (법제처 API 응답은 UTF-8)"""
+        if 'charset=' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        return response
+    
     def search_laws(self, law_names: List[str], 
                    progress_callback=None, 
                    use_variations: bool = True) -> List[Dict[str, Any]]:
@@ -684,6 +1184,10 @@ class LawCollectorAPI:
         no_result_laws = []
         seen_law_ids = set()  # 중복 제거를 위한 set
         
+        # 여러 파일에서 같은 법령명이 추출된 경우 한 번만 검색 (입력 순서 유지)
+        # 같은 검색어의 결과는 동일하고 법령 ID 기준 중복 제거로 버려지므로 결과는 같음
+        law_names = list(dict.fromkeys(law_names))
+        
         with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT) as executor:
             # 검색 작업 제출
             if use_variations:
@@ -700,6 +1204,7 @@ class LawCollectorAPI:
                 }
             
             # 결과 수집
+            progress_step = max(1, len(law_names) // self.config.MAX_PROGRESS_UPDATES)
             for idx, future in enumerate(as_completed(future_to_law)):
                 law_name = future_to_law[future]
                 
@@ -720,7 +1225,7 @@ class LawCollectorAPI:
                     else:
                         no_result_laws.append(law_name)
                     
-                    if progress_callback:
+                    if progress_callback and ((idx + 1) % progress_step == 0 or idx + 1 == len(law_names)):
                         progress_callback((idx + 1) / len(law_names))
                         
                 except Exception as e:
@@ -730,8 +1235,7 @@ class LawCollectorAPI:
         # 검색 실패한 법령 표시
         if no_result_laws:
             with st.expander(f"❌ 검색되지 않은 법령 ({len(no_result_laws)}개)"):
-                for law in no_result_laws:
-                    st.write(f"- {law}")
+                st.markdown("\n".join(f"- {law}" for law in no_result_laws))
                 
                 # 모드에 따른 다른 안내 메시지
                 if use_variations:
@@ -760,24 +1264,21 @@ class LawCollectorAPI:
             normalized_results = self._search_single_law_exact(normalized_name)
             all_results.extend(normalized_results)
         
-        # 중복 제거
+        # 중복 제거와 유사도 필터링을 한 번의 순회로 처리 (검색어 비교 키는 한 번만 계산)
         seen_ids = set()
-        unique_results = []
+        filtered_results = []
+        query_key = self._name_match_key(law_name)
         
         for result in all_results:
-            if result['law_id'] not in seen_ids:
-                seen_ids.add(result['law_id'])
-                unique_results.append(result)
-        
-        # 결과 필터링 - 유사도 기반
-        filtered_results = []
-        for result in unique_results:
-            similarity = self._calculate_similarity(law_name, result['law_name'])
-            if similarity >= 0.85:  # 85% 이상 유사도
+            if result['law_id'] in seen_ids:
+                continue
+            seen_ids.add(result['law_id'])
+
+            if self._is_similar_key(query_key, self._name_match_key(result['law_name'])):  # 85% 이상 유사도
                 filtered_results.append(result)
-                self.logger.debug(f"매칭 성공 (유사도 {similarity:.2f}): {result['law_name']}")
+                self.logger.debug(f"매칭 성공: {result['law_name']}")
             else:
-                self.logger.debug(f"매칭 실패 (유사도 {similarity:.2f}): {result['law_name']} != {law_name}")
+                self.logger.debug(f"매칭 실패: {result['law_name']} != {law_name}")
         
         return filtered_results
     
@@ -810,23 +1311,33 @@ class LawCollectorAPI:
         
         return normalized.strip()
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """두 문자열의 유사도 계산 (0~1)"""
-        # 간단한 문자 기반 유사도
-        str1 = self._normalize_law_name(str1.lower())
-        str2 = self._normalize_law_name(str2.lower())
-        
-        if str1 == str2:
+    def _name_match_key(self, name: str) -> str:
+        """유사도 비교용 법령명 키 (소문자 + 특수문자/공백 정규화)"""
+        return self._normalize_law_name(name.lower())
+    
+    def _key_similarity(self, key1: str, key2: str) -> float:
+        """정규화된 비교 키 사이의 유사도 (0~1)"""
+        if key1 == key2:
             return 1.0
         
         # 레벤슈타인 거리 기반 유사도
-        longer = max(len(str1), len(str2))
+        longer = max(len(key1), len(key2))
         if longer == 0:
             return 1.0
         
-        distance = self._levenshtein_distance(str1, str2)
+        distance = self._levenshtein_distance(key1, key2)
         return (longer - distance) / longer
     
+    def _is_similar_key(self, key1: str, key2: str, threshold: float = 0.85) -> bool:
+        """정규화된 비교 키의 유사도 판정 - 같으면 바로 통과, 길이 차이만으로 불가능하면 거리 계산 생략"""
+        if key1 == key2:
+            return True
+        # 편집 거리는 길이 차이 이상이므로 유사도 상한은 (짧은 길이 / 긴 길이)
+        shorter, longer = sorted((len(key1), len(key2)))
+        if longer and shorter / longer < threshold:
+            return False
+        return self._key_similarity(key1, key2) >= threshold
+
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """레벤슈타인 거리 계산"""
         if len(s1) < len(s2):
@@ -849,26 +1360,9 @@ class LawCollectorAPI:
     
     def _search_single_law_exact(self, law_name: str) -> List[Dict[str, Any]]:
         """단일 법령 정확한 검색 - 일반 법령과 행정규칙 모두"""
-        results = []
-        
-        # 1. 일반 법령 검색 (target=law)
-        general_laws = self._search_general_law(law_name)
-        results.extend(general_laws)
-        
-        # 2. 행정규칙 검색 (별도 API)
-        admin_rules = self._search_admin_rule(law_name)
-        results.extend(admin_rules)
-        
-        # 중복 제거
-        unique_results = self._remove_duplicates(results)
-        
-        # 검색 결과 로그
-        if unique_results:
-            general_count = sum(1 for r in unique_results if not r.get('is_admin_rule'))
-            admin_count = sum(1 for r in unique_results if r.get('is_admin_rule'))
-            self.logger.info(f"✅ 정확한 검색 완료: {law_name} - 일반법령 {general_count}개, 행정규칙 {admin_count}개")
-        
-        return unique_results
+        # 일반 법령 검색 (target=law) + 행정규칙 검색 (별도 API)
+        general_laws, admin_rules = self._search_law_and_admin_rule(law_name)
+        return self._merge_search_results(law_name, general_laws, admin_rules, "정확한 검색")
     
     def _search_with_variations(self, law_name: str) -> List[Dict[str, Any]]:
         """다양한 형식으로 법령 검색 - 개선된 버전"""
@@ -876,9 +1370,21 @@ class LawCollectorAPI:
         all_results = []
         seen_law_ids = set()
         
-        for idx, variation in enumerate(variations):
+        # 변형별 일반 법령/행정규칙 검색을 모두 검색 전용 풀에 제출하고 (호출마다 풀을 만들지 않음),
+        # 결과 반영(중복 제거)은 변형 순서대로 진행
+        pending = [
+            (variation,
+             self._search_executor.submit(self._search_general_law, variation),
+             self._search_executor.submit(self._search_admin_rule, variation))
+            for variation in variations
+        ]
+        results_by_variation = [
+            self._merge_search_results(variation, general_future.result(), admin_future.result())
+            for variation, general_future, admin_future in pending
+        ]
+        
+        for idx, (variation, results) in enumerate(zip(variations, results_by_variation)):
             self.logger.info(f"검색 변형 {idx+1}/{len(variations)}: {variation}")
-            results = self.search_single_law(variation)
             
             if results:
                 # 어떤 변형으로 찾았는지 기록
@@ -919,106 +1425,122 @@ class LawCollectorAPI:
     
     def search_single_law(self, law_name: str) -> List[Dict[str, Any]]:
         """단일 법령 검색 - 일반 법령과 행정규칙 모두"""
-        results = []
-        
-        # 1. 일반 법령 검색 (target=law)
-        general_laws = self._search_general_law(law_name)
-        results.extend(general_laws)
-        
-        # 2. 행정규칙 검색 (별도 API)
-        admin_rules = self._search_admin_rule(law_name)
-        results.extend(admin_rules)
-        
-        # 중복 제거
-        unique_results = self._remove_duplicates(results)
+        # 일반 법령 검색 (target=law) + 행정규칙 검색 (별도 API)
+        general_laws, admin_rules = self._search_law_and_admin_rule(law_name)
+        return self._merge_search_results(law_name, general_laws, admin_rules)
+
+    def _merge_search_results(self, law_name: str, general_laws: List[Dict[str, Any]],
+                              admin_rules: List[Dict[str, Any]],
+                              label: str = "검색") -> List[Dict[str, Any]]:
+        """일반 법령과 행정규칙 검색 결과를 합쳐 중복 제거"""
+        unique_results = self._remove_duplicates(general_laws + admin_rules)
         
         # 검색 결과 로그
         if unique_results:
             general_count = sum(1 for r in unique_results if not r.get('is_admin_rule'))
             admin_count = sum(1 for r in unique_results if r.get('is_admin_rule'))
-            self.logger.info(f"✅ 검색 완료: {law_name} - 일반법령 {general_count}개, 행정규칙 {admin_count}개")
+            self.logger.info(f"✅ {label} 완료: {law_name} - 일반법령 {general_count}개, 행정규칙 {admin_count}개")
         
         return unique_results
     
+    @staticmethod
+    def _search_cache_query(query: str) -> str:
+        """검색 캐시 키용 검색어 - 앞뒤·연속 공백만 다른 검색어는 같은 요청으로 처리"""
+        return ' '.join(query.split())
+
+    def _search_law_and_admin_rule(self, law_name: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """일반 법령과 행정규칙을 동시에 검색 - 행정규칙은 검색 전용 풀에서 실행하여 대기 시간을 겹침"""
+        admin_future = self._search_executor.submit(self._search_admin_rule, law_name)
+        general_laws = self._search_general_law(law_name)
+        return general_laws, admin_future.result()
+
     def _search_general_law(self, law_name: str) -> List[Dict[str, Any]]:
-        """일반 법령 검색"""
-        params = {
-            'OC': self.oc_code,
-            'target': 'law',
-            'type': 'XML',
-            'query': law_name,
-            'display': str(self.config.RESULTS_PER_PAGE),
-            'page': '1'
-        }
-        
+        """일반 법령 검색 (캐시 사용)"""
         try:
-            self.logger.debug(f"일반 법령 검색: {law_name}")
-            
-            response = self.session.get(
-                self.config.LAW_SEARCH_URL,
-                params=params,
-                timeout=self.config.TIMEOUT
-            )
-            
-            if response.status_code != 200:
-                self.logger.warning(f"일반 법령 검색 실패: {law_name} - 상태코드: {response.status_code}")
-                return []
-                
-            # XML 파싱
-            laws = self._parse_law_search_response(response.text, law_name)
-            
-            if laws:
-                self.logger.info(f"일반 법령 {len(laws)}개 발견: {law_name}")
-            
-            return laws
-            
+            laws = _cached_law_search(self, self.oc_code, 'law', self._search_cache_query(law_name))
+        except _EmptyResultNotCached as e:
+            laws = e.result
         except Exception as e:
-            self.logger.error(f"일반 법령 검색 오류: {e}")
+            self.logger.error(f"일반 법령 검색 오류: {law_name} - {e}")
             return []
-    
-    def _search_admin_rule(self, law_name: str) -> List[Dict[str, Any]]:
-        """행정규칙 검색 - 완전 재작성"""
+
+        if laws:
+            self.logger.info(f"일반 법령 {len(laws)}개 발견: {law_name}")
+
+        return laws
+
+    def _fetch_general_law(self, law_name: str) -> List[Dict[str, Any]]:
+        """일반 법령 검색 API 호출"""
         params = {
             'OC': self.oc_code,
-            'target': 'admrul',
+            'target': 'law',
             'type': 'XML',
             'query': law_name,
-            'display': '100',
+            'display': str(self.config.RESULTS_PER_PAGE),
             'page': '1'
         }
-        
-        try:
-            self.logger.info(f"행정규칙 검색 시작: {law_name}")
-            self.logger.debug(f"API URL: {self.config.ADMIN_RULE_SEARCH_URL}")
-            self.logger.debug(f"파라미터: {params}")
-            
-            # 행정규칙 전용 API 사용
-            response = self.session.get(
-                self.config.ADMIN_RULE_SEARCH_URL,  # admRulSc.do
-                params=params,
-                timeout=self.config.TIMEOUT
-            )
-            
-            self.logger.debug(f"응답 상태코드: {response.status_code}")
-            
-            if response.status_code == 200:
-                # 행정규칙 전용 파싱
-                rules = self._parse_admin_rule_search_response(response.text, law_name)
-                
-                if rules:
-                    self.logger.info(f"✅ 행정규칙 {len(rules)}개 발견: {law_name}")
-                else:
-                    self.logger.info(f"행정규칙 검색 결과 없음: {law_name}")
-                
-                return rules
-            else:
-                self.logger.warning(f"행정규칙 검색 실패: {law_name} - 상태코드: {response.status_code}")
-                return []
-                
+
+        self.logger.debug(f"일반 법령 검색: {law_name}")
+
+        response = self.session.get(
+            self.config.LAW_SEARCH_URL,
+            params=params,
+            timeout=self.config.TIMEOUT
+        )
+
+        if response.status_code != 200:
+            raise requests.HTTPError(f"상태코드: {response.status_code}")
+
+        # XML 파싱
+        return self._parse_law_search_response(response.text, law_name)
+
+    def _search_admin_rule(self, law_name: str) -> List[Dict[str, Any]]:
+        """행정규칙 검색 (캐시 사용)"""
+        try:
+            rules = _cached_law_search(self, self.oc_code, 'admrul', self._search_cache_query(law_name))
+        except _EmptyResultNotCached as e:
+            rules = e.result
         except Exception as e:
-            self.logger.error(f"행정규칙 검색 오류: {e}")
+            self.logger.error(f"행정규칙 검색 오류: {law_name} - {e}")
             return []
-    
+
+        if rules:
+            self.logger.info(f"✅ 행정규칙 {len(rules)}개 발견: {law_name}")
+        else:
+            self.logger.info(f"행정규칙 검색 결과 없음: {law_name}")
+
+        return rules
+
+    def _fetch_admin_rule(self, law_name: str) -> List[Dict[str, Any]]:
+        """행정규칙 검색 API 호출"""
+        params = {
+            'OC': self.oc_code,
+            'target': 'admrul',
+            'type': 'XML',
+            'query': law_name,
+            'display': '100',
+            'page': '1'
+        }
+
+        self.logger.info(f"행정규칙 검색 시작: {law_name}")
+        self.logger.debug(f"API URL: {self.config.ADMIN_RULE_SEARCH_URL}")
+        self.logger.debug(f"파라미터: {params}")
+
+        # 행정규칙 전용 API 사용
+        response = self.session.get(
+            self.config.ADMIN_RULE_SEARCH_URL,
+            params=params,
+            timeout=self.config.TIMEOUT
+        )
+
+        self.logger.debug(f"응답 상태코드: {response.status_code}")
+
+        if response.status_code != 200:
+            raise requests.HTTPError(f"상태코드: {response.status_code}")
+
+        # 행정규칙 전용 파싱
+        return self._parse_admin_rule_search_response(response.text, law_name)
+
     def _parse_law_search_response(self, content: str, 
                                   search_query: str) -> List[Dict[str, Any]]:
         """일반 법령 검색 응답 파싱"""
@@ -1029,7 +1551,7 @@ class LawCollectorAPI:
             content = self._preprocess_xml_content(content)
             
             # XML 파싱
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
             
             for law_elem in root.findall('.//law'):
                 law_info = {
@@ -1061,7 +1583,7 @@ class LawCollectorAPI:
             content = self._preprocess_xml_content(content)
             
             # XML 파싱
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
             
             self.logger.debug(f"행정규칙 XML 루트 태그: {root.tag}")
             self.logger.debug(f"하위 요소: {[child.tag for child in root][:5]}")
@@ -1100,7 +1622,7 @@ class LawCollectorAPI:
             content = '<?xml version="1.0" encoding="UTF-8"?>\n' + content
         
         # 특수문자 제거
-        content = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', content)
+        content = self.CONTROL_CHAR_PATTERN.sub('', content)
         
         return content
     
@@ -1132,6 +1654,7 @@ class LawCollectorAPI:
                 future_to_law[future] = law
 
             # 결과 수집
+            progress_step = max(1, len(laws) // self.config.MAX_PROGRESS_UPDATES)
             for idx, future in enumerate(as_completed(future_to_law)):
                 law = future_to_law[future]
 
@@ -1140,7 +1663,7 @@ class LawCollectorAPI:
                     if detail:
                         collected[law['law_id']] = detail
 
-                    if progress_callback:
+                    if progress_callback and ((idx + 1) % progress_step == 0 or idx + 1 == len(laws)):
                         progress_callback((idx + 1) / len(laws))
 
                 except Exception as e:
@@ -1149,72 +1672,114 @@ class LawCollectorAPI:
         if expand_hierarchy and collected:
             self._expand_related_laws(collected)
 
+        for detail in collected.values():
+            self._normalize_detail(detail)
+
         return collected
+
+    def _normalize_detail(self, detail: Dict[str, Any]) -> None:
+        """상세 정보의 목록 필드(조문/부칙/별표, 조문별 항)가 항상 리스트로 존재하도록 채움"""
+        for key in self.DETAIL_LIST_FIELDS:
+            detail.setdefault(key, [])
+        for article in detail['articles']:
+            article.setdefault('paragraphs', [])
     
     def _expand_related_laws(self, collected: Dict[str, Dict[str, Any]],
                              max_depth: int = 2) -> None:
-        """선택된 법령의 관계를 추적하여 시행령·시행규칙·행정규칙을 자동 확장"""
+        """선택된 법령의 관계를 추적하여 시행령·시행규칙·행정규칙을 자동 확장
+
+        깊이(단계)별로 후보를 모은 뒤 검색과 상세 조회를 각각 병렬로 수행하고,
+        결과 반영은 후보 순서대로 하여 순차 탐색과 같은 결과를 유지합니다.
+        """
         processed_ids = set(collected.keys())
         seen_candidates: Set[Tuple[str, str]] = set()
-        queue: deque[Tuple[str, int]] = deque((law_id, 0) for law_id in collected.keys())
+        level: List[str] = list(collected.keys())
+
+        for _ in range(max_depth):
+            # 1. 이번 단계의 후보 수집 (부모 법령 순서 유지)
+            tasks: List[Tuple[str, str, str]] = []
+            for current_id in level:
+                current_detail = collected.get(current_id)
+                if not current_detail:
+                    continue
 
-        while queue:
-            current_id, depth = queue.popleft()
-            current_detail = collected.get(current_id)
-            if not current_detail:
-                continue
+                candidates = self._generate_hierarchy_candidates(current_detail)
+                for related_name in current_detail.get('related_law_names', []) or []:
+                    candidates.append(("관련 법령", related_name))
 
-            if depth >= max_depth:
-                continue
+                for relation, candidate_name in candidates:
+                    normalized_candidate = self._normalize_law_name(candidate_name)
+                    if not normalized_candidate:
+                        continue
 
-            candidates = self._generate_hierarchy_candidates(current_detail)
-            for related_name in current_detail.get('related_law_names', []) or []:
-                candidates.append(("관련 법령", related_name))
+                    candidate_key = (relation, normalized_candidate)
+                    if candidate_key in seen_candidates:
+                        continue
+                    seen_candidates.add(candidate_key)
+                    tasks.append((current_id, relation, candidate_name))
 
-            for relation, candidate_name in candidates:
-                normalized_candidate = self._normalize_law_name(candidate_name)
-                if not normalized_candidate:
-                    continue
+            if not tasks:
+                break
 
-                candidate_key = (relation, normalized_candidate)
-                if candidate_key in seen_candidates:
+            def search_candidate(task: Tuple[str, str, str]) -> List[Dict[str, Any]]:
+                _, relation, candidate_name = task
+                if relation == '행정규칙':
+                    # 행정규칙은 접미사별로 검색하지 않고 기본 명칭으로 한 번에 검색
+                    return self._search_admin_candidates(candidate_name)
+                return self._search_exact_match(candidate_name)
+
+            with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT) as executor:
+                # 2. 후보 검색 병렬 수행
+                search_results_list = list(executor.map(search_candidate, tasks))
+
+                # 3. 새로 조회할 법령 결정 (후보 순서대로 중복 제거)
+                to_fetch: List[Tuple[Tuple[str, str, str], Dict[str, Any]]] = []
+                scheduled_ids: Set[str] = set()
+                for task, search_results in zip(tasks, search_results_list):
+                    for result in search_results:
+                        result_id = result.get('law_id')
+                        if not result_id or result_id in processed_ids or result_id in scheduled_ids:
+                            continue
+                        scheduled_ids.add(result_id)
+                        to_fetch.append((task, result))
+
+                # 4. 상세 정보 병렬 조회
+                details = list(executor.map(
+                    lambda item: self._get_law_detail(
+                        item[1].get('law_id'),
+                        item[1].get('law_msn'),
+                        item[1].get('law_name', item[0][2]),
+                        item[1].get('is_admin_rule', False)
+                    ),
+                    to_fetch
+                ))
+
+            # 5. 결과 반영 (순서 유지)
+            next_level: List[str] = []
+            for ((current_id, relation, candidate_name), result), detail in zip(to_fetch, details):
+                if not detail:
                     continue
-                seen_candidates.add(candidate_key)
-
-                search_results = self._search_exact_match(candidate_name)
-                for result in search_results:
-                    result_id = result.get('law_id')
-                    result_msn = result.get('law_msn')
 
-                    if not result_id or result_id in processed_ids:
-                        continue
+                result_id = result.get('law_id')
+                detail.setdefault('related_laws', [])
+                detail['parent_law_id'] = current_id
+                detail['relationship_from_parent'] = relation
+                detail['source_candidate'] = candidate_name
 
-                    detail = self._get_law_detail(
-                        result_id,
-                        result_msn,
-                        result.get('law_name', candidate_name),
-                        result.get('is_admin_rule', False)
-                    )
+                collected[result_id] = detail
+                processed_ids.add(result_id)
+                next_level.append(result_id)
 
-                    if not detail:
-                        continue
+                current_detail = collected[current_id]
+                current_detail.setdefault('related_laws', [])
+                current_detail['related_laws'].append({
+                    'law_id': result_id,
+                    'law_name': detail['law_name'],
+                    'relationship': relation,
+                    'is_admin_rule': detail.get('is_admin_rule', False)
+                })
 
-                    detail.setdefault('related_laws', [])
-                    detail['parent_law_id'] = current_id
-                    detail['relationship_from_parent'] = relation
-                    detail['source_candidate'] = candidate_name
-
-                    collected[result_id] = detail
-                    processed_ids.add(result_id)
-                    queue.append((result_id, depth + 1))
-
-                    current_detail.setdefault('related_laws', [])
-                    current_detail['related_laws'].append({
-                        'law_id': result_id,
-                        'law_name': detail['law_name'],
-                        'relationship': relation,
-                        'is_admin_rule': detail.get('is_admin_rule', False)
-                    })
+            level = next_level
 
     def _generate_hierarchy_candidates(self, law_detail: Dict[str, Any]) -> List[Tuple[str, str]]:
         """법령명을 바탕으로 시행령·시행규칙·행정규칙 후보 생성"""
@@ -1264,30 +1829,30 @@ class LawCollectorAPI:
         return list(unique_candidates.values())
 
     def _add_admin_candidates(self, bucket: List[Tuple[str, str]], base_name: str) -> None:
-        """행정규칙 가능성이 높은 후보를 버킷에 추가"""
-        admin_base = self._prepare_admin_base(base_name)
-        if not admin_base:
-            return
-
-        suffixes = [
-            '감독규정',
-            '감독업무시행세칙',
-            '업무시행세칙',
-            '감독규정 시행세칙',
-            '감독규정시행세칙',
-            '규정',
-            '고시',
-            '훈령',
-            '예규',
-            '지침'
+        """행정규칙 후보의 기본 명칭을 버킷에 추가 (접미사 매칭은 _search_admin_candidates에서 수행)"""
+        admin_base = self._normalize_law_name(self._prepare_admin_base(base_name))
+        if admin_base:
+            bucket.append(('행정규칙', admin_base))
+
+    def _search_admin_candidates(self, admin_base: str) -> List[Dict[str, Any]]:
+        """기본 명칭으로 한 번 검색한 뒤 접미사 후보와 유사한 결과만 선택"""
+        # 후보별 비교 키는 검색 결과마다 다시 만들지 않도록 미리 계산
+        candidate_keys = [
+            self._name_match_key(self._normalize_law_name(f"{admin_base}{suffix}"))
+            for suffix in self.ADMIN_CANDIDATE_SUFFIXES
         ]
 
-        for suffix in suffixes:
-            candidate = f"{admin_base}{suffix}".strip()
-            if candidate and len(candidate) >= 3:
-                normalized_candidate = self._normalize_law_name(candidate)
-                if normalized_candidate:
-                    bucket.append(('행정규칙', normalized_candidate))
+        matched = []
+        for result in self._search_single_law_exact(admin_base):
+            result_name = result.get('law_name', '')
+            # 후보는 모두 기본 명칭으로 시작하므로 포함하지 않는 결과는 유사도 계산 생략
+            if admin_base not in result_name.replace(' ', '') and admin_base not in result_name:
+                continue
+            result_key = self._name_match_key(result_name)
+            if any(self._is_similar_key(candidate_key, result_key) for candidate_key in candidate_keys):
+                matched.append(result)
+
+        return matched
 
     def _prepare_admin_base(self, base_name: str) -> str:
         """행정규칙용 기본 명칭 생성"""
@@ -1300,15 +1865,21 @@ class LawCollectorAPI:
 
     def _get_law_detail(self, law_id: str, law_msn: str,
                        law_name: str, is_admin_rule: bool) -> Optional[Dict[str, Any]]:
-        """법령 상세 정보 가져오기"""
-        if is_admin_rule:
-            return self._get_admin_rule_detail(law_id, law_msn, law_name)
-        else:
-            return self._get_general_law_detail(law_id, law_msn, law_name)
+        """법령 상세 정보 가져오기 (캐시 사용)"""
+        try:
+            return _cached_law_detail(self, self.oc_code, law_id, law_msn, law_name, is_admin_rule)
+        except _EmptyResultNotCached as e:
+            return e.result
+        except Exception as e:
+            if is_admin_rule:
+                self.logger.error(f"행정규칙 상세 조회 오류: {e}")
+            else:
+                self.logger.error(f"법령 상세 조회 오류: {e}")
+            return None
     
-    def _get_general_law_detail(self, law_id: str, law_msn: str, 
-                               law_name: str) -> Optional[Dict[str, Any]]:
-        """일반 법령 상세 정보"""
+    def _fetch_general_law_detail(self, law_id: str, law_msn: str, 
+                                  law_name: str) -> Dict[str, Any]:
+        """일반 법령 상세 정보 API 호출"""
         params = {
             'OC': self.oc_code,
             'target': 'law',
@@ -1316,26 +1887,21 @@ class LawCollectorAPI:
             'MST': law_msn
         }
         
-        try:
-            response = self.session.get(
-                self.config.LAW_DETAIL_URL,
-                params=params,
-                timeout=self.config.TIMEOUT
-            )
-            
-            if response.status_code != 200:
-                return None
-                
-            # 상세 정보 파싱
-            return self._parse_law_detail(response.text, law_id, law_msn, law_name)
+        response = self.session.get(
+            self.config.LAW_DETAIL_URL,
+            params=params,
+            timeout=self.config.TIMEOUT
+        )
+        
+        if response.status_code != 200:
+            raise requests.HTTPError(f"상태코드: {response.status_code}")
             
-        except Exception as e:
-            self.logger.error(f"법령 상세 조회 오류: {e}")
-            return None
+        # 상세 정보 파싱
+        return self._parse_law_detail(response.text, law_id, law_msn, law_name)
     
-    def _get_admin_rule_detail(self, law_id: str, law_msn: str,
-                               law_name: str) -> Optional[Dict[str, Any]]:
-        """행정규칙 상세 정보 - ID 파라미터 사용"""
+    def _fetch_admin_rule_detail(self, law_id: str, law_msn: str,
+                                 law_name: str) -> Dict[str, Any]:
+        """행정규칙 상세 정보 API 호출 - ID 파라미터 사용"""
         params = {
             'OC': self.oc_code,
             'target': 'admrul',
@@ -1343,26 +1909,21 @@ class LawCollectorAPI:
             'ID': law_msn  # MST가 아닌 ID 사용!
         }
 
-        try:
-            self.logger.debug(f"행정규칙 상세 조회: {law_name}")
-            self.logger.debug(f"파라미터: {params}")
-            
-            response = self.session.get(
-                self.config.ADMIN_RULE_DETAIL_URL,
-                params=params,
-                timeout=self.config.TIMEOUT
-            )
-            
-            if response.status_code != 200:
-                self.logger.warning(f"행정규칙 상세 조회 실패: {response.status_code}")
-                return None
-                
-            # 행정규칙 상세 파싱
-            return self._parse_admin_rule_detail(response.text, law_id, law_msn, law_name)
+        self.logger.debug(f"행정규칙 상세 조회: {law_name}")
+        self.logger.debug(f"파라미터: {params}")
+        
+        response = self.session.get(
+            self.config.ADMIN_RULE_DETAIL_URL,
+            params=params,
+            timeout=self.config.TIMEOUT
+        )
+        
+        if response.status_code != 200:
+            self.logger.warning(f"행정규칙 상세 조회 실패: {response.status_code}")
+            raise requests.HTTPError(f"상태코드: {response.status_code}")
             
-        except Exception as e:
-            self.logger.error(f"행정규칙 상세 조회 오류: {e}")
-            return None
+        # 행정규칙 상세 파싱
+        return self._parse_admin_rule_detail(response.text, law_id, law_msn, law_name)
     
     def _parse_law_detail(self, content: str, law_id: str, 
                          law_msn: str, law_name: str) -> Dict[str, Any]:
@@ -1390,7 +1951,7 @@ class LawCollectorAPI:
             content = self._preprocess_xml_content(content)
             
             # XML 파싱
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'), huge_tree=True)
             
             # 기본 정보
             basic_info = root.find('.//기본정보')
@@ -1400,20 +1961,23 @@ class LawCollectorAPI:
                 detail['promulgation_date'] = basic_info.findtext('공포일자', '')
                 detail['enforcement_date'] = basic_info.findtext('시행일자', '')
             
+            # 본문·관련 법령 요소를 한 번의 순회로 수집
+            index = self._index_detail_tree(root)
+            
             # 조문 추출
-            self._extract_articles(root, detail)
+            self._extract_articles(root, detail, index)
             
             # 부칙 추출
-            self._extract_supplementary_provisions(root, detail)
+            self._extract_supplementary_provisions(root, detail, index)
             
             # 별표 추출
-            self._extract_attachments(root, detail)
+            self._extract_attachments(root, detail, index)
 
             # PDF 첨부파일 추출 - 개선된 버전
             self._extract_pdf_attachments_enhanced(root, detail)
 
             # 관련 법령명 추출
-            detail['related_law_names'] = self._extract_related_law_names(root, law_name)
+            detail['related_law_names'] = self._extract_related_law_names(root, law_name, index)
 
             # 원문 저장 (조문이 없는 경우)
             if not detail['articles']:
@@ -1452,7 +2016,7 @@ class LawCollectorAPI:
             content = self._preprocess_xml_content(content)
             
             # XML 파싱
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'), huge_tree=True)
             
             # 행정규칙 기본 정보
             basic_info = root.find('.//행정규칙기본정보')
@@ -1470,14 +2034,17 @@ class LawCollectorAPI:
                 detail['promulgation_date'] = root.findtext('.//발령일자', '')
                 detail['enforcement_date'] = root.findtext('.//시행일자', '')
             
+            # 본문·관련 법령 요소를 한 번의 순회로 수집
+            index = self._index_detail_tree(root)
+            
             # 조문 추출 (행정규칙도 동일한 구조 사용 가능)
-            self._extract_articles(root, detail)
+            self._extract_articles(root, detail, index)
             
             # 부칙 추출
-            self._extract_supplementary_provisions(root, detail)
+            self._extract_supplementary_provisions(root, detail, index)
             
             # 별표 추출
-            self._extract_attachments(root, detail)
+            self._extract_attachments(root, detail, index)
 
             # PDF 첨부파일 추출 - 개선된 버전
             self._extract_pdf_attachments_enhanced(root, detail)
@@ -1487,7 +2054,7 @@ class LawCollectorAPI:
                 detail['raw_content'] = self._extract_full_text(root)
 
             # 관련 법령명 추출
-            detail['related_law_names'] = self._extract_related_law_names(root, law_name)
+            detail['related_law_names'] = self._extract_related_law_names(root, law_name, index)
 
             self.logger.info(f"행정규칙 상세 파싱 완료: {law_name} - 조문 {len(detail['articles'])}개, 별표/별첨 {len(detail['attachments'])}개")
                 
@@ -1496,40 +2063,104 @@ class LawCollectorAPI:
 
         return detail
 
-    def _extract_related_law_names(self, root: ET.Element, current_name: str) -> List[str]:
-        """상세 XML에서 관련 법령명을 수집"""
-        related: Set[str] = set()
-        candidate_tags = ['관련법령', '관계법령', '연관법령', '법령체계도', '모법령', '하위법령']
+    def _index_detail_tree(self, root: ET.Element) -> Dict[str, List[ET.Element]]:
+        """상세 XML을 한 번 순회하여 태그별 하위 요소 목록 생성
 
-        for tag in candidate_tags:
-            for elem in root.findall(f'.//{tag}'):
-                text = self._collect_text_content(elem)
-                related.update(self._extract_law_names_from_text(text))
+        DETAIL_INDEX_TAGS는 태그별 './/태그' 탐색을, 관련 법령 섹션과 태그에 '법령명'이 들어간
+        요소는 관련 법령명 추출의 별도 순회를 대체함 (모두 문서 순서)
+        """
+        index: Dict[str, List[ET.Element]] = {tag: [] for tag in self.DETAIL_INDEX_TAGS}
+        related_sections: List[ET.Element] = []
+        law_name_elements: List[ET.Element] = []
+
+        if LAW_NAME_ELEMENTS_XPATH is not None and lxml_etree.iselement(root):
+            # lxml: 필요한 태그만 C에서 골라 순회하고, '법령명' 요소는 컴파일된 XPath로 선택
+            for elem in root.iter(*self.DETAIL_INDEX_TAGS, *self.RELATED_LAW_TAGS):
+                if elem is root:
+                    continue
+                if elem.tag in index:
+                    index[elem.tag].append(elem)
+                else:
+                    related_sections.append(elem)
+            law_name_elements.extend(elem for elem in LAW_NAME_ELEMENTS_XPATH(root) if elem.text)
+            index[self.RELATED_SECTIONS_KEY] = related_sections
+            index[self.LAW_NAME_ELEMENTS_KEY] = law_name_elements
+            return index
 
         for elem in root.iter():
-            if '법령명' in elem.tag and elem.text:
-                name = self._normalize_candidate_name(elem.text)
-                if name:
-                    related.add(name)
+            tag = elem.tag
+            # lxml은 주석 노드도 순회하며 이때 tag는 문자열이 아님
+            if not isinstance(tag, str):
+                continue
+
+            if '법령명' in tag and elem.text:
+                law_name_elements.append(elem)
+
+            # 루트 자신은 하위 요소 탐색 대상이 아님
+            if elem is root:
+                continue
+            if tag in index:
+                index[tag].append(elem)
+            elif tag in self.RELATED_LAW_TAGS:
+                related_sections.append(elem)
+
+        index[self.RELATED_SECTIONS_KEY] = related_sections
+        index[self.LAW_NAME_ELEMENTS_KEY] = law_name_elements
+        return index
+
+    def _lxml_detail_index(self, root: ET.Element) -> Optional[Dict[str, List[ET.Element]]]:
+        """lxml 요소면 _index_detail_tree 결과, 아니면 None
+
+        lxml에서는 태그 필터링이 C에서 이루어져 한 번의 순회가 태그별 탐색보다 빠르지만,
+        xml.etree에서는 Python 수준 전체 순회가 되므로 관련 법령 추출이 없는 파서는 태그별 탐색을 유지
+        """
+        if LAW_NAME_ELEMENTS_XPATH is not None and lxml_etree.iselement(root):
+            return self._index_detail_tree(root)
+        return None
+
+    @staticmethod
+    def _indexed_descendants(root: ET.Element, tag: str,
+                             index: Optional[Dict[str, List[ET.Element]]]) -> List[ET.Element]:
+        """인덱스가 있으면 수집된 요소를, 없으면 './/태그' 탐색 결과를 반환"""
+        if index is not None:
+            return index[tag]
+        return root.findall(f'.//{tag}')
+
+    def _extract_related_law_names(self, root: ET.Element, current_name: str,
+                                   index: Optional[Dict[str, List[ET.Element]]] = None) -> List[str]:
+        """상세 XML에서 관련 법령명을 수집"""
+        if index is None:
+            index = self._index_detail_tree(root)
+
+        related: Set[str] = set()
+        for elem in index[self.RELATED_SECTIONS_KEY]:
+            text = self._collect_text_content(elem)
+            related.update(self._extract_law_names_from_text(text))
+
+        for elem in index[self.LAW_NAME_ELEMENTS_KEY]:
+            name = self._normalize_candidate_name(elem.text)
+            if name:
+                related.add(name)
 
         current_normalized = self._normalize_law_name(current_name)
         filtered = [name for name in related if name and name != current_normalized]
         filtered.sort()
         return filtered
 
-    def _collect_text_content(self, elem: ET.Element) -> str:
-        """요소 내부 텍스트를 공백으로 결합"""
-        parts = [text.strip() for text in elem.itertext() if text and text.strip()]
-        return ' '.join(parts)
+    @staticmethod
+    def _collect_text_content(elem: ET.Element) -> str:
+        """요소 내부 텍스트를 공백으로 결합 - 재귀 호출 대신 C 구현 itertext 사용"""
+        # 하위 요소가 없는 노드(CDATA 본문 등)는 순회 없이 텍스트를 그대로 사용
+        if len(elem) == 0:
+            return (elem.text or '').strip()
+        return ' '.join(text for text in map(str.strip, elem.itertext()) if text)
 
-    def _extract_law_names_from_text(self, text: str) -> Set[str]:
-        """텍스트 블록에서 법령명 후보 추출"""
-        candidates: Set[str] = set()
+    def _extract_law_names_from_text(self, text: str) -> Iterator[str]:
+        """텍스트 블록에서 법령명 후보를 차례로 반환 - 호출부의 집합에 바로 추가하도록 임시 집합을 만들지 않음"""
         if not text:
-            return candidates
+            return
 
-        segments = re.split(r'[\n\r,;·•▶\-]', text)
-        for segment in segments:
+        for segment in self.LAW_NAME_SEGMENT_SPLIT_PATTERN.split(text):
             segment = segment.strip()
             if not segment or len(segment) > 80:
                 continue
@@ -1538,24 +2169,23 @@ class LawCollectorAPI:
             if not normalized or len(normalized) < 3:
                 continue
 
-            if any(keyword in normalized for keyword in self.patterns.LAW_TYPES):
-                candidates.add(normalized)
-
-        return candidates
+            if self.patterns.LAW_TYPE_PATTERN.search(normalized):
+                yield normalized
 
     def _normalize_candidate_name(self, name: str) -> str:
         """관련 법령 후보명을 정규화"""
         if not name:
             return ''
 
-        cleaned = re.sub(r'\s+', ' ', name)
-        cleaned = re.sub(r'\(.*?\)', '', cleaned)
-        cleaned = re.sub(r'\[시행[^\]]*\]', '', cleaned)
+        cleaned = self.WHITESPACE_PATTERN.sub(' ', name)
+        cleaned = self.PARENTHESIZED_PATTERN.sub('', cleaned)
+        cleaned = self.ENFORCEMENT_TAG_PATTERN.sub('', cleaned)
         cleaned = cleaned.strip(' -,:;')
         return self._normalize_law_name(cleaned)
 
-    def _extract_articles(self, root: ET.Element, detail: Dict[str, Any]) -> None:
-        """조문 추출"""
+    def _extract_articles(self, root: ET.Element, detail: Dict[str, Any],
+                          index: Optional[Dict[str, List[ET.Element]]] = None) -> None:
+        """조문 추출 (index는 _index_detail_tree 결과)"""
         # 표준 조문 구조
         articles_section = root.find('.//조문')
         if articles_section is not None:
@@ -1566,7 +2196,7 @@ class LawCollectorAPI:
             return
         
         # 조문내용 직접 찾기
-        for article_content in root.findall('.//조문내용'):
+        for article_content in self._indexed_descendants(root, '조문내용', index):
             if article_content.text:
                 articles = self._parse_article_text(article_content.text)
                 detail['articles'].extend(articles)
@@ -1604,26 +2234,20 @@ class LawCollectorAPI:
     
     def _parse_article_text(self, text: str) -> List[Dict[str, Any]]:
         """조문 텍스트 파싱"""
-        articles = []
-        
-        # 조문 패턴
-        pattern = r'(제\d+조(?:의\d+)?)\s*(?:\((.*?)\))?\s*(.*?)(?=제\d+조|$)'
-        matches = re.findall(pattern, text, re.DOTALL)
-        
-        for match in matches:
-            article = {
-                'number': match[0],
-                'title': match[1],
-                'content': match[2].strip(),
+        return [
+            {
+                'number': match.group(1),
+                'title': match.group(2) or '',
+                'content': match.group(3).strip(),
                 'paragraphs': []
             }
-            articles.append(article)
-            
-        return articles
+            for match in self.ARTICLE_TEXT_PATTERN.finditer(text)
+        ]
     
     def _extract_supplementary_provisions(self, root: ET.Element, 
-                                        detail: Dict[str, Any]) -> None:
-        """부칙 추출"""
+                                        detail: Dict[str, Any],
+                                        index: Optional[Dict[str, List[ET.Element]]] = None) -> None:
+        """부칙 추출 (index는 _index_detail_tree 결과)"""
         for addendum in root.findall('.//부칙'):
             provision = {
                 'number': addendum.findtext('부칙번호', ''),
@@ -1635,7 +2259,7 @@ class LawCollectorAPI:
         
         # 부칙내용 직접 찾기
         if not detail['supplementary_provisions']:
-            for elem in root.findall('.//부칙내용'):
+            for elem in self._indexed_descendants(root, '부칙내용', index):
                 if elem.text:
                     detail['supplementary_provisions'].append({
                         'number': '',
@@ -1643,10 +2267,11 @@ class LawCollectorAPI:
                         'content': elem.text
                     })
     
-    def _extract_attachments(self, root: ET.Element, detail: Dict[str, Any]) -> None:
-        """별표/별첨 추출"""
+    def _extract_attachments(self, root: ET.Element, detail: Dict[str, Any],
+                             index: Optional[Dict[str, List[ET.Element]]] = None) -> None:
+        """별표/별첨 추출 (index는 _index_detail_tree 결과)"""
         # 별표
-        for table in root.findall('.//별표'):
+        for table in self._indexed_descendants(root, '별표', index):
             attachment = {
                 'type': '별표',
                 'number': table.findtext('별표번호', ''),
@@ -1657,7 +2282,7 @@ class LawCollectorAPI:
                 detail['attachments'].append(attachment)
         
         # 별지
-        for form in root.findall('.//별지'):
+        for form in self._indexed_descendants(root, '별지', index):
             attachment = {
                 'type': '별지',
                 'number': form.findtext('별지번호', ''),
@@ -1676,10 +2301,11 @@ class LawCollectorAPI:
         enforcement_date = detail.get('enforcement_date', '').replace('-', '').replace('.', '')
         
         # 법령명에서 괄호 제거 (URL에서 문제 일으킬 수 있음)
-        clean_law_name = re.sub(r'\([^)]*\)', '', law_name).strip()
+        clean_law_name = self.URL_PARENTHESIZED_PATTERN.sub('', law_name).strip()
         
         # 별표/별지가 있는 경우 PDF 정보 생성
         if detail['attachments']:
+            seen_file_names = {p['file_name'] for p in detail['attachment_pdfs']}
             for attachment in detail['attachments']:
                 att_type = attachment['type']
                 att_num = attachment['number']
@@ -1696,7 +2322,8 @@ class LawCollectorAPI:
                     }
                     
                     # 중복 체크
-                    if not any(p['file_name'] == pdf_info['file_name'] for p in detail['attachment_pdfs']):
+                    if pdf_info['file_name'] not in seen_file_names:
+                        seen_file_names.add(pdf_info['file_name'])
                         detail['attachment_pdfs'].append(pdf_info)
                         self.logger.info(f"별표/별지 발견: {pdf_info['file_name']} (텍스트 {len(pdf_info['content_text'])}자)")
         
@@ -1705,26 +2332,9 @@ class LawCollectorAPI:
             self.logger.info(f"별표/별지 {len(detail['attachment_pdfs'])}개 발견: {law_name}")
             self.logger.info("💡 PDF 다운로드 대신 텍스트 내용을 사용합니다.")
     
-    def _extract_full_text(self, root: ET.Element) -> str:
-        """전체 텍스트 추출"""
-        return self._get_all_text(root)
-    
-    def _get_all_text(self, elem: ET.Element) -> str:
-        """요소의 모든 텍스트 추출"""
-        texts = []
-        
-        if elem.text:
-            texts.append(elem.text.strip())
-            
-        for child in elem:
-            child_text = self._get_all_text(child)
-            if child_text:
-                texts.append(child_text)
-                
-            if child.tail:
-                texts.append(child.tail.strip())
-                
-        return ' '.join(texts)
+    # 전체 텍스트 / 요소의 모든 텍스트 추출 - 조문·부칙·별표마다 호출되므로 위임 호출 없이 같은 함수 사용
+    _extract_full_text = _collect_text_content
+    _get_all_text = _collect_text_content
     
     def _remove_duplicates(self, laws: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """중복 제거"""
@@ -1774,7 +2384,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//law') or root.findall('.//ordin'):
                 result = {
@@ -1841,21 +2451,24 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             # 기본 정보
             detail['local_gov'] = root.findtext('.//자치단체명', '')
             detail['promulgation_date'] = root.findtext('.//공포일자', '')
             detail['enforcement_date'] = root.findtext('.//시행일자', '')
 
+            # lxml이면 별표·별지·부칙내용·조문내용을 한 번의 순회로 수집
+            index = self._lxml_detail_index(root)
+
             # 조문 추출
-            self._extract_articles(root, detail)
+            self._extract_articles(root, detail, index)
 
             # 부칙 추출
-            self._extract_supplementary_provisions(root, detail)
+            self._extract_supplementary_provisions(root, detail, index)
 
             # 별표 추출
-            self._extract_attachments(root, detail)
+            self._extract_attachments(root, detail, index)
 
             # 원문 저장
             if not detail['articles']:
@@ -1901,7 +2514,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//prec'):
                 result = {
@@ -1971,7 +2584,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             detail['case_no'] = root.findtext('.//사건번호', '')
             detail['court'] = root.findtext('.//법원명', '')
@@ -2023,7 +2636,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//detc'):
                 result = {
@@ -2090,7 +2703,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             detail['case_no'] = root.findtext('.//사건번호', '')
             detail['decision_date'] = root.findtext('.//종국일자', '')
@@ -2141,7 +2754,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//expc'):
                 result = {
@@ -2209,7 +2822,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             detail['case_no'] = root.findtext('.//안건번호', '')
             detail['interpretation_date'] = root.findtext('.//해석일자', '')
@@ -2259,7 +2872,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//decc'):
                 result = {
@@ -2332,7 +2945,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             detail['case_no'] = root.findtext('.//사건번호', '')
             detail['disposal_date'] = root.findtext('.//처분일자', '')
@@ -2385,7 +2998,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//trty'):
                 result = {
@@ -2453,7 +3066,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             detail['treaty_no'] = root.findtext('.//조약번호', '')
             detail['signing_date'] = root.findtext('.//서명일자', '')
@@ -2482,7 +3095,6 @@ class LawCollectorAPI:
         }
 
         try:
-            time.sleep(self.config.DEFAULT_DELAY)
             response = self.session.get(
                 self.config.LAW_SEARCH_URL,
                 params=params,
@@ -2505,7 +3117,7 @@ class LawCollectorAPI:
 
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             for item in root.findall('.//law') or root.findall('.//lsStmd'):
                 law_data = {
@@ -2545,7 +3157,6 @@ class LawCollectorAPI:
             return None
 
         try:
-            time.sleep(self.config.DEFAULT_DELAY)
             response = self.session.get(
                 self.config.LAW_DETAIL_URL,
                 params=params,
@@ -2566,7 +3177,7 @@ class LawCollectorAPI:
         """법령 체계도 본문 응답 파싱 - 상하위법 구조 추출"""
         try:
             content = self._preprocess_xml_content(content)
-            root = ET.fromstring(content.encode('utf-8'))
+            root = parse_xml(content.encode('utf-8'))
 
             hierarchy = {
                 'law_id': '',
@@ -2666,15 +3277,18 @@ class LawCollectorAPI:
         """XML 전체에서 추가 법령 정보 추출"""
         # 본문에서 행정규칙 정보 추출 (다양한 구조 지원)
         admin_patterns = ['행정규칙', '하위행정규칙', '관련행정규칙', '위임행정규칙']
+        known_names = set(hierarchy['all_related_names'])
 
         for pattern in admin_patterns:
             section = root.find(f'.//{pattern}')
             if section is not None:
                 # 섹션 내의 모든 항목 검색
                 for child in section:
-                    if child.text and child.text.strip():
+                    # lxml은 주석도 자식으로 순회하므로 요소만 처리
+                    if isinstance(child.tag, str) and child.text and child.text.strip():
                         name = child.text.strip()
-                        if name not in hierarchy['all_related_names']:
+                        if name not in known_names:
+                            known_names.add(name)
                             tag_name = child.tag if child.tag else '행정규칙'
                             hierarchy['related_laws']['admin_rules'].append({
                                 'name': name,
@@ -2714,97 +3328,89 @@ class LawCollectorAPI:
 
         self.logger.info(f"행정규칙 키워드 검색: {keywords}")
 
-        for keyword in keywords:
-            if len(keyword) < 2:
-                continue
-
-            try:
-                params = {
-                    'OC': self.oc_code,
-                    'target': 'admrul',
-                    'type': 'XML',
-                    'query': keyword,
-                    'display': '100',
-                    'page': '1'
-                }
-
-                response = self.session.get(
-                    self.config.ADMIN_RULE_SEARCH_URL,
-                    params=params,
-                    timeout=self.config.TIMEOUT
-                )
+        keywords = [keyword for keyword in keywords if len(keyword) >= 2]
 
-                if response.status_code == 200:
-                    rules = self._parse_admin_rule_search_response(response.text, keyword)
+        # 키워드별 검색은 병렬로 수행하고, 중복 제거는 키워드 순서대로 진행
+        # (행정규칙 검색과 동일한 요청이므로 검색 결과 캐시를 공유)
+        with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT) as executor:
+            rules_by_keyword = list(executor.map(self._search_admin_rule, keywords))
 
-                    for rule in rules:
-                        rule_id = rule.get('law_id', '')
-                        if rule_id and rule_id not in seen_ids:
-                            # 키워드가 실제로 규칙명에 포함되어 있는지 확인
-                            rule_name = rule.get('law_name', '')
-                            if keyword in rule_name:
-                                seen_ids.add(rule_id)
-                                rule['hierarchy_source'] = f'관련 행정규칙 ({keyword})'
-                                results.append(rule)
-                                self.logger.info(f"관련 행정규칙 발견: {rule_name}")
-
-            except Exception as e:
-                self.logger.error(f"행정규칙 키워드 검색 오류 ({keyword}): {e}")
+        for keyword, rules in zip(keywords, rules_by_keyword):
+            for rule in rules:
+                rule_id = rule.get('law_id', '')
+                if rule_id and rule_id not in seen_ids:
+                    # 키워드가 실제로 규칙명에 포함되어 있는지 확인
+                    rule_name = rule.get('law_name', '')
+                    if keyword in rule_name:
+                        seen_ids.add(rule_id)
+                        rule['hierarchy_source'] = f'관련 행정규칙 ({keyword})'
+                        results.append(rule)
+                        self.logger.info(f"관련 행정규칙 발견: {rule_name}")
 
         return results
 
     def _get_delegated_admin_rules(self, law_id: str) -> List[str]:
-        """위임법령 조회 API를 통해 위임된 행정규칙 목록 조회"""
-        delegated_rules = []
-
+        """위임법령 조회 API를 통해 위임된 행정규칙 목록 조회 (캐시 사용)"""
         if not law_id:
-            return delegated_rules
+            return []
 
         try:
-            params = {
-                'OC': self.oc_code,
-                'target': 'lsDelegated',
-                'type': 'XML',
-                'ID': law_id
-            }
-
-            self.logger.info(f"위임법령 조회: ID={law_id}")
-
-            response = self.session.get(
-                'http://www.law.go.kr/DRF/lawService.do',
-                params=params,
-                timeout=self.config.TIMEOUT
-            )
-
-            if response.status_code == 200:
-                content = self._preprocess_xml_content(response.text)
-                root = ET.fromstring(content.encode('utf-8'))
-
-                # 위임행정규칙제목 추출
-                for elem in root.findall('.//위임행정규칙제목'):
-                    if elem.text and elem.text.strip():
-                        rule_name = elem.text.strip()
-                        if rule_name not in delegated_rules:
-                            delegated_rules.append(rule_name)
-                            self.logger.info(f"위임 행정규칙 발견: {rule_name}")
-
-                # 위임법령제목도 추출 (시행령, 시행규칙 등)
-                for elem in root.findall('.//위임법령제목'):
-                    if elem.text and elem.text.strip():
-                        rule_name = elem.text.strip()
-                        if rule_name not in delegated_rules:
-                            delegated_rules.append(rule_name)
-                            self.logger.info(f"위임 법령 발견: {rule_name}")
-
+            return _cached_law_search(self, self.oc_code, 'lsDelegated', law_id)
+        except _EmptyResultNotCached as e:
+            return e.result
         except ET.ParseError as e:
             self.logger.error(f"위임법령 XML 파싱 오류: {e}")
         except Exception as e:
             self.logger.error(f"위임법령 조회 오류: {e}")
 
+        return []
+
+    def _fetch_delegated_admin_rules(self, law_id: str) -> List[str]:
+        """위임법령 조회 API 호출"""
+        delegated_rules = []
+
+        params = {
+            'OC': self.oc_code,
+            'target': 'lsDelegated',
+            'type': 'XML',
+            'ID': law_id
+        }
+
+        self.logger.info(f"위임법령 조회: ID={law_id}")
+
+        response = self.session.get(
+            self.config.LAW_DETAIL_URL,
+            params=params,
+            timeout=self.config.TIMEOUT
+        )
+
+        if response.status_code != 200:
+            raise requests.HTTPError(f"상태코드: {response.status_code}")
+
+        content = self._preprocess_xml_content(response.text)
+        root = parse_xml(content.encode('utf-8'))
+        seen_names: Set[str] = set()
+
+        # 위임행정규칙제목 추출
+        for elem in root.findall('.//위임행정규칙제목'):
+            rule_name = (elem.text or '').strip()
+            if rule_name and rule_name not in seen_names:
+                seen_names.add(rule_name)
+                delegated_rules.append(rule_name)
+                self.logger.info(f"위임 행정규칙 발견: {rule_name}")
+
+        # 위임법령제목도 추출 (시행령, 시행규칙 등)
+        for elem in root.findall('.//위임법령제목'):
+            rule_name = (elem.text or '').strip()
+            if rule_name and rule_name not in seen_names:
+                seen_names.add(rule_name)
+                delegated_rules.append(rule_name)
+                self.logger.info(f"위임 법령 발견: {rule_name}")
+
         return delegated_rules
 
-    def _search_delegated_rules(self, law_id: str, seen_ids: set) -> List[Dict[str, Any]]:
-        """위임된 행정규칙을 검색하여 상세 정보 수집"""
+    def _search_delegated_rules(self, law_id: str) -> List[Dict[str, Any]]:
+        """위임된 행정규칙 검색 - 중복 제거는 호출 측에서 수행 (스레드에서 호출 가능)"""
         results = []
 
         # 위임된 법령/행정규칙 목록 조회
@@ -2824,15 +3430,31 @@ class LawCollectorAPI:
                 search_results = self._search_general_law(rule_name)
 
             for rule in search_results:
-                rule_id = rule.get('law_id', '')
-                if rule_id and rule_id not in seen_ids:
-                    seen_ids.add(rule_id)
+                if rule.get('law_id'):
                     rule['hierarchy_source'] = f'위임 법령 ({rule_name})'
                     results.append(rule)
-                    self.logger.info(f"위임 법령 추가: {rule.get('law_name', '')}")
 
         return results
 
+    def _search_hierarchy_member(self, law_name: str) -> List[Dict[str, Any]]:
+        """체계도 구성 법령 검색 - 정확 매칭, 일반 검색, 행정규칙 순으로 시도"""
+        try:
+            search_results = self._search_exact_match(law_name)
+
+            # 결과가 없으면 일반 검색 시도
+            if not search_results:
+                search_results = self._search_general_law(law_name)
+
+            # 행정규칙 검색도 시도
+            if not search_results:
+                search_results = self._search_admin_rule(law_name)
+
+            return search_results
+
+        except Exception as e:
+            self.logger.error(f"체계도 법령 검색 오류 ({law_name}): {e}")
+            return []
+
     def search_with_hierarchy(self, query: str, progress_callback=None) -> Dict[str, Any]:
         """법령 체계도 기반 통합 검색 - 상위법과 모든 하위법령을 함께 검색"""
         result = {
@@ -2895,27 +3517,20 @@ class LawCollectorAPI:
         collected_laws = []
         seen_ids = set()
 
-        for idx, law_name in enumerate(all_law_names):
-            if progress_callback:
-                progress = 0.3 + (0.6 * (idx + 1) / len(all_law_names))
-                progress_callback(progress, f"검색 중: {law_name}")
-
-            # 법령 검색 (정확한 매칭 사용)
-            search_results = self._search_exact_match(law_name)
-
-            # 결과가 없으면 일반 검색 시도
-            if not search_results:
-                search_results = self._search_general_law(law_name)
+        # 법령별 검색은 서로 독립적이므로 병렬 실행 (map은 입력 순서대로 결과 반환)
+        with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT) as executor:
+            search_iter = executor.map(self._search_hierarchy_member, all_law_names)
 
-            # 행정규칙 검색도 시도
-            if not search_results:
-                search_results = self._search_admin_rule(law_name)
+            for idx, (law_name, search_results) in enumerate(zip(all_law_names, search_iter)):
+                if progress_callback:
+                    progress = 0.3 + (0.6 * (idx + 1) / len(all_law_names))
+                    progress_callback(progress, f"검색 중: {law_name}")
 
-            for law in search_results:
-                if law['law_id'] not in seen_ids:
-                    seen_ids.add(law['law_id'])
-                    law['hierarchy_source'] = law_name
-                    collected_laws.append(law)
+                for law in search_results:
+                    if law['law_id'] not in seen_ids:
+                        seen_ids.add(law['law_id'])
+                        law['hierarchy_source'] = law_name
+                        collected_laws.append(law)
 
         # Step 5: 위임법령 조회 API를 통한 위임 행정규칙 검색
         # 법률, 시행령, 시행규칙 모두에 대해 위임법령 조회 수행
@@ -2924,32 +3539,48 @@ class LawCollectorAPI:
 
         # 수집된 모든 법령의 ID 목록 (법률, 시행령, 시행규칙)
         law_ids_to_check = []
+        checked_ids: Set[str] = set()
 
         # 기본 법령 ID 추가
         main_law_id = hierarchy_detail.get('law_id', '') or target_law.get('law_id', '')
         if main_law_id:
             law_ids_to_check.append(('기본 법령', main_law_id))
+            checked_ids.add(main_law_id)
 
         # 수집된 법령들의 ID 추가 (시행령, 시행규칙 포함)
         for law in collected_laws:
             law_id = law.get('law_id', '')
             law_name = law.get('law_name', '')
-            if law_id and law_id not in [lid for _, lid in law_ids_to_check]:
+            if law_id and law_id not in checked_ids:
                 # 행정규칙이 아닌 법령만 추가 (법률, 시행령, 시행규칙)
                 if not law.get('is_admin_rule', False):
                     law_ids_to_check.append((law_name, law_id))
+                    checked_ids.add(law_id)
 
         self.logger.info(f"위임법령 조회 대상: {len(law_ids_to_check)}개 법령")
 
-        # 각 법령에 대해 위임법령 조회
+        # 각 법령에 대해 위임법령 병렬 조회 (중복 제거는 법령 순서대로 메인 스레드에서)
         total_delegated = 0
-        for idx, (source_name, law_id) in enumerate(law_ids_to_check):
-            if progress_callback:
-                progress = 0.75 + (0.15 * (idx + 1) / max(len(law_ids_to_check), 1))
-                progress_callback(progress, f"위임법령 조회 중: {source_name[:20]}...")
+        with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT) as executor:
+            delegated_iter = executor.map(
+                self._search_delegated_rules, [law_id for _, law_id in law_ids_to_check]
+            )
+
+            for idx, ((source_name, _), candidates) in enumerate(zip(law_ids_to_check, delegated_iter)):
+                if progress_callback:
+                    progress = 0.75 + (0.15 * (idx + 1) / max(len(law_ids_to_check), 1))
+                    progress_callback(progress, f"위임법령 조회 중: {source_name[:20]}...")
+
+                delegated_rules = []
+                for rule in candidates:
+                    if rule['law_id'] not in seen_ids:
+                        seen_ids.add(rule['law_id'])
+                        delegated_rules.append(rule)
+                        self.logger.info(f"위임 법령 추가: {rule.get('law_name', '')}")
+
+                if not delegated_rules:
+                    continue
 
-            delegated_rules = self._search_delegated_rules(law_id, seen_ids)
-            if delegated_rules:
                 self.logger.info(f"{source_name}의 위임 법령/행정규칙 {len(delegated_rules)}개 추가")
                 # 출처 정보 업데이트
                 for rule in delegated_rules:
@@ -2998,10 +3629,11 @@ class LawCollectorAPI:
 
         best_match = results[0]
         best_similarity = 0
+        query_key = self._name_match_key(query)
 
         for result in results:
             law_name = result.get('law_name', '')
-            similarity = self._calculate_similarity(query, law_name)
+            similarity = self._key_similarity(query_key, self._name_match_key(law_name))
 
             if similarity > best_similarity:
                 best_similarity = similarity
@@ -3046,9 +3678,18 @@ class LawCollectorAPI:
 
     # ===== 통합 검색 메서드 =====
     def search_by_type(self, query: str, data_type: str) -> List[Dict[str, Any]]:
-        """데이터 유형별 검색"""
+        """데이터 유형별 검색 - (기관코드, 유형, 검색어) 단위로 캐시"""
+        if data_type == 'law':
+            return self.search_single_law(query)
+
+        try:
+            return _cached_typed_search(self, self.oc_code, data_type, query)
+        except _EmptyResultNotCached:
+            return []
+
+    def _fetch_by_type(self, query: str, data_type: str) -> List[Dict[str, Any]]:
+        """데이터 유형별 검색 API 호출 (캐시 미적용)"""
         search_methods = {
-            'law': lambda q: self.search_single_law(q),
             'ordinance': self.search_ordinance,
             'precedent': self.search_precedent,
             'constitutional': self.search_constitutional_decision,
@@ -3065,309 +3706,510 @@ class LawCollectorAPI:
             return []
 
     def get_detail_by_type(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """데이터 유형별 상세 정보 조회"""
+        """데이터 유형별 상세 정보 조회 - 유형과 ID 단위로 캐시"""
         data_type = item.get('data_type', 'law')
 
+        if data_type in ('ordinance', 'precedent', 'constitutional',
+                         'interpretation', 'admin_decision', 'treaty'):
+            try:
+                return _cached_typed_detail(
+                    self, self.oc_code, data_type,
+                    item['law_id'], item.get('law_msn', ''), item['law_name']
+                )
+            except _EmptyResultNotCached as e:
+                return e.result
+
+        # 기본: 법령/행정규칙
+        return self._get_law_detail(
+            item['law_id'],
+            item.get('law_msn', ''),
+            item['law_name'],
+            item.get('is_admin_rule', False)
+        )
+
+    def _fetch_detail_by_type(self, data_type: str, item_id: str, item_msn: str,
+                              item_name: str) -> Optional[Dict[str, Any]]:
+        """데이터 유형별 상세 조회 API 호출 (캐시 미적용)"""
         if data_type == 'ordinance':
-            return self.get_ordinance_detail(
-                item['law_id'], item.get('law_msn', ''), item['law_name']
-            )
+            return self.get_ordinance_detail(item_id, item_msn, item_name)
         elif data_type == 'precedent':
-            return self.get_precedent_detail(item['law_id'], item['law_name'])
+            return self.get_precedent_detail(item_id, item_name)
         elif data_type == 'constitutional':
-            return self.get_constitutional_detail(item['law_id'], item['law_name'])
+            return self.get_constitutional_detail(item_id, item_name)
         elif data_type == 'interpretation':
-            return self.get_interpretation_detail(item['law_id'], item['law_name'])
+            return self.get_interpretation_detail(item_id, item_name)
         elif data_type == 'admin_decision':
-            return self.get_admin_decision_detail(item['law_id'], item['law_name'])
+            return self.get_admin_decision_detail(item_id, item_name)
         elif data_type == 'treaty':
-            return self.get_treaty_detail(item['law_id'], item['law_name'])
-        else:
-            # 기본: 법령/행정규칙
-            return self._get_law_detail(
-                item['law_id'],
-                item.get('law_msn', ''),
-                item['law_name'],
-                item.get('is_admin_rule', False)
-            )
+            return self.get_treaty_detail(item_id, item_name)
+        return None
+
+
+# ===== 체계도 분류 =====
+HIERARCHY_CATEGORIES = ('법률', '시행령', '시행규칙', '행정규칙')
+HIERARCHY_ADMIN_KEYWORDS = ('고시', '훈령', '예규', '규정', '세칙')
+
+
+def get_hierarchy_category(law: Dict[str, Any]) -> str:
+    """법령을 체계도 분류(법률/시행령/시행규칙/행정규칙) 중 하나로 판정"""
+    law_name = law.get('law_name', '')
+    law_type = law.get('law_type', '')
+
+    if law.get('is_admin_rule') or any(k in law_name for k in HIERARCHY_ADMIN_KEYWORDS):
+        return '행정규칙'
+    if '시행규칙' in law_name or '시행규칙' in law_type:
+        return '시행규칙'
+    if '시행령' in law_name or '시행령' in law_type:
+        return '시행령'
+    return '법률'
+
+
+SUMMARY_LIST_FIELDS = itemgetter('articles', 'supplementary_provisions', 'attachments')  # 통계에 쓰는 목록 필드
+
+
+def summarize_laws(laws_dict: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    """수집 통계(조문/부칙/별표·별첨 수, 행정규칙 수, 별표·별첨 글자 수)를 한 번의 순회로 계산"""
+    articles = provisions = attachment_count = admin_rules = attachment_chars = 0
+
+    # 목록 필드는 수집 시 정규화되어 있으므로 기본값 없이 한 번에 꺼냄
+    for law in laws_dict.values():
+        law_articles, law_provisions, attachments = SUMMARY_LIST_FIELDS(law)
+        articles += len(law_articles)
+        provisions += len(law_provisions)
+        attachment_count += len(attachments)
+        for attachment in attachments:
+            attachment_chars += len(attachment.get('content', ''))
+        if law.get('is_admin_rule', False):
+            admin_rules += 1
+
+    return {
+        'articles': articles,
+        'provisions': provisions,
+        'attachments': attachment_count,
+        'admin_rules': admin_rules,
+        'attachment_chars': attachment_chars
+    }
 
 
 # ===== 법령 내보내기 클래스 =====
 class LawExporter:
     """법령 내보내기 클래스 - PDF 지원 수정"""
     
+    UNSAFE_FILENAME_PATTERN = re.compile(r'[\\/*?:"<>|]')  # 파일명에 쓸 수 없는 문자
+    TEXT_LAW_SEPARATOR = "=" * 80  # 텍스트 내보내기의 법령 간 구분선
+    TEXT_HEADER_RULE = "-" * 60  # 텍스트 내보내기의 법령 헤더 구분선
+    # 법령마다 기록하는 구분선 줄 (줄바꿈 포함 형태로 미리 만들어 둠)
+    TEXT_LAW_SEPARATOR_BLOCK = "\n" + TEXT_LAW_SEPARATOR + "\n"
+    TEXT_HEADER_RULE_LINE = TEXT_HEADER_RULE + "\n"
+
+    TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'  # 내보내기 문서에 기록하는 수집/생성 일시 형식
+
+    ZIP_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # 이보다 큰 ZIP/통합 파일은 디스크 임시 파일로 넘김
+    ZIP_COPY_CHUNK_SIZE = 1024 * 1024  # 임시 파일 → ZIP 엔트리 복사 단위
+    # 전체 Markdown에서 법령 하나의 본문과 구분선 ('\n'으로 결합한 결과와 동일)
+    MARKDOWN_LAW_ENTRY = b'\n%s\n\n---\n'
+    # 법령 Markdown 섹션 제목 (개별 파일은 ##, 통합 문서는 ### 수준으로 사용)
+    MARKDOWN_SECTION_META = "📋 기본 정보"
+    MARKDOWN_SECTION_ARTICLES = "📖 조문"
+    MARKDOWN_SECTION_SUPPLEMENTARY = "📌 부칙"
+    MARKDOWN_SECTION_ATTACHMENTS = "📎 별표/별첨"
+    MARKDOWN_SECTION_RAW = "📄 원문"
+    MARKDOWN_HEADER_META = f"## {MARKDOWN_SECTION_META}\n\n"
+    MARKDOWN_HEADER_ARTICLES = f"## {MARKDOWN_SECTION_ARTICLES}\n\n"
+    MARKDOWN_HEADER_SUPPLEMENTARY = f"## {MARKDOWN_SECTION_SUPPLEMENTARY}\n\n"
+    MARKDOWN_HEADER_ATTACHMENTS = f"## {MARKDOWN_SECTION_ATTACHMENTS}\n\n"
+    MERGE_HEADER_ARTICLES = f"### {MARKDOWN_SECTION_ARTICLES}\n"
+    MERGE_HEADER_SUPPLEMENTARY = "### 📋 부칙\n"
+    MERGE_HEADER_ATTACHMENTS = f"### {MARKDOWN_SECTION_ATTACHMENTS}\n"
+    MERGE_HEADER_RAW = f"### {MARKDOWN_SECTION_RAW}\n"
+    # 압축 옵션: (압축 방식, 압축 레벨) - 한글 텍스트는 레벨을 올려도 크기 차이가 작음
+    ZIP_COMPRESSION_OPTIONS = {
+        "빠름(미압축)": ('ZIP_STORED', None),
+        "균형": ('ZIP_DEFLATED', 1),
+        "최대": ('ZIP_DEFLATED', 6),
+    }
+    DEFAULT_ZIP_COMPRESSION = "균형"
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-    
+
+    def _timestamp(self) -> str:
+        """현재 시각 문자열 - 내보내기 호출당 한 번 계산해 각 문서에 같은 값으로 전달"""
+        return datetime.now().strftime(self.TIMESTAMP_FORMAT)
+
+    def _open_zip(self, fileobj, compression: Optional[str] = None) -> 'zipfile.ZipFile':
+        """내보내기용 ZIP 열기 - compression은 ZIP_COMPRESSION_OPTIONS의 키"""
+        import zipfile  # 다운로드 산출물 생성 시에만 필요
+
+        method, level = self.ZIP_COMPRESSION_OPTIONS.get(
+            compression or self.DEFAULT_ZIP_COMPRESSION,
+            self.ZIP_COMPRESSION_OPTIONS[self.DEFAULT_ZIP_COMPRESSION]
+        )
+        return zipfile.ZipFile(fileobj, 'w', getattr(zipfile, method), compresslevel=level)
+
+    def _write_collection_json(self, stream, header: Dict[str, Any],
+                               law_blobs: Iterable[Tuple[str, bytes]]) -> None:
+        """미리 직렬화한 법령별 JSON을 이어 붙여 전체 JSON 기록
+
+        법령 본문을 다시 직렬화하거나 들여쓰기를 맞추기 위해 복사하지 않고
+        주어진 bytes를 그대로 기록합니다 (하나의 큰 문자열도 만들지 않음).
+        ZIP에서는 개별 파일과 같은 한 줄(compact) JSON을 넘기므로 법령당 한 줄이 됩니다.
+        """
+        stream.write(b'{\n')
+        for key, value in header.items():
+            stream.write(b'  %s: %s,\n' % (dumps_json(key), dumps_json(value).replace(b'\n', b'\n  ')))
+
+        stream.write(b'  "laws": {')
+        has_laws = False
+        for law_id, blob in law_blobs:
+            stream.write(b'%s\n    %s: ' % (b',' if has_laws else b'', dumps_json(law_id)))
+            stream.write(blob)
+            has_laws = True
+        stream.write(b'\n  }\n}' if has_laws else b'}\n}')
+
+    def _copy_to_zip(self, zip_file: 'zipfile.ZipFile', arcname: str, source) -> None:
+        """임시 파일에 기록해 둔 내용을 ZIP 엔트리로 복사"""
+        import shutil
+
+        source.seek(0)
+        with zip_file.open(arcname, 'w') as entry:
+            shutil.copyfileobj(source, entry, self.ZIP_COPY_CHUNK_SIZE)
+
+    def _write_lines(self, stream, lines: Iterable[str]) -> None:
+        """줄 목록을 '\n'으로 결합한 결과를 하나의 문자열로 만들지 않고 UTF-8로 기록"""
+        write = stream.write
+        for idx, line in enumerate(lines):
+            if idx:
+                write(b'\n')
+            write(line.encode('utf-8'))
+
     def export_to_zip(self, laws_dict: Dict[str, Dict[str, Any]],
-                     include_pdfs: bool = False) -> bytes:
+                     include_pdfs: bool = False,
+                     compression: Optional[str] = None) -> bytes:
         """ZIP 파일로 내보내기 - OCR 텍스트 포함"""
-        zip_buffer = BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # 메타데이터
-            metadata = {
-                'collection_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'total_laws': len(laws_dict),
-                'admin_rule_count': sum(1 for law in laws_dict.values() if law.get('is_admin_rule', False)),
-                'attachment_count': sum(len(law.get('attachments', [])) for law in laws_dict.values()),
-                'laws': laws_dict
-            }
-            
-            # 전체 JSON
-            zip_file.writestr(
-                'all_laws.json',
-                json.dumps(metadata, ensure_ascii=False, indent=2)
-            )
-            
-            # 전체 Markdown
-            all_laws_md = self._create_all_laws_markdown(laws_dict)
-            zip_file.writestr('all_laws.md', all_laws_md)
-            
-            # 개별 파일
-            for law_id, law in laws_dict.items():
-                safe_name = self._sanitize_filename(law['law_name'])
-                
-                # JSON
-                zip_file.writestr(
-                    f'laws/{safe_name}.json',
-                    json.dumps(law, ensure_ascii=False, indent=2)
-                )
-                
-                # 텍스트
-                text_content = self._format_law_text(law)
-                zip_file.writestr(f'laws/{safe_name}.txt', text_content)
-                
-                # Markdown
-                md_content = self._format_law_markdown(law)
-                zip_file.writestr(f'laws/{safe_name}.md', md_content)
+        collection_date = self._timestamp()
+        with tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as spool:
+            with self._open_zip(spool, compression) as zip_file:
+                # 메타데이터
+                stats = summarize_laws(laws_dict)
+                metadata = {
+                    'collection_date': collection_date,
+                    'total_laws': len(laws_dict),
+                    'admin_rule_count': stats['admin_rules'],
+                    'attachment_count': stats['attachments']
+                }
+
+                # 법령별 JSON/Markdown은 한 번만 만들어 개별 파일은 바로 ZIP에 기록하고,
+                # 전체 JSON/Markdown은 임시 파일에 이어 쓴 뒤 마지막에 ZIP으로 복사
+                # (모든 법령의 내용을 동시에 메모리에 두지 않음)
+                with tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as all_json, \
+                        tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as all_md:
+                    self._write_lines(all_md, self._iter_all_laws_markdown_header(laws_dict, collection_date, stats))
+                    buffer = io.StringIO()  # 법령별 포맷 버퍼 (Markdown/텍스트에서 재사용)
+
+                    def write_law_files():
+                        """개별 파일을 기록하고 전체 JSON용 (법령 ID, JSON)을 차례로 반환"""
+                        for law_id, law in laws_dict.items():
+                            safe_name = self._sanitize_filename(law['law_name'])
+                            law_blob = dumps_json(law, compact=True)
+                            law_markdown = self._format_law_markdown(law, buffer)
+
+                            zip_file.writestr(f'laws/{safe_name}.json', law_blob)
+                            zip_file.writestr(f'laws/{safe_name}.txt', self._format_law_text(law, buffer))
+                            zip_file.writestr(f'laws/{safe_name}.md', law_markdown)
+
+                            all_md.write(self.MARKDOWN_LAW_ENTRY % law_markdown.encode('utf-8'))
+                            yield law_id, law_blob
+
+                    self._write_collection_json(all_json, metadata, write_law_files())
+                    self._copy_to_zip(zip_file, 'all_laws.json', all_json)
+                    self._copy_to_zip(zip_file, 'all_laws.md', all_md)
             
-            # README
-            readme = self._create_readme(laws_dict, include_pdfs)
-            zip_file.writestr('README.md', readme)
-        
-        zip_buffer.seek(0)
-        return zip_buffer.getvalue()
+                # README
+                readme = self._create_readme(laws_dict, include_pdfs, collection_date)
+                zip_file.writestr('README.md', readme)
+
+            spool.seek(0)
+            return spool.read()
 
     def export_markdown_by_file(self,
                                 grouped_laws: Dict[str, Dict[str, Dict[str, Any]]],
                                 file_metadata: Dict[str, Dict[str, Any]]) -> bytes:
         """파일별로 통합된 Markdown 번들을 ZIP으로 반환"""
-        zip_buffer = BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for file_key, laws in grouped_laws.items():
-                if not laws:
-                    continue
+        collection_date = self._timestamp()
+        with tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as spool:
+            with self._open_zip(spool) as zip_file:
+                for file_key, laws in grouped_laws.items():
+                    if not laws:
+                        continue
 
-                meta = file_metadata.get(file_key, {})
-                file_name = meta.get('file_name') or ("직접_검색" if file_key == 'direct_input' else file_key)
-                safe_name = self._sanitize_filename(file_name)
-                markdown_content = self._create_all_laws_markdown(laws)
-                zip_file.writestr(f'{safe_name}.md', markdown_content)
+                    meta = file_metadata.get(file_key, {})
+                    file_name = meta.get('file_name') or ("직접_검색" if file_key == 'direct_input' else file_key)
+                    safe_name = self._sanitize_filename(file_name)
+                    with zip_file.open(f'{safe_name}.md', 'w') as entry:
+                        self._write_lines(entry, self._iter_all_laws_markdown(laws, collection_date))
 
-        zip_buffer.seek(0)
-        return zip_buffer.getvalue()
+            spool.seek(0)
+            return spool.read()
     
     def export_single_file(self, laws_dict: Dict[str, Dict[str, Any]], 
-                          format: str = 'json') -> str:
-        """단일 파일로 내보내기 - 모든 형식 지원"""
-        exporters = {
-            'json': self._export_as_json,
-            'markdown': self._export_as_markdown,
-            'text': self._export_as_text
+                          format: str = 'json') -> bytes:
+        """단일 파일로 내보내기 - 모든 형식 지원 (다운로드용 UTF-8 bytes 반환)
+
+        법령 단위로 임시 파일에 바로 기록하여 전체 문서를 하나의 문자열로 만들지 않습니다.
+        """
+        writers = {
+            'markdown': self._write_markdown_export,
+            'text': self._write_text_export
         }
-        
-        exporter = exporters.get(format.lower(), self._export_as_json)
-        return exporter(laws_dict)
+        writer = writers.get(format.lower(), self._write_json_export)
+        return self._write_to_bytes(writer, laws_dict)
+
+    def export_collection_json(self, laws_dict: Dict[str, Dict[str, Any]],
+                               header: Dict[str, Any]) -> bytes:
+        """header 항목 뒤에 "laws"를 붙인 JSON 내보내기 (다운로드용 UTF-8 bytes 반환)
+
+        json.dumps(dict(header, laws=laws_dict), indent=2)와 같은 결과를 법령별로 직렬화하여 만듭니다.
+        """
+        return self._write_to_bytes(self._write_json_export, laws_dict, header)
+
+    def _write_to_bytes(self, writer: Callable[..., None], *args: Any) -> bytes:
+        """writer(stream, *args)로 임시 파일에 기록한 결과를 bytes로 반환"""
+        with tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as spool:
+            writer(spool, *args)
+            spool.seek(0)
+            return spool.read()
     
-    def _sanitize_filename(self, filename: str) -> str:
-        """파일명 안전하게 변환"""
-        return re.sub(r'[\\/*?:"<>|]', '_', filename)
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _sanitize_filename(filename: str) -> str:
+        """파일명 안전하게 변환
+
+        같은 법령명이 목차 앵커·파일명 등에서 여러 번 변환되므로 결과를 캐시함.
+        (str.translate는 한글 문자열에서 정규식보다 느려 정규식을 유지)
+        """
+        return LawExporter.UNSAFE_FILENAME_PATTERN.sub('_', filename)
     
-    def _export_as_json(self, laws_dict: Dict[str, Dict[str, Any]]) -> str:
-        """JSON 형식으로 내보내기"""
-        data = {
-            'collection_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'total_laws': len(laws_dict),
-            'laws': laws_dict
-        }
-        return json.dumps(data, ensure_ascii=False, indent=2)
+    def _write_json_export(self, stream, laws_dict: Dict[str, Dict[str, Any]],
+                           header: Optional[Dict[str, Any]] = None) -> None:
+        """JSON 형식으로 내보내기 - 법령별로 직렬화하여 기록"""
+        if header is None:
+            header = {
+                'collection_date': self._timestamp(),
+                'total_laws': len(laws_dict)
+            }
+        # 전체를 한 번에 2칸 들여쓰기로 직렬화한 결과와 같도록 법령 본문을 두 단계 더 들여씀
+        law_blobs = (
+            (law_id, dumps_json(law).replace(b'\n', b'\n    '))
+            for law_id, law in laws_dict.items()
+        )
+        self._write_collection_json(stream, header, law_blobs)
     
-    def _export_as_markdown(self, laws_dict: Dict[str, Dict[str, Any]]) -> str:
+    def _write_markdown_export(self, stream, laws_dict: Dict[str, Dict[str, Any]]) -> None:
         """Markdown 형식으로 내보내기"""
-        return self._create_all_laws_markdown(laws_dict)
+        self._write_lines(stream, self._iter_all_laws_markdown(laws_dict))
     
-    def _export_as_text(self, laws_dict: Dict[str, Dict[str, Any]]) -> str:
-        """텍스트 형식으로 내보내기"""
-        lines = []
-        lines.append("법령 수집 결과")
-        lines.append(f"수집 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"총 법령 수: {len(laws_dict)}개")
-        lines.append("=" * 80 + "\n")
-        
-        for law_id, law in laws_dict.items():
-            lines.append(self._format_law_text(law))
-            lines.append("\n" + "=" * 80 + "\n")
-            
-        return '\n'.join(lines)
+    def _write_text_export(self, stream, laws_dict: Dict[str, Dict[str, Any]]) -> None:
+        """텍스트 형식으로 내보내기 - 법령마다 버퍼에 기록한 뒤 한 번에 인코딩"""
+        stream.write((
+            "법령 수집 결과\n"
+            f"수집 일시: {self._timestamp()}\n"
+            f"총 법령 수: {len(laws_dict)}개\n"
+            f"{self.TEXT_LAW_SEPARATOR}\n"
+        ).encode('utf-8'))
+        
+        buffer = io.StringIO()
+        for law in laws_dict.values():
+            self._reset_buffer(buffer)
+            buffer.write("\n")
+            self._write_law_text(buffer.write, law)
+            buffer.write(self.TEXT_LAW_SEPARATOR_BLOCK)
+            stream.write(buffer.getvalue().encode('utf-8'))
     
-    def _format_law_text(self, law: Dict[str, Any]) -> str:
-        """법령을 텍스트로 포맷"""
-        lines = []
-        
+    def _format_law_text(self, law: Dict[str, Any],
+                         buffer: Optional[io.StringIO] = None) -> str:
+        """법령을 텍스트로 포맷 - buffer가 주어지면 비우고 재사용"""
+        buffer = self._reset_buffer(buffer)
+        self._write_law_text(buffer.write, law)
+        return buffer.getvalue()[:-1]
+
+    @staticmethod
+    def _reset_buffer(buffer: Optional[io.StringIO]) -> io.StringIO:
+        """법령별 포맷용 버퍼 준비 - 여러 법령을 연속으로 포맷할 때 하나의 버퍼를 재사용"""
+        if buffer is None:
+            return io.StringIO()
+        buffer.seek(0)
+        buffer.truncate()
+        return buffer
+
+    def _write_law_text(self, write: Callable[[str], Any], law: Dict[str, Any]) -> None:
+        """법령 텍스트를 줄 단위로 기록 (모든 줄은 줄바꿈으로 끝남)"""
         # 헤더
-        lines.append(f"법령명: {law['law_name']}")
-        lines.append(f"법종구분: {law.get('law_type', '')}")
+        write(f"법령명: {law['law_name']}\n")
+        write(f"법종구분: {law.get('law_type', '')}\n")
         if law.get('department'):
-            lines.append(f"소관부처: {law.get('department', '')}")
-        lines.append(f"공포일자: {law.get('promulgation_date', '')}")
-        lines.append(f"시행일자: {law.get('enforcement_date', '')}")
+            write(f"소관부처: {law.get('department', '')}\n")
+        write(f"공포일자: {law.get('promulgation_date', '')}\n")
+        write(f"시행일자: {law.get('enforcement_date', '')}\n")
         
         # 별표/별첨 개수
         if law.get('attachments'):
-            lines.append(f"별표/별첨: {len(law['attachments'])}개")
+            write(f"별표/별첨: {len(law['attachments'])}개\n")
         
-        lines.append("-" * 60)
+        write(self.TEXT_HEADER_RULE_LINE)
         
         # 조문
         if law.get('articles'):
-            lines.append("\n【조 문】\n")
+            write("\n【조 문】\n\n")
             for article in law['articles']:
-                lines.append(f"{article['number']} {article.get('title', '')}")
-                lines.append(article['content'])
+                write(f"{article['number']} {article.get('title', '')}\n{article['content']}\n")
                 
-                if article.get('paragraphs'):
-                    for para in article['paragraphs']:
-                        lines.append(f"  {para['number']} {para['content']}")
-                lines.append("")
+                for para in article['paragraphs']:
+                    write(f"  {para['number']} {para['content']}\n")
+                write("\n")
         
         # 부칙
         if law.get('supplementary_provisions'):
-            lines.append("\n【부 칙】\n")
+            write("\n【부 칙】\n\n")
             for provision in law['supplementary_provisions']:
                 if provision.get('promulgation_date'):
-                    lines.append(f"부칙 <{provision['promulgation_date']}>")
-                lines.append(provision['content'])
-                lines.append("")
+                    write(f"부칙 <{provision['promulgation_date']}>\n")
+                write(f"{provision['content']}\n\n")
         
         # 별표
         if law.get('attachments'):
-            lines.append("\n【별표/별첨】\n")
+            write("\n【별표/별첨】\n\n")
             for attachment in law['attachments']:
-                lines.append(f"[{attachment['type']}] {attachment.get('title', '')}")
-                lines.append(attachment['content'])
-                lines.append("")
+                write(f"[{attachment['type']}] {attachment.get('title', '')}\n{attachment['content']}\n\n")
         
         # 원문 (조문이 없는 경우)
         if not law.get('articles') and law.get('raw_content'):
-            lines.append("\n【원 문】\n")
-            lines.append(law['raw_content'])
-        
-        return '\n'.join(lines)
+            write("\n【원 문】\n\n")
+            write(f"{law['raw_content']}\n")
     
-    def _format_law_markdown(self, law: Dict[str, Any]) -> str:
-        """법령을 Markdown으로 포맷"""
-        lines = []
-        
+    def _format_law_markdown(self, law: Dict[str, Any],
+                             buffer: Optional[io.StringIO] = None) -> str:
+        """법령을 Markdown으로 포맷 - buffer가 주어지면 비우고 재사용"""
+        buffer = self._reset_buffer(buffer)
+        self._write_law_markdown(buffer.write, law)
+        return buffer.getvalue()[:-1]
+
+    def _write_law_markdown(self, write: Callable[[str], Any], law: Dict[str, Any]) -> None:
+        """법령 Markdown을 줄 단위로 기록 (모든 줄은 줄바꿈으로 끝남)"""
         # 제목
-        lines.append(f"# {law['law_name']}\n")
+        write(f"# {law['law_name']}\n\n")
         
         # 기본 정보
-        lines.append("## 📋 기본 정보\n")
-        lines.append(f"- **법종구분**: {law.get('law_type', '')}")
+        write(self.MARKDOWN_HEADER_META)
+        write(f"- **법종구분**: {law.get('law_type', '')}\n")
         if law.get('department'):
-            lines.append(f"- **소관부처**: {law.get('department', '')}")
-        lines.append(f"- **공포일자**: {law.get('promulgation_date', '')}")
-        lines.append(f"- **시행일자**: {law.get('enforcement_date', '')}")
+            write(f"- **소관부처**: {law.get('department', '')}\n")
+        write(f"- **공포일자**: {law.get('promulgation_date', '')}\n")
+        write(f"- **시행일자**: {law.get('enforcement_date', '')}\n")
         
         # 별표/별첨 정보
         if law.get('attachments'):
-            lines.append(f"- **별표/별첨**: {len(law['attachments'])}개")
+            write(f"- **별표/별첨**: {len(law['attachments'])}개\n")
         
-        lines.append("")
+        write("\n")
         
         # 조문
         if law.get('articles'):
-            lines.append("## 📖 조문\n")
+            write(self.MARKDOWN_HEADER_ARTICLES)
+            # 조문당 한 번만 기록 (제목·본문·항을 하나의 문자열로 구성)
             for article in law['articles']:
-                lines.append(f"### {article['number']}")
+                heading = f"### {article['number']}\n"
                 if article.get('title'):
-                    lines.append(f"**{article['title']}**\n")
-                lines.append(article['content'])
-                
-                if article.get('paragraphs'):
-                    for para in article['paragraphs']:
-                        lines.append(f"\n> {para['number']} {para['content']}")
-                lines.append("")
+                    heading += f"**{article['title']}**\n\n"
+                paragraphs = ''.join(
+                    f"\n> {para['number']} {para['content']}\n" for para in article['paragraphs']
+                )
+                write(f"{heading}{article['content']}\n{paragraphs}\n")
         
         # 부칙
         if law.get('supplementary_provisions'):
-            lines.append("## 📌 부칙\n")
+            write(self.MARKDOWN_HEADER_SUPPLEMENTARY)
             for provision in law['supplementary_provisions']:
                 if provision.get('promulgation_date'):
-                    lines.append(f"### 부칙 <{provision['promulgation_date']}>")
-                lines.append(provision['content'])
-                lines.append("")
+                    write(f"### 부칙 <{provision['promulgation_date']}>\n")
+                write(f"{provision['content']}\n\n")
         
         # 별표
         if law.get('attachments'):
-            lines.append("## 📎 별표/별첨\n")
+            write(self.MARKDOWN_HEADER_ATTACHMENTS)
             for attachment in law['attachments']:
-                lines.append(f"### [{attachment['type']}] {attachment.get('title', '')}")
-                lines.append(attachment['content'])
-                lines.append("")
-        
-        return '\n'.join(lines)
+                write(f"### [{attachment['type']}] {attachment.get('title', '')}\n")
+                write(f"{attachment['content']}\n\n")
     
-    def _create_all_laws_markdown(self, laws_dict: Dict[str, Dict[str, Any]]) -> str:
-        """전체 법령 Markdown 생성"""
-        lines = []
+    def _iter_all_laws_markdown(self, laws_dict: Dict[str, Dict[str, Any]],
+                                generated_at: Optional[str] = None) -> Iterator[str]:
+        """전체 법령 Markdown을 줄 단위로 생성 ('\n'으로 결합하면 전체 문서)
+
+        generated_at이 있으면 그 일시를 재사용
+        """
+        yield from self._iter_all_laws_markdown_header(laws_dict, generated_at)
         
+        # 각 법령
+        buffer = io.StringIO()
+        for law in laws_dict.values():
+            yield self._format_law_markdown(law, buffer)
+            yield "\n---\n"
+    
+    def _iter_all_laws_markdown_header(self, laws_dict: Dict[str, Dict[str, Any]],
+                                       generated_at: Optional[str] = None,
+                                       stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
+        """전체 법령 Markdown의 머리말(헤더·통계·목차) 줄 생성
+
+        stats가 있으면 (summarize_laws로 이미 계산한 통계) 다시 세지 않고 재사용
+        """
         # 헤더
-        lines.append("# 📚 법령 수집 결과\n")
-        lines.append(f"**수집 일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**총 법령 수**: {len(laws_dict)}개")
+        yield "# 📚 법령 수집 결과\n"
+        yield f"**수집 일시**: {generated_at or self._timestamp()}"
+        yield f"**총 법령 수**: {len(laws_dict)}개"
         
         # 통계
-        admin_rule_count = sum(1 for law in laws_dict.values() if law.get('is_admin_rule', False))
-        attachment_count = sum(len(law.get('attachments', [])) for law in laws_dict.values())
+        if stats is None:
+            stats = summarize_laws(laws_dict)
+        admin_rule_count = stats['admin_rules']
+        attachment_count = stats['attachments']
         
         if admin_rule_count > 0:
-            lines.append(f"**행정규칙 수**: {admin_rule_count}개")
+            yield f"**행정규칙 수**: {admin_rule_count}개"
         if attachment_count > 0:
-            lines.append(f"**별표/별첨 총계**: {attachment_count}개")
+            yield f"**별표/별첨 총계**: {attachment_count}개"
         
-        lines.append("")
+        yield ""
         
         # 목차
-        lines.append("## 📑 목차\n")
+        yield "## 📑 목차\n"
         for idx, (law_id, law) in enumerate(laws_dict.items(), 1):
             anchor = self._sanitize_filename(law['law_name'])
             type_emoji = "📋" if law.get('is_admin_rule', False) else "📖"
             attachment_mark = " 📎" if law.get('attachments') else ""
-            lines.append(f"{idx}. {type_emoji} [{law['law_name']}](#{anchor}){attachment_mark}")
-        lines.append("\n---\n")
-        
-        # 각 법령
-        for law_id, law in laws_dict.items():
-            lines.append(self._format_law_markdown(law))
-            lines.append("\n---\n")
-            
-        return '\n'.join(lines)
+            yield f"{idx}. {type_emoji} [{law['law_name']}](#{anchor}){attachment_mark}"
+        yield "\n---\n"
     
     def _create_readme(self, laws_dict: Dict[str, Dict[str, Any]], 
-                      include_pdfs: bool = False) -> str:
-        """README 생성"""
-        # 통계 계산
-        total_articles = sum(len(law.get('articles', [])) for law in laws_dict.values())
-        total_provisions = sum(len(law.get('supplementary_provisions', [])) for law in laws_dict.values())
-        total_attachments = sum(len(law.get('attachments', [])) for law in laws_dict.values())
-        admin_rule_count = sum(1 for law in laws_dict.values() if law.get('is_admin_rule', False))
+                      include_pdfs: bool = False,
+                      generated_at: Optional[str] = None) -> str:
+        """README 생성 - generated_at이 있으면 그 일시를 재사용"""
+        # 통계 계산과 일반 법령/행정규칙 분리를 한 번의 순회로 처리
+        total_articles = total_provisions = total_attachments = 0
+        general_laws = []
+        admin_rules = []
+        
+        for law in laws_dict.values():
+            total_articles += len(law['articles'])
+            total_provisions += len(law['supplementary_provisions'])
+            total_attachments += len(law['attachments'])
+            if law.get('is_admin_rule', False):
+                admin_rules.append(law)
+            else:
+                general_laws.append(law)
         
-        content = f"""# 법령 수집 결과
+        parts = [f"""# 법령 수집 결과
 
-수집 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+수집 일시: {generated_at or self._timestamp()}
 총 법령 수: {len(laws_dict)}개
 
 ## 📁 파일 구조
@@ -3385,49 +4227,43 @@ class LawExporter:
 - 총 조문 수: {total_articles:,}개
 - 총 부칙 수: {total_provisions}개
 - 총 별표/별첨 수: {total_attachments}개
-- 행정규칙 수: {admin_rule_count}개
+- 행정규칙 수: {len(admin_rules)}개
 
 ## 📖 수집된 법령 목록
 
-"""
-        
-        # 일반 법령과 행정규칙 분리
-        general_laws = []
-        admin_rules = []
-        
-        for law_id, law in laws_dict.items():
-            if law.get('is_admin_rule', False):
-                admin_rules.append((law_id, law))
-            else:
-                general_laws.append((law_id, law))
+"""]
         
-        # 일반 법령 목록
+        # 일반 법령 목록 (법령당 블록 하나)
         if general_laws:
-            content += "\n### 📖 일반 법령\n\n"
-            for law_id, law in general_laws:
-                content += f"#### {law['law_name']}\n"
-                content += f"- 법종구분: {law.get('law_type', '')}\n"
-                content += f"- 시행일자: {law.get('enforcement_date', '')}\n"
-                content += f"- 조문: {len(law.get('articles', []))}개\n"
-                if law.get('attachments'):
-                    content += f"- 별표/별첨: {len(law['attachments'])}개\n"
-                content += "\n"
-        
-        # 행정규칙 목록
+            parts.append("\n### 📖 일반 법령\n\n")
+            for law in general_laws:
+                attachments = law.get('attachments')
+                parts.append(
+                    f"#### {law['law_name']}\n"
+                    f"- 법종구분: {law.get('law_type', '')}\n"
+                    f"- 시행일자: {law.get('enforcement_date', '')}\n"
+                    f"- 조문: {len(law['articles'])}개\n"
+                    + (f"- 별표/별첨: {len(attachments)}개\n" if attachments else "")
+                    + "\n"
+                )
+        
+        # 행정규칙 목록 (법령당 블록 하나)
         if admin_rules:
-            content += "\n### 📋 행정규칙\n\n"
-            for law_id, law in admin_rules:
-                content += f"#### {law['law_name']}\n"
-                content += f"- 유형: {law.get('law_type', '')}\n"
-                if law.get('department'):
-                    content += f"- 소관부처: {law.get('department', '')}\n"
-                content += f"- 시행일자: {law.get('enforcement_date', '')}\n"
-                content += f"- 조문: {len(law.get('articles', []))}개\n"
-                if law.get('attachments'):
-                    content += f"- 별표/별첨: {len(law['attachments'])}개\n"
-                content += "\n"
+            parts.append("\n### 📋 행정규칙\n\n")
+            for law in admin_rules:
+                department = law.get('department')
+                attachments = law.get('attachments')
+                parts.append(
+                    f"#### {law['law_name']}\n"
+                    f"- 유형: {law.get('law_type', '')}\n"
+                    + (f"- 소관부처: {department}\n" if department else "")
+                    + f"- 시행일자: {law.get('enforcement_date', '')}\n"
+                    f"- 조문: {len(law['articles'])}개\n"
+                    + (f"- 별표/별첨: {len(attachments)}개\n" if attachments else "")
+                    + "\n"
+                )
 
-        return content
+        return ''.join(parts)
 
     def export_merged_pdf_content(self, laws_dict: Dict[str, Dict[str, Any]],
                                    base_law_name: str = '') -> bytes:
@@ -3441,49 +4277,36 @@ class LawExporter:
         return self._create_merged_markdown(laws_dict, base_law_name)
 
     def _create_merged_markdown(self, laws_dict: Dict[str, Dict[str, Any]],
-                                 base_law_name: str = '') -> str:
-        """통합 Markdown 콘텐츠 생성"""
+                                 base_law_name: str = '',
+                                 generated_at: Optional[str] = None) -> str:
+        """통합 Markdown 콘텐츠 생성 - generated_at이 있으면 그 일시를 재사용"""
         lines = []
 
         # 제목
         title = f"{base_law_name} 법령 체계도" if base_law_name else "법령 통합 문서"
         lines.append(f"# 📚 {title}\n")
-        lines.append(f"> 생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        lines.append(f"> 생성일시: {generated_at or self._timestamp()}\n")
         lines.append(f"> 총 법령 수: {len(laws_dict)}개\n")
 
         # 목차 생성
         lines.append("\n---\n")
         lines.append("## 📑 목차\n")
 
-        # 법령을 유형별로 분류
-        law_types = {
-            '법률': [],
-            '시행령': [],
-            '시행규칙': [],
-            '행정규칙': []
+        # 법령을 유형별로 분류 (한 번의 순회로 버킷 구성, 앵커도 이때 한 번만 계산해
+        # 목차와 본문에서 공유)
+        law_types: Dict[str, List[Tuple[Dict[str, Any], str]]] = {
+            category: [] for category in HIERARCHY_CATEGORIES
         }
 
-        for law_id, law in laws_dict.items():
-            law_name = law.get('law_name', '')
-            law_type = law.get('law_type', '')
-
-            if law.get('is_admin_rule') or any(k in law_name for k in ['고시', '훈령', '예규', '규정', '세칙']):
-                law_types['행정규칙'].append((law_id, law))
-            elif '시행규칙' in law_name or '시행규칙' in law_type:
-                law_types['시행규칙'].append((law_id, law))
-            elif '시행령' in law_name or '시행령' in law_type:
-                law_types['시행령'].append((law_id, law))
-            else:
-                law_types['법률'].append((law_id, law))
+        for law in laws_dict.values():
+            law_types[get_hierarchy_category(law)].append((law, self._merge_anchor(law)))
 
         # 목차 작성
         toc_num = 1
         for type_name, type_laws in law_types.items():
             if type_laws:
                 lines.append(f"\n### {type_name}\n")
-                for law_id, law in type_laws:
-                    # 앵커 링크 생성
-                    anchor = self._sanitize_filename(law['law_name']).replace(' ', '-').lower()
+                for law, anchor in type_laws:
                     lines.append(f"{toc_num}. [{law['law_name']}](#{anchor})")
                     toc_num += 1
 
@@ -3496,18 +4319,23 @@ class LawExporter:
                 lines.append(f"\n### 📂 {type_name}\n")
                 lines.append("---\n")
 
-                for law_id, law in type_laws:
-                    lines.append(self._format_law_for_merge(law))
+                for law, anchor in type_laws:
+                    lines.append(self._format_law_for_merge(law, anchor))
                     lines.append("\n---\n")
 
         return '\n'.join(lines)
 
-    def _format_law_for_merge(self, law: Dict[str, Any]) -> str:
-        """병합 문서용 개별 법령 포맷"""
+    def _merge_anchor(self, law: Dict[str, Any]) -> str:
+        """병합 문서용 앵커 생성"""
+        return self._sanitize_filename(law['law_name']).replace(' ', '-').lower()
+
+    def _format_law_for_merge(self, law: Dict[str, Any], anchor: Optional[str] = None) -> str:
+        """병합 문서용 개별 법령 포맷 - anchor가 주어지면 (목차에서 계산한 값) 재사용"""
         lines = []
 
         # 법령 제목 (앵커 포함)
-        anchor = self._sanitize_filename(law['law_name']).replace(' ', '-').lower()
+        if anchor is None:
+            anchor = self._merge_anchor(law)
         lines.append(f"<a name=\"{anchor}\"></a>")
         lines.append(f"## 📜 {law['law_name']}\n")
 
@@ -3528,19 +4356,20 @@ class LawExporter:
 
         # 조문
         if law.get('articles'):
-            lines.append("### 📖 조문\n")
+            lines.append(self.MERGE_HEADER_ARTICLES)
+            # 조문당 한 줄 항목으로 추가 (제목·본문·항을 하나의 문자열로 구성)
             for article in law['articles']:
-                lines.append(f"#### {article['number']} {article.get('title', '')}\n")
-                lines.append(f"{article['content']}\n")
-
-                if article.get('paragraphs'):
-                    for para in article['paragraphs']:
-                        lines.append(f"> {para['number']} {para['content']}\n")
-                lines.append("")
+                paragraphs = ''.join(
+                    f"> {para['number']} {para['content']}\n\n" for para in article['paragraphs']
+                )
+                lines.append(
+                    f"#### {article['number']} {article.get('title', '')}\n\n"
+                    f"{article['content']}\n\n{paragraphs}"
+                )
 
         # 부칙
         if law.get('supplementary_provisions'):
-            lines.append("### 📋 부칙\n")
+            lines.append(self.MERGE_HEADER_SUPPLEMENTARY)
             for provision in law['supplementary_provisions']:
                 if provision.get('promulgation_date'):
                     lines.append(f"#### 부칙 <{provision['promulgation_date']}>\n")
@@ -3549,7 +4378,7 @@ class LawExporter:
 
         # 별표/별첨
         if law.get('attachments'):
-            lines.append("### 📎 별표/별첨\n")
+            lines.append(self.MERGE_HEADER_ATTACHMENTS)
             for attachment in law['attachments']:
                 lines.append(f"#### [{attachment['type']}] {attachment.get('title', '')}\n")
                 if attachment.get('content'):
@@ -3566,71 +4395,82 @@ class LawExporter:
 
         # 원문 (조문이 없는 경우)
         if not law.get('articles') and law.get('raw_content'):
-            lines.append("### 📄 원문\n")
+            lines.append(self.MERGE_HEADER_RAW)
             lines.append(f"```\n{law['raw_content']}\n```\n")
 
         return '\n'.join(lines)
 
     def export_merged_zip(self, laws_dict: Dict[str, Dict[str, Any]],
-                          base_law_name: str = '') -> bytes:
-        """통합 파일과 개별 파일을 모두 포함하는 ZIP 내보내기"""
-        zip_buffer = BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # 1. 통합 Markdown 파일
-            merged_md = self._create_merged_markdown(laws_dict, base_law_name)
-            safe_base_name = self._sanitize_filename(base_law_name) if base_law_name else '법령_통합'
-            zip_file.writestr(f'{safe_base_name}_통합.md', merged_md)
-
-            # 2. 통합 JSON 파일
-            metadata = {
-                'collection_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'base_law_name': base_law_name,
-                'total_laws': len(laws_dict),
-                'laws': laws_dict
-            }
-            zip_file.writestr(
-                f'{safe_base_name}_통합.json',
-                json.dumps(metadata, ensure_ascii=False, indent=2)
-            )
+                          base_law_name: str = '',
+                          compression: Optional[str] = None,
+                          merged_markdown: Optional[str] = None) -> bytes:
+        """통합 파일과 개별 파일을 모두 포함하는 ZIP 내보내기
+
+        merged_markdown이 주어지면 (통합 Markdown 다운로드용으로 이미 만든 결과) 재사용합니다.
+        """
+        collection_date = self._timestamp()
+        with tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as spool:
+            with self._open_zip(spool, compression) as zip_file:
+                # 1. 통합 Markdown 파일
+                merged_md = merged_markdown
+                if merged_md is None:
+                    merged_md = self._create_merged_markdown(laws_dict, base_law_name, collection_date)
+                safe_base_name = self._sanitize_filename(base_law_name) if base_law_name else '법령_통합'
+                zip_file.writestr(f'{safe_base_name}_통합.md', merged_md)
+
+                # 2. 통합 JSON 파일 메타데이터
+                metadata = {
+                    'collection_date': collection_date,
+                    'base_law_name': base_law_name,
+                    'total_laws': len(laws_dict)
+                }
 
-            # 3. 개별 파일들
-            for law_id, law in laws_dict.items():
-                safe_name = self._sanitize_filename(law['law_name'])
+                # 3. 개별 파일들 - 법령별 JSON은 한 번만 직렬화하여 개별 파일은 바로 ZIP에 기록하고
+                #    통합 JSON은 임시 파일에 이어 쓴 뒤 ZIP으로 복사 (법령 Markdown 포맷 버퍼는 재사용)
+                buffer = io.StringIO()
 
-                # 개별 Markdown
-                md_content = self._format_law_markdown(law)
-                zip_file.writestr(f'laws/{safe_name}.md', md_content)
+                def write_law_files():
+                    """개별 파일을 기록하고 통합 JSON용 (법령 ID, JSON)을 차례로 반환"""
+                    for law_id, law in laws_dict.items():
+                        safe_name = self._sanitize_filename(law['law_name'])
+                        law_blob = dumps_json(law, compact=True)
 
-                # 개별 JSON
-                zip_file.writestr(
-                    f'laws/{safe_name}.json',
-                    json.dumps(law, ensure_ascii=False, indent=2)
-                )
+                        # 개별 Markdown
+                        zip_file.writestr(f'laws/{safe_name}.md', self._format_law_markdown(law, buffer))
+
+                        # 개별 JSON
+                        zip_file.writestr(f'laws/{safe_name}.json', law_blob)
+                        yield law_id, law_blob
 
-            # 4. README
-            readme = self._create_merged_readme(laws_dict, base_law_name)
-            zip_file.writestr('README.md', readme)
+                with tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_SIZE) as all_json:
+                    self._write_collection_json(all_json, metadata, write_law_files())
+                    self._copy_to_zip(zip_file, f'{safe_base_name}_통합.json', all_json)
 
-        zip_buffer.seek(0)
-        return zip_buffer.getvalue()
+                # 4. README
+                readme = self._create_merged_readme(laws_dict, base_law_name, collection_date)
+                zip_file.writestr('README.md', readme)
+
+            spool.seek(0)
+            return spool.read()
 
     def _create_merged_readme(self, laws_dict: Dict[str, Dict[str, Any]],
-                               base_law_name: str = '') -> str:
-        """통합 내보내기용 README 생성"""
+                               base_law_name: str = '',
+                               generated_at: Optional[str] = None) -> str:
+        """통합 내보내기용 README 생성 - generated_at이 있으면 그 일시를 재사용"""
         lines = []
 
         lines.append(f"# 📚 {base_law_name or '법령'} 체계도 수집 결과\n")
-        lines.append(f"> 생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        lines.append(f"> 생성일시: {generated_at or self._timestamp()}\n")
 
         lines.append("## 📊 수집 통계\n")
         lines.append(f"- **총 법령 수**: {len(laws_dict)}개")
 
         # 유형별 통계
-        admin_count = sum(1 for law in laws_dict.values() if law.get('is_admin_rule', False))
+        stats = summarize_laws(laws_dict)
+        admin_count = stats['admin_rules']
         general_count = len(laws_dict) - admin_count
-        article_count = sum(len(law.get('articles', [])) for law in laws_dict.values())
-        attachment_count = sum(len(law.get('attachments', [])) for law in laws_dict.values())
+        article_count = stats['articles']
+        attachment_count = stats['attachments']
 
         lines.append(f"- **일반 법령**: {general_count}개")
         lines.append(f"- **행정규칙**: {admin_count}개")
@@ -3673,9 +4513,12 @@ def initialize_session_state():
         'file_processed': False,
         'openai_api_key': None,
         'use_ai': False,
+        'ai_batches': {},  # 처리 대기 중인 OpenAI 배치 ID -> 파일 키 목록
         'oc_code': '',
         'include_pdfs': False,  # PDF 다운로드 옵션
-        'current_data_type': 'law'  # 현재 선택된 데이터 유형
+        'current_data_type': 'law',  # 현재 선택된 데이터 유형
+        'collection_id': 0,  # collected_laws가 교체될 때마다 증가
+        'export_cache': {}  # (collection_id, 산출물 키) -> 다운로드 데이터
     }
 
     for key, value in defaults.items():
@@ -3683,6 +4526,106 @@ def initialize_session_state():
             st.session_state[key] = value
 
 
+def mark_collection_updated():
+    """수집 결과가 교체되었음을 기록하여 이전 다운로드 산출물 캐시를 무효화"""
+    st.session_state.collection_id = st.session_state.get('collection_id', 0) + 1
+
+
+def has_export_artifact(name: str) -> bool:
+    """현재 수집 결과에 대한 다운로드 산출물이 이미 만들어졌는지 확인"""
+    cache = st.session_state.get('export_cache', {})
+    return (st.session_state.get('collection_id', 0), name) in cache
+
+
+def get_export_artifact(name: str, builder: Callable[[], Any]) -> Any:
+    """현재 수집 결과에 대한 다운로드 산출물을 세션에 캐시하여 재실행 시 재사용"""
+    cache = st.session_state.setdefault('export_cache', {})
+    collection_id = st.session_state.get('collection_id', 0)
+    key = (collection_id, name)
+
+    if key not in cache:
+        # 이전 수집 결과의 산출물은 폐기
+        for stale_key in [k for k in cache if k[0] != collection_id]:
+            del cache[stale_key]
+        cache[key] = builder()
+
+    return cache[key]
+
+
+def export_artifact_requested(name: str, button_label: str) -> bool:
+    """산출물이 이미 만들어졌거나 준비 버튼을 눌렀을 때만 True
+
+    재실행마다 다운로드하지 않을 ZIP까지 만들지 않도록, 처음 한 번은 버튼으로 생성을 요청받음
+    """
+    return has_export_artifact(name) or st.button(
+        button_label,
+        key=f"prepare_{name}",
+        use_container_width=True
+    )
+
+
+def select_zip_compression() -> str:
+    """ZIP 압축 수준 선택 - 대용량 수집 시 '빠름'으로 생성 시간 단축"""
+    options = list(LawExporter.ZIP_COMPRESSION_OPTIONS)
+    return st.radio(
+        "압축",
+        options,
+        index=options.index(LawExporter.DEFAULT_ZIP_COMPRESSION),
+        horizontal=True,
+        help="빠름(미압축): 생성이 가장 빠름\n균형: 빠른 압축 (권장)\n최대: 가장 작은 파일, 생성이 느림"
+    )
+
+
+def select_gzip_download(name: str, data: bytes, file_name: str, mime: str) -> Tuple[bytes, str, str]:
+    """gzip 압축 선택 시 (다운로드 데이터, 파일명, MIME)을 .gz로 바꿔 반환
+
+    한글 법령 본문은 압축률이 높아 대용량 통합 파일의 전송량을 크게 줄임 (수집 결과마다 한 번만 압축)
+    """
+    if not st.checkbox("🗜️ gzip 압축 (.gz)", key=f"gzip_{name}",
+                       help="대용량 통합 파일의 다운로드 크기를 줄입니다"):
+        return data, file_name, mime
+
+    import gzip  # 압축 선택 시에만 필요
+    payload = get_export_artifact(f"{name}:gzip", lambda: gzip.compress(data, compresslevel=6))
+    return payload, f"{file_name}.gz", "application/gzip"
+
+
+def verify_openai_api_key(api_key: str) -> bool:
+    """API 키를 실제 호출로 검증 - 세션 내에서 이미 검증된 키는 다시 호출하지 않음"""
+    key_digest = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    verified_digests = st.session_state.setdefault('verified_api_key_digests', set())
+    if key_digest in verified_digests:
+        return True
+
+    test_client = get_openai_client(api_key)
+
+    # 버전 독립적인 API 테스트
+    from openai import AuthenticationError  # get_openai_client가 성공했으면 설치되어 있음
+
+    try:
+        # 가장 간단한 API 호출 - chat completion
+        test_client.chat.completions.create(
+            model=EnhancedLawFileExtractor.AI_MODEL,
+            messages=[{"role": "user", "content": "test"}],
+            max_tokens=1
+        )
+        success = True
+    except AuthenticationError:
+        # 인증 실패는 다시 시도해도 같으므로 바로 유효하지 않은 키로 판정
+        success = False
+    except Exception:
+        # chat API 실패 (모델 권한 등) 시 models API로 키만 확인
+        try:
+            test_response = test_client.models.list()
+            success = bool(test_response) and hasattr(test_response, 'data')
+        except Exception:
+            success = False
+
+    if success:
+        verified_digests.add(key_digest)
+    return success
+
+
 def show_sidebar():
     """사이드바 UI - 개선된 API 키 처리"""
     with st.sidebar:
@@ -3707,12 +4650,9 @@ def show_sidebar():
         with st.expander("🤖 AI 설정 (선택사항)", expanded=False):
             st.markdown("**ChatGPT를 사용하여 법령명 추출 정확도를 높입니다**")
             
-            # OpenAI 라이브러리 설치 확인
-            try:
-                import openai
-                openai_available = True
-            except ImportError:
-                openai_available = False
+            # OpenAI 라이브러리 설치 확인 (재실행마다 import하지 않음)
+            openai_available = is_openai_available()
+            if not openai_available:
                 st.warning("⚠️ OpenAI 라이브러리가 설치되지 않았습니다.")
                 st.info("설치하려면: `pip install openai`")
             
@@ -3727,17 +4667,19 @@ def show_sidebar():
                         st.session_state.use_ai = False
                         st.rerun()
                 else:
-                    # API 키 입력
-                    api_key_input = st.text_input(
-                        "OpenAI API Key",
-                        type="password",
-                        value="",
-                        key="openai_key_new_input",  # 고유 키
-                        help="https://platform.openai.com/api-keys 에서 발급",
-                        placeholder="sk-..."
-                    )
+                    # API 키 입력 - 폼으로 묶어 입력 중에는 재실행하지 않고 제출 시에만 검증
+                    with st.form("openai_key_form", border=False):
+                        api_key_input = st.text_input(
+                            "OpenAI API Key",
+                            type="password",
+                            value="",
+                            key="openai_key_new_input",  # 고유 키
+                            help="https://platform.openai.com/api-keys 에서 발급",
+                            placeholder="sk-..."
+                        )
+                        key_submitted = st.form_submit_button("🔑 API 키 설정", type="primary")
                     
-                    if st.button("🔑 API 키 설정", type="primary"):
+                    if key_submitted:
                         if api_key_input:
                             # 키 정리 및 검증
                             cleaned_key = api_key_input.strip()
@@ -3745,40 +4687,7 @@ def show_sidebar():
                             if cleaned_key.startswith(('sk-', 'sess-')) and len(cleaned_key) > 40:
                                 with st.spinner("API 키 검증 중..."):
                                     try:
-                                        from openai import OpenAI
-                                        # 테스트용 클라이언트 생성
-                                        test_client = OpenAI(api_key=cleaned_key)
-                                        
-                                        # 버전 독립적인 API 테스트
-                                        success = False
-                                        try:
-                                            # 가장 간단한 API 호출 - chat completion
-                                            test_response = test_client.chat.completions.create(
-                                                model="gpt-5",
-                                                messages=[{"role": "user", "content": "test"}],
-                                                max_tokens=1
-                                            )
-                                            success = True
-                                        except Exception as chat_error:
-                                            # chat API 실패 시 models API 시도
-                                            try:
-                                                # 신버전 API 호환
-                                                test_response = test_client.models.list()
-                                                if test_response and hasattr(test_response, 'data'):
-                                                    success = True
-                                            except:
-                                                # gpt-5로 재시도
-                                                try:
-                                                    test_response = test_client.chat.completions.create(
-                                                        model="gpt-5",
-                                                        messages=[{"role": "user", "content": "test"}],
-                                                        max_tokens=1
-                                                    )
-                                                    success = True
-                                                except:
-                                                    success = False
-                                        
-                                        if success:
+                                        if verify_openai_api_key(cleaned_key):
                                             # 성공하면 세션에 저장
                                             st.session_state.openai_api_key = cleaned_key
                                             st.session_state.use_ai = True
@@ -3841,6 +4750,10 @@ def show_sidebar():
             for key in list(st.session_state.keys()):
                 if key not in keys_to_keep:
                     del st.session_state[key]
+            _cached_law_search.clear()
+            _cached_law_detail.clear()
+            _cached_typed_search.clear()
+            _cached_typed_detail.clear()
             st.rerun()
         
         return st.session_state.get('oc_code', '')
@@ -3849,7 +4762,7 @@ def show_sidebar():
 def test_admin_rule_search(oc_code: str):
     """행정규칙 검색 테스트 - PDF 디버깅 정보 추가"""
     with st.spinner("행정규칙 검색 테스트 중..."):
-        collector = LawCollectorAPI(oc_code)
+        collector = get_collector(oc_code)
         
         # 테스트할 행정규칙들
         test_rules = [
@@ -3891,8 +4804,6 @@ def test_admin_rule_search(oc_code: str):
                                     st.warning("📎 별표/별지 없음")
             else:
                 st.warning(f"❌ 검색 결과 없음")
-            
-            time.sleep(0.5)
 
 
 def handle_hierarchy_search(collector: LawCollectorAPI, query: str):
@@ -4001,55 +4912,41 @@ def handle_hierarchy_search(collector: LawCollectorAPI, query: str):
     # 결과 표시 및 선택
     selected_laws = []
 
-    # 유형별로 그룹화하여 표시
-    law_groups = {
-        '법률': [],
-        '시행령': [],
-        '시행규칙': [],
-        '행정규칙': []
+    # 유형별로 그룹화하여 표시 (한 번의 순회로 버킷 구성)
+    law_groups: Dict[str, List[Dict[str, Any]]] = {
+        category: [] for category in HIERARCHY_CATEGORIES
     }
 
     for law in results:
-        law_name = law.get('law_name', '')
-        law_type = law.get('law_type', '')
-
-        if law.get('is_admin_rule') or any(k in law_name for k in ['고시', '훈령', '예규', '규정', '세칙']):
-            law_groups['행정규칙'].append(law)
-        elif '시행규칙' in law_name or '시행규칙' in law_type:
-            law_groups['시행규칙'].append(law)
-        elif '시행령' in law_name or '시행령' in law_type:
-            law_groups['시행령'].append(law)
-        else:
-            law_groups['법률'].append(law)
+        law_groups[get_hierarchy_category(law)].append(law)
 
-    # 그룹별로 표시
+    # 그룹별로 표시 - 행마다 위젯을 만들지 않고 그룹당 하나의 표로 렌더링
     for group_name, group_laws in law_groups.items():
         if group_laws:
             with st.expander(f"{group_name} ({len(group_laws)}개)", expanded=True):
-                for idx, law in enumerate(group_laws):
-                    col1, col2, col3 = st.columns([0.5, 5, 2])
-
-                    with col1:
-                        is_selected = st.checkbox(
-                            "",
-                            value=select_all,
-                            key=f"hierarchy_law_{law['law_id']}_{idx}",
-                            label_visibility="collapsed"
-                        )
-                        if is_selected:
-                            selected_laws.append(law)
-
-                    with col2:
-                        st.write(f"**{law.get('law_name', '')}**")
-                        if law.get('hierarchy_source'):
-                            st.caption(f"체계도 출처: {law['hierarchy_source']}")
-
-                    with col3:
-                        law_type = law.get('law_type', '')
-                        if law.get('is_admin_rule'):
-                            st.caption(f"🏛️ 행정규칙 | {law_type}")
-                        else:
-                            st.caption(f"📜 {law_type}")
+                group_df = pd.DataFrame({
+                    '선택': [select_all] * len(group_laws),
+                    '법령명': [law.get('law_name', '') for law in group_laws],
+                    '유형': [
+                        f"🏛️ 행정규칙 | {law.get('law_type', '')}" if law.get('is_admin_rule')
+                        else f"📜 {law.get('law_type', '')}"
+                        for law in group_laws
+                    ],
+                    '체계도 출처': [law.get('hierarchy_source', '') for law in group_laws]
+                })
+
+                edited_df = st.data_editor(
+                    group_df,
+                    key=selection_table_key(f"hierarchy_grid_{group_name}", group_laws, select_all),
+                    column_config={'선택': st.column_config.CheckboxColumn("선택")},
+                    disabled=['법령명', '유형', '체계도 출처'],
+                    hide_index=True,
+                    use_container_width=True
+                )
+
+                selected_laws.extend(
+                    law for law, is_selected in zip(group_laws, edited_df['선택']) if is_selected
+                )
 
     # 선택된 법령 저장
     st.session_state.hierarchy_selected_laws = selected_laws
@@ -4057,11 +4954,14 @@ def handle_hierarchy_search(collector: LawCollectorAPI, query: str):
     # 수집 버튼
     st.divider()
 
-    if st.button("📥 선택한 법령 상세 정보 수집", type="primary", use_container_width=True):
-        if not selected_laws:
-            st.error("수집할 법령을 선택해주세요!")
-        else:
-            collect_hierarchy_laws(collector, selected_laws)
+    # 선택된 법령이 없으면 수집 단계를 건너뜀
+    if not selected_laws:
+        st.info("수집할 법령을 선택해주세요.")
+        return
+
+    if st.button(f"📥 선택한 법령 상세 정보 수집 ({len(selected_laws)}개)",
+                 type="primary", use_container_width=True):
+        collect_hierarchy_laws(collector, selected_laws)
 
 
 def collect_hierarchy_laws(collector: LawCollectorAPI, laws: List[Dict[str, Any]]):
@@ -4071,46 +4971,32 @@ def collect_hierarchy_laws(collector: LawCollectorAPI, laws: List[Dict[str, Any]
     progress_bar = st.progress(0)
     status_text = st.empty()
 
-    collected_details = {}
-    errors = []
-
-    for idx, law in enumerate(laws):
-        progress = (idx + 1) / len(laws)
+    def update_progress(progress: float):
         progress_bar.progress(progress)
-        status_text.text(f"수집 중: {law.get('law_name', '')} ({idx + 1}/{len(laws)})")
-
-        try:
-            # 상세 정보 조회
-            detail = collector.get_detail_by_type(law)
-
-            if detail:
-                collected_details[law['law_id']] = detail
-            else:
-                errors.append(law.get('law_name', ''))
-
-        except Exception as e:
-            logger.error(f"법령 수집 오류: {law.get('law_name', '')}: {e}")
-            errors.append(law.get('law_name', ''))
+        status_text.text(f"수집 중... ({round(progress * len(laws))}/{len(laws)})")
 
-        time.sleep(0.2)  # API 부하 방지
+    # 상세 정보 병렬 조회 (동시 요청 수는 APIConfig.MAX_CONCURRENT로 제한)
+    collected_details = collector.collect_law_details(laws, progress_callback=update_progress)
+    errors = [law.get('law_name', '') for law in laws if law['law_id'] not in collected_details]
 
     progress_bar.empty()
     status_text.empty()
 
     # 결과 저장
     st.session_state.collected_laws = collected_details
+    mark_collection_updated()
 
     # 결과 표시
     st.success(f"✅ {len(collected_details)}개 법령의 상세 정보를 수집했습니다!")
 
     if errors:
         with st.expander(f"⚠️ 수집 실패 ({len(errors)}개)"):
-            for err in errors:
-                st.write(f"- {err}")
+            st.markdown("\n".join(f"- {err}" for err in errors))
 
     # 통계 표시
-    total_articles = sum(len(d.get('articles', [])) for d in collected_details.values())
-    total_attachments = sum(len(d.get('attachments', [])) for d in collected_details.values())
+    stats = summarize_laws(collected_details)
+    total_articles = stats['articles']
+    total_attachments = stats['attachments']
 
     stats_cols = st.columns(3)
     with stats_cols[0]:
@@ -4187,7 +5073,7 @@ def handle_direct_search_mode(oc_code: str):
             st.error("검색어를 입력해주세요!")
         else:
             with st.spinner(f"'{search_query}' 검색 중... ({selected_type_label})"):
-                collector = LawCollectorAPI(oc_code)
+                collector = get_collector(oc_code)
 
                 # 데이터 유형에 따른 검색
                 if selected_data_type == "hierarchy":
@@ -4234,8 +5120,16 @@ def handle_file_upload_mode(oc_code: str):
     st.header("📄 파일 업로드 모드")
     
     # AI 상태 표시 (수정)
-    if st.session_state.use_ai and st.session_state.openai_api_key:
+    ai_enabled = bool(st.session_state.use_ai and st.session_state.openai_api_key)
+    use_ai_batch = False
+    if ai_enabled:
         st.info(f"🤖 AI 강화 모드 활성화")
+        use_ai_batch = st.checkbox(
+            "🕒 AI 일괄 처리 (Batch API)",
+            value=False,
+            help="AI 보강 요청을 모아 OpenAI Batch API로 제출합니다. 비용이 절반이며 "
+                 "결과는 최대 24시간 내에 도착합니다. 기본 추출 결과는 즉시 표시됩니다."
+        )
     else:
         st.info("💡 AI 설정을 통해 법령명 추출 정확도를 높일 수 있습니다")
     
@@ -4251,10 +5145,13 @@ def handle_file_upload_mode(oc_code: str):
 
         extractor = EnhancedLawFileExtractor(
             use_ai=st.session_state.use_ai,
-            api_key=st.session_state.openai_api_key
+            api_key=st.session_state.openai_api_key,
+            defer_ai=use_ai_batch
         )
 
         newly_processed = []
+        batch_requests: List[Dict[str, Any]] = []
+        batch_file_keys: List[str] = []
 
         for uploaded_file in uploaded_files:
             file_type = uploaded_file.name.split('.')[-1].lower()
@@ -4268,6 +5165,14 @@ def handle_file_upload_mode(oc_code: str):
                     uploaded_file.seek(0)
                     extracted_laws = extractor.extract_from_file(uploaded_file, file_type)
 
+                    # 배치 모드: 이 파일의 AI 보강 요청을 모아둠
+                    for text, base_laws in extractor.deferred_ai_inputs:
+                        batch_requests.extend(
+                            extractor.build_ai_batch_requests(file_key, text, base_laws)
+                        )
+                        batch_file_keys.append(file_key)
+                    extractor.deferred_ai_inputs.clear()
+
                     st.session_state.file_extractions[file_key] = {
                         'file_name': uploaded_file.name,
                         'file_type': file_type,
@@ -4288,20 +5193,112 @@ def handle_file_upload_mode(oc_code: str):
                 else:
                     st.warning(f"⚠️ {name}: 법령명을 찾지 못했습니다")
 
+        if batch_requests:
+            batch_id = extractor.submit_ai_batch(batch_requests)
+            if batch_id:
+                st.session_state.ai_batches[batch_id] = batch_file_keys
+                st.info(f"🕒 AI 보강 요청 {len(batch_requests)}건을 배치로 제출했습니다 (ID: {batch_id})")
+            else:
+                st.warning("⚠️ AI 배치 제출에 실패했습니다. 기본 추출 결과만 사용합니다.")
+
         st.session_state.file_processed = bool(st.session_state.file_extractions)
 
         # 전체 리스트도 유지 (기존 기능 호환)
-        st.session_state.extracted_laws = [
-            law
-            for data in st.session_state.file_extractions.values()
-            for law in data.get('edited_laws', [])
-        ]
+        refresh_extracted_laws()
 
-    # 추출된 법령 표시
+    # 추출된 법령 표시 (업로드 목록을 비워도 대기 중인 AI 배치는 계속 확인 가능)
     if st.session_state.file_extractions:
+        if st.session_state.ai_batches:
+            display_ai_batch_status()
         display_extracted_laws(oc_code)
 
 
+def display_ai_batch_status():
+    """대기 중인 AI 배치들의 상태 확인 및 완료된 배치를 추출 결과에 병합"""
+    ai_batches = st.session_state.ai_batches
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.caption(f"🕒 AI 배치 처리 중: {', '.join(ai_batches)}")
+    with col2:
+        check_clicked = st.button("🔄 배치 상태 확인", key="check_ai_batch")
+
+    if not check_clicked:
+        return
+
+    extractor = EnhancedLawFileExtractor(
+        use_ai=st.session_state.use_ai,
+        api_key=st.session_state.openai_api_key
+    )
+
+    added_total = 0
+    completed = 0
+    for batch_id in list(ai_batches):
+        status, results, failed_requests = extractor.fetch_ai_batch_results(batch_id)
+        if results is None:
+            if status in ('failed', 'expired', 'cancelled'):
+                st.error(f"AI 배치가 완료되지 못했습니다 ({batch_id}, 상태: {status})")
+                del ai_batches[batch_id]
+            else:
+                st.info(f"배치 상태 ({batch_id}): {status}")
+            continue
+
+        for file_key, ai_laws in results.items():
+            data = st.session_state.file_extractions.get(file_key)
+            if not data:
+                continue
+            new_laws = sorted(ai_laws - set(data['laws']))
+            data['laws'] = data['laws'] + new_laws
+            edited = set(data['edited_laws'])
+            data['edited_laws'] = data['edited_laws'] + [law for law in new_laws if law not in edited]
+            # 편집 표는 기준 목록에 대한 변경분만 보관하므로 새 목록으로 표를 다시 만듦
+            reset_law_editor(data)
+            added_total += len(new_laws)
+
+        if failed_requests:
+            st.warning(f"⚠️ AI 배치 {batch_id}: 요청 {failed_requests}건이 실패하여 해당 구간은 기본 추출 결과만 사용합니다")
+
+        del ai_batches[batch_id]
+        completed += 1
+
+    if completed:
+        refresh_extracted_laws()
+        st.success(f"✅ AI 배치 {completed}건 완료: {added_total}개의 법령명을 추가했습니다")
+
+
+def refresh_extracted_laws():
+    """파일별 편집 목록으로 전체 법령명 리스트 갱신"""
+    st.session_state.extracted_laws = [
+        law
+        for item in st.session_state.file_extractions.values()
+        for law in item.get('edited_laws', [])
+    ]
+
+
+def reset_law_editor(data: Dict[str, Any]):
+    """파일의 법령명 편집 표를 현재 편집 목록 기준으로 새로 만들도록 표시"""
+    data['editor_laws'] = list(data['edited_laws'])
+    data['editor_version'] = data.get('editor_version', 0) + 1
+
+
+def render_law_editor(file_key: str, data: Dict[str, Any]) -> List[str]:
+    """법령명 목록을 행 추가/삭제가 가능한 하나의 표로 렌더링, 편집된 법령명 반환
+
+    st.data_editor는 처음 전달된 데이터에 대한 변경분을 위젯 상태로 보관하므로,
+    매 실행마다 같은 기준 목록(editor_laws)을 넘기고 목록이 바깥에서 바뀌면 키를 바꿈.
+    """
+    base_laws = data.setdefault('editor_laws', list(data.get('edited_laws', [])))
+    edited = st.data_editor(
+        pd.DataFrame({'법령명': base_laws}, dtype=object),
+        key=f"law_editor_{file_key}_{data.get('editor_version', 0)}",
+        num_rows="dynamic",
+        column_config={'법령명': st.column_config.TextColumn("법령명")},
+        hide_index=True,
+        use_container_width=True
+    )
+
+    return [name.strip() for name in edited['법령명'] if isinstance(name, str) and name.strip()]
+
+
 def display_extracted_laws(oc_code: str):
     """추출된 법령 표시 및 편집"""
     st.subheader("✏️ STEP 2: 법령명 확인 및 편집")
@@ -4313,47 +5310,19 @@ def display_extracted_laws(oc_code: str):
     total_admin_count = 0
 
     for file_key, data in file_extractions.items():
-        laws_for_file = data.get('edited_laws', [])
-        total_law_count += len(laws_for_file)
-        total_admin_count += sum(1 for law in laws_for_file
-                                 if any(k in law for k in LawPatterns.ADMIN_KEYWORDS))
-
-        with st.expander(f"📄 {data['file_name']} ({len(laws_for_file)}개)", expanded=True):
-            st.caption("한 줄에 하나씩 법령명을 입력하거나 수정할 수 있습니다.")
-
-            default_text = "\n".join(laws_for_file)
-            edited_text = st.text_area(
-                "법령명 목록",
-                value=default_text,
-                height=200,
-                key=f"law_area_{file_key}"
-            )
+        with st.expander(f"📄 {data['file_name']} ({len(data.get('edited_laws', []))}개)", expanded=True):
+            st.caption("표에서 법령명을 수정하거나, 마지막 행에 추가하거나, 행을 선택해 삭제할 수 있습니다.")
 
-            updated_laws = [line.strip() for line in edited_text.split('\n') if line.strip()]
-            st.session_state.file_extractions[file_key]['edited_laws'] = updated_laws
+            updated_laws = render_law_editor(file_key, data)
+            data['edited_laws'] = updated_laws
+            total_law_count += len(updated_laws)
+            total_admin_count += sum(1 for law in updated_laws
+                                     if any(k in law for k in LawPatterns.ADMIN_KEYWORDS))
 
             col_a, col_b = st.columns([3, 1])
             with col_a:
-                new_law = st.text_input(
-                    "새 법령명 추가",
-                    key=f"new_law_{file_key}"
-                )
-                if st.button("➕ 추가", key=f"add_btn_{file_key}"):
-                    if new_law and new_law.strip():
-                        updated_laws.append(new_law.strip())
-                        st.session_state.file_extractions[file_key]['edited_laws'] = updated_laws
-                        st.success(f"'{new_law.strip()}'을(를) 추가했습니다")
-                        st.session_state.extracted_laws = [
-                            law
-                            for item in st.session_state.file_extractions.values()
-                            for law in item.get('edited_laws', [])
-                        ]
-                        st.experimental_rerun()
-                    else:
-                        st.warning("추가할 법령명을 입력해주세요")
-
-            with col_b:
                 st.metric("법령 수", len(updated_laws))
+            with col_b:
                 if st.button("🗑️ 파일 제거", key=f"remove_{file_key}"):
                     removal_queue.append(file_key)
 
@@ -4368,11 +5337,7 @@ def display_extracted_laws(oc_code: str):
                         st.session_state[state_key].pop(key, None)
 
         # 전체 리스트 갱신
-        st.session_state.extracted_laws = [
-            law
-            for item in st.session_state.file_extractions.values()
-            for law in item.get('edited_laws', [])
-        ]
+        refresh_extracted_laws()
 
         st.experimental_rerun()
 
@@ -4382,11 +5347,7 @@ def display_extracted_laws(oc_code: str):
     with summary_col2:
         st.metric("추정 행정규칙", total_admin_count)
 
-    st.session_state.extracted_laws = [
-        law
-        for item in st.session_state.file_extractions.values()
-        for law in item.get('edited_laws', [])
-    ]
+    refresh_extracted_laws()
 
     # 검색 버튼
     if st.button("🔍 모든 파일에서 법령 검색", type="primary", use_container_width=True):
@@ -4414,7 +5375,7 @@ def display_extracted_laws(oc_code: str):
 def search_laws_from_list(oc_code: str, law_inputs: List[Any], is_from_file: bool = True):
     """파일 또는 입력에서 수집한 법령명을 검색"""
 
-    collector = LawCollectorAPI(oc_code)
+    collector = get_collector(oc_code)
 
     law_requests: Optional[List[Dict[str, Any]]] = None
     law_names: List[str] = []
@@ -4541,8 +5502,50 @@ def get_data_type_emoji(law: Dict[str, Any]) -> str:
         return '📖'
 
 
+def selection_table_key(prefix: str, laws: List[Dict[str, Any]], select_all: bool) -> str:
+    """선택 표(st.data_editor) 키
+
+    표의 편집 상태는 행 위치 기준으로 유지되므로, 법령 ID 목록을 키에 넣어 검색 결과가
+    바뀌면 선택 상태가 다른 법령으로 옮겨가지 않고 새 표로 초기화되도록 함.
+    전체 선택이 바뀔 때도 기본값을 다시 적용하도록 키에 포함.
+    """
+    law_keys = tuple(law.get('law_id') or law.get('law_msn') or '' for law in laws)
+    return f"{prefix}_{hash(law_keys)}_{select_all}"
+
+
+def render_selection_table(laws: List[Dict[str, Any]], columns: Dict[str, List[Any]],
+                           key: str, select_all: bool) -> List[Dict[str, Any]]:
+    """검색 결과를 행마다 위젯을 만들지 않고 하나의 체크박스 표로 렌더링, 선택된 항목 반환"""
+    table = pd.DataFrame({
+        '선택': [select_all] * len(laws),
+        '유형': [get_data_type_emoji(law) for law in laws],
+        **columns
+    })
+
+    edited = st.data_editor(
+        table,
+        key=key,
+        column_config={'선택': st.column_config.CheckboxColumn("선택")},
+        disabled=[column for column in table.columns if column != '선택'],
+        hide_index=True,
+        use_container_width=True
+    )
+
+    return [law for law, is_selected in zip(laws, edited['선택']) if is_selected]
+
+
 def display_search_results_and_collect(oc_code: str):
     """검색 결과 표시 및 수집"""
+    display_search_results()
+
+    # 수집은 앱 전체 실행에서 수행하여 결과가 다운로드 섹션에도 바로 반영되도록 함
+    if st.session_state.pop('collect_requested', False):
+        collect_selected_laws(oc_code)
+
+
+@st.fragment
+def display_search_results():
+    """검색 결과 표시 및 선택 - 표를 편집하면 앱 전체가 아닌 이 부분만 다시 실행"""
     results_by_file = st.session_state.get('search_results_by_file', {})
 
     if not st.session_state.search_results and not any(results_by_file.values()):
@@ -4560,141 +5563,54 @@ def display_search_results_and_collect(oc_code: str):
             file_name = st.session_state.file_extractions.get(file_key, {}).get('file_name', file_key)
             st.markdown(f"### 📄 {file_name}")
 
-            cols = st.columns([1, 1, 3, 2, 2])
-            headers = ["선택", "유형", "법령명", "법종구분", "검색어"]
-            for col, header in zip(cols, headers):
-                col.markdown(f"**{header}**")
-
             select_all_file = st.checkbox("전체 선택", key=f"select_all_{file_key}")
 
-            file_selected: List[Dict[str, Any]] = []
-            for idx, law in enumerate(laws):
-                row_cols = st.columns([1, 1, 3, 2, 2])
-
-                with row_cols[0]:
-                    if st.checkbox(
-                        "선택",
-                        key=f"sel_{file_key}_{idx}",
-                        value=select_all_file,
-                        label_visibility="collapsed"
-                    ):
-                        file_selected.append(law)
-
-                with row_cols[1]:
-                    st.write(get_data_type_emoji(law))
-
-                with row_cols[2]:
-                    st.write(law['law_name'])
-
-                with row_cols[3]:
-                    st.write(law.get('law_type', ''))
-
-                with row_cols[4]:
-                    st.write(law.get('source_law_name', law.get('search_query', '')))
+            file_selected = render_selection_table(
+                laws,
+                {
+                    "법령명": [law['law_name'] for law in laws],
+                    "법종구분": [law.get('law_type', '') for law in laws],
+                    "검색어": [law.get('source_law_name', law.get('search_query', '')) for law in laws],
+                },
+                selection_table_key(f"sel_{file_key}", laws, select_all_file),
+                select_all_file
+            )
 
             selected_laws_by_file[file_key] = file_selected
 
             st.divider()
     else:
-        # 직접 검색 모드 (파일 없음)용 기존 테이블 유지
+        # 직접 검색 모드 (파일 없음)용 테이블
         current_data_type = st.session_state.get('current_data_type', 'law')
 
         select_all = st.checkbox("전체 선택")
 
-        # 데이터 유형에 따라 헤더 조정
-        if current_data_type == 'precedent':
-            cols = st.columns([1, 1, 3, 2, 2, 2])
-            headers = ["선택", "유형", "사건명", "법원", "선고일자", "사건번호"]
-        elif current_data_type == 'constitutional':
-            cols = st.columns([1, 1, 3, 2, 2])
-            headers = ["선택", "유형", "사건명", "종국일자", "사건번호"]
-        elif current_data_type == 'interpretation':
-            cols = st.columns([1, 1, 3, 2, 2])
-            headers = ["선택", "유형", "안건명", "회신일자", "회신기관"]
-        elif current_data_type == 'admin_decision':
-            cols = st.columns([1, 1, 3, 2, 2])
-            headers = ["선택", "유형", "사건명", "의결일자", "재결구분"]
-        elif current_data_type == 'treaty':
-            cols = st.columns([1, 1, 3, 2, 2])
-            headers = ["선택", "유형", "조약명", "발효일자", "체결국가"]
-        elif current_data_type == 'ordinance':
-            cols = st.columns([1, 1, 3, 2, 2])
-            headers = ["선택", "유형", "자치법규명", "시행일자", "자치단체"]
-        else:
-            cols = st.columns([1, 1, 3, 2, 2, 2])
-            headers = ["선택", "유형", "법령명", "법종구분", "시행일자", "검색어"]
-
-        for col, header in zip(cols, headers):
-            col.markdown(f"**{header}**")
-
-        st.divider()
+        # 데이터 유형별 (헤더, 추가 표시 필드) - 행마다 분기하지 않도록 한 번만 결정
+        column_layouts = {
+            'precedent': (["사건명", "법원", "선고일자", "사건번호"], ['court', 'decision_date', 'case_no']),
+            'constitutional': (["사건명", "종국일자", "사건번호"], ['decision_date', 'case_no']),
+            'interpretation': (["안건명", "회신일자", "회신기관"], ['reply_date', 'reply_org']),
+            'admin_decision': (["사건명", "의결일자", "재결구분"], ['decision_date', 'decision_type']),
+            'treaty': (["조약명", "발효일자", "체결국가"], ['enforcement_date', 'country']),
+            'ordinance': (["자치법규명", "시행일자", "자치단체"], ['enforcement_date', 'local_gov']),
+        }
+        name_headers, extra_fields = column_layouts.get(
+            current_data_type,
+            (["법령명", "법종구분", "시행일자", "검색어"], ['law_type', 'enforcement_date', 'search_query'])
+        )
+        search_results = st.session_state.search_results
+        columns = {name_headers[0]: [law['law_name'] for law in search_results]}
+        # 데이터 유형에 따라 다른 필드 표시
+        for header, field in zip(name_headers[1:], extra_fields):
+            columns[header] = [law.get(field, '') for law in search_results]
+
+        direct_selection = render_selection_table(
+            search_results,
+            columns,
+            selection_table_key("sel_direct", search_results, select_all),
+            select_all
+        )
 
-        selected_indices = []
-        for idx, law in enumerate(st.session_state.search_results):
-            if current_data_type == 'precedent':
-                row_cols = st.columns([1, 1, 3, 2, 2, 2])
-            elif current_data_type in ['constitutional', 'interpretation', 'admin_decision', 'treaty', 'ordinance']:
-                row_cols = st.columns([1, 1, 3, 2, 2])
-            else:
-                row_cols = st.columns([1, 1, 3, 2, 2, 2])
-
-            with row_cols[0]:
-                if st.checkbox(
-                    "선택",
-                    key=f"sel_direct_{idx}",
-                    value=select_all,
-                    label_visibility="collapsed"
-                ):
-                    selected_indices.append(idx)
-
-            with row_cols[1]:
-                st.write(get_data_type_emoji(law))
-
-            with row_cols[2]:
-                st.write(law['law_name'])
-
-            # 데이터 유형에 따라 다른 필드 표시
-            if current_data_type == 'precedent':
-                with row_cols[3]:
-                    st.write(law.get('court', ''))
-                with row_cols[4]:
-                    st.write(law.get('decision_date', ''))
-                with row_cols[5]:
-                    st.write(law.get('case_no', ''))
-            elif current_data_type == 'constitutional':
-                with row_cols[3]:
-                    st.write(law.get('decision_date', ''))
-                with row_cols[4]:
-                    st.write(law.get('case_no', ''))
-            elif current_data_type == 'interpretation':
-                with row_cols[3]:
-                    st.write(law.get('reply_date', ''))
-                with row_cols[4]:
-                    st.write(law.get('reply_org', ''))
-            elif current_data_type == 'admin_decision':
-                with row_cols[3]:
-                    st.write(law.get('decision_date', ''))
-                with row_cols[4]:
-                    st.write(law.get('decision_type', ''))
-            elif current_data_type == 'treaty':
-                with row_cols[3]:
-                    st.write(law.get('enforcement_date', ''))
-                with row_cols[4]:
-                    st.write(law.get('country', ''))
-            elif current_data_type == 'ordinance':
-                with row_cols[3]:
-                    st.write(law.get('enforcement_date', ''))
-                with row_cols[4]:
-                    st.write(law.get('local_gov', ''))
-            else:
-                with row_cols[3]:
-                    st.write(law.get('law_type', ''))
-                with row_cols[4]:
-                    st.write(law.get('enforcement_date', ''))
-                with row_cols[5]:
-                    st.write(law.get('search_query', ''))
-
-        direct_selection = [st.session_state.search_results[i] for i in selected_indices]
         if direct_selection:
             selected_laws_by_file['direct_input'] = direct_selection
 
@@ -4723,12 +5639,13 @@ def display_search_results_and_collect(oc_code: str):
             st.info(type_info)
 
         if st.button("📥 선택한 항목 수집", type="primary", use_container_width=True):
-            collect_selected_laws(oc_code)
+            st.session_state.collect_requested = True
+            st.rerun()
 
 
 def collect_selected_laws(oc_code: str):
     """선택된 법령 수집 - PDF 다운로드 제거, 텍스트 내용 활용"""
-    collector = LawCollectorAPI(oc_code)
+    collector = get_collector(oc_code)
     
     progress_bar = st.progress(0)
     status_text = st.empty()
@@ -4758,14 +5675,16 @@ def collect_selected_laws(oc_code: str):
     if auto_added_ids:
         st.success(f"법령 체계 확장으로 {len(auto_added_ids)}개의 관련 법령을 추가로 수집했습니다.")
         with st.expander("자동으로 추가된 법령 확인"):
-            for law_id in auto_added_ids:
-                law_detail = collected[law_id]
-                relation = law_detail.get('relationship_from_parent', '관련 법령')
-                emoji = "📋" if law_detail.get('is_admin_rule') else "📖"
-                st.write(f"{emoji} {law_detail['law_name']} ({relation})")
+            # 법령마다 위젯을 만들지 않고 하나의 Markdown 목록으로 렌더링
+            st.markdown("\n".join(
+                f"- {'📋' if collected[law_id].get('is_admin_rule') else '📖'} "
+                f"{collected[law_id]['law_name']} "
+                f"({collected[law_id].get('relationship_from_parent', '관련 법령')})"
+                for law_id in auto_added_ids
+            ))
 
     # 별표/별첨 정보 표시
-    total_attachments = sum(len(law.get('attachments', [])) for law in collected.values())
+    total_attachments = sum(len(law['attachments']) for law in collected.values())
     if total_attachments > 0:
         st.info(f"📎 총 {total_attachments}개의 별표/별첨을 찾았습니다.")
         
@@ -4824,8 +5743,7 @@ def collect_selected_laws(oc_code: str):
         failed_laws = [law['law_name'] for law in st.session_state.selected_laws 
                       if law['law_id'] not in collected]
         with st.expander("❌ 수집 실패한 법령"):
-            for law_name in failed_laws:
-                st.write(f"- {law_name}")
+            st.markdown("\n".join(f"- {law_name}" for law_name in failed_laws))
     
     st.session_state.collected_laws = collected
 
@@ -4847,6 +5765,7 @@ def collect_selected_laws(oc_code: str):
             direct_bucket[law_id] = collected[law_id]
 
     st.session_state.collected_laws_by_file = collected_by_file
+    mark_collection_updated()
 
     # 통계 표시
     display_collection_stats(collected)
@@ -4855,44 +5774,55 @@ def collect_selected_laws(oc_code: str):
 
 def extract_text_from_pdf(pdf_file) -> str:
     """PDF에서 텍스트 추출 (OCR)"""
-    text = ""
-    
+    # pypdfium2로 먼저 추출 (가장 빠름)
     try:
-        # pdfplumber로 텍스트 추출 시도
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        # 텍스트가 없으면 PyPDF2로 재시도
-        if not text.strip():
-            pdf_file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        text = extract_pdf_text_pdfium(pdf_file)
+        if text.strip():
+            return text.strip()
+    except Exception as e:
+        logger.warning(f"pypdfium2 텍스트 추출 실패: {e}")
+    pdf_file.seek(0)
+
+    import pdfplumber
+    import PyPDF2
+
+    # 페이지 텍스트는 리스트에 모아 마지막에 한 번만 결합
+    page_texts: List[str] = []
     
+    try:
+        # PyPDF2로 텍스트 추출 시도 (레이아웃 분석을 하는 pdfplumber보다 빠름)
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                page_texts.append(page_text + "\n")
     except Exception as e:
-        logger.error(f"PDF 텍스트 추출 오류: {e}")
+        logger.warning(f"PyPDF2 텍스트 추출 실패: {e}")
+        page_texts = []
+    
+    # 텍스트가 없으면 pdfplumber로 재시도
+    if not ''.join(page_texts).strip():
+        try:
+            pdf_file.seek(0)
+            with pdfplumber.open(pdf_file) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        page_texts.append(page_text + "\n")
+        except Exception as e:
+            logger.error(f"PDF 텍스트 추출 오류: {e}")
         
-    return text.strip()
+    return ''.join(page_texts).strip()
 
 
 def display_collection_stats(collected_laws: Dict[str, Dict[str, Any]]):
     """수집 통계 표시 - 별표/별첨 텍스트 통계로 변경"""
-    total_articles = sum(len(law.get('articles', [])) for law in collected_laws.values())
-    total_provisions = sum(len(law.get('supplementary_provisions', [])) for law in collected_laws.values())
-    total_attachments = sum(len(law.get('attachments', [])) for law in collected_laws.values())
-    admin_rule_count = sum(1 for law in collected_laws.values() if law.get('is_admin_rule', False))
-    
-    # 별표/별첨 텍스트 길이 계산
-    total_attachment_chars = sum(
-        len(att.get('content', '')) 
-        for law in collected_laws.values() 
-        for att in law.get('attachments', [])
-    )
+    stats = summarize_laws(collected_laws)
+    total_articles = stats['articles']
+    total_provisions = stats['provisions']
+    total_attachments = stats['attachments']
+    admin_rule_count = stats['admin_rules']
+    total_attachment_chars = stats['attachment_chars']
     
     col1, col2, col3, col4, col5 = st.columns(5)
     with col1:
@@ -4945,8 +5875,56 @@ def display_hierarchy_overview(collected_laws: Dict[str, Dict[str, Any]]):
             render_node(root_id)
 
 
+def build_collection_detail_markdown(collected_laws: Dict[str, Dict[str, Any]]) -> str:
+    """수집 결과 상세 Markdown 생성 (법령별 통계, 샘플 조문, 별표/별첨 목록)"""
+    lines = []
+
+    for law in collected_laws.values():
+        emoji = "📋" if law.get('is_admin_rule', False) else "📖"
+        lines.extend([f"### {emoji} {law['law_name']}", ""])
+
+        stats = [
+            f"조문: {len(law['articles'])}개",
+            f"부칙: {len(law['supplementary_provisions'])}개",
+            f"별표: {len(law['attachments'])}개"
+        ]
+        # 별표/별첨 텍스트 길이
+        att_chars = sum(len(att.get('content', '')) for att in law['attachments'])
+        if att_chars > 0:
+            stats.append(f"별표 텍스트: {att_chars:,}자")
+        lines.extend([" · ".join(stats), ""])
+
+        # 샘플 조문
+        if law.get('articles'):
+            sample = law['articles'][0]
+            lines.extend([
+                "**샘플 조문:**",
+                "",
+                "```",
+                f"{sample['number']} {sample.get('title', '')}",
+                truncate_text(sample['content'], 200),
+                "```",
+                ""
+            ])
+
+        # 별표/별첨 목록
+        if law.get('attachments'):
+            lines.extend(["**별표/별첨:**", ""])
+            lines.extend(
+                f"- {att['type']} {att.get('number', '')}: {att.get('title', '')} ({len(att.get('content', ''))}자)"
+                for att in law['attachments']
+            )
+            lines.append("")
+
+    return '\n'.join(lines)
+
+
+@st.fragment
 def display_download_section():
-    """다운로드 섹션 표시 - 모든 형식 지원"""
+    """다운로드 섹션 표시 - 모든 형식 지원
+
+    형식·압축 선택이나 준비 버튼은 앱 전체가 아닌 이 부분만 다시 실행
+    """
     if not st.session_state.collected_laws:
         return
 
@@ -4954,6 +5932,11 @@ def display_download_section():
 
     exporter = LawExporter()
 
+    # 모든 다운로드 파일명/수집 일시에 동일한 시각 사용
+    now = datetime.now()
+    file_timestamp = now.strftime('%Y%m%d_%H%M%S')
+    collection_date = now.strftime('%Y-%m-%d %H:%M:%S')
+
     # 체계도 검색 결과인 경우 특별 다운로드 옵션 표시
     is_hierarchy_search = st.session_state.get('current_data_type') == 'hierarchy'
     hierarchy_info = st.session_state.get('hierarchy_info')
@@ -4990,10 +5973,11 @@ def display_download_section():
             help="Markdown (통합 + 개별 ZIP): 통합 문서와 개별 파일을 모두 포함한 ZIP\nMarkdown 단일: 통합 Markdown 파일만\nJSON 단일: 전체 데이터를 JSON으로"
         )
 
-        # 통계 표시
+        # 통계 표시 (수집 결과마다 한 번만 계산)
         total_laws = len(st.session_state.collected_laws)
-        total_articles = sum(len(law.get('articles', [])) for law in st.session_state.collected_laws.values())
-        total_attachments = sum(len(law.get('attachments', [])) for law in st.session_state.collected_laws.values())
+        stats = get_export_artifact("summary", lambda: summarize_laws(st.session_state.collected_laws))
+        total_articles = stats['articles']
+        total_attachments = stats['attachments']
 
         st.markdown(f"""
         **통합 파일 내용:**
@@ -5002,72 +5986,106 @@ def display_download_section():
         - 📎 별표/별첨: {total_attachments}개
         """)
 
+        # 통합 Markdown은 단일 파일 다운로드와 ZIP에서 공유
+        def get_merged_markdown() -> str:
+            return get_export_artifact(
+                f"merged_markdown:{base_law_name}",
+                lambda: exporter.export_merged_markdown(st.session_state.collected_laws, base_law_name)
+            )
+
         if merge_format == "Markdown (통합 + 개별 ZIP)":
             # 통합 + 개별 ZIP
-            zip_data = exporter.export_merged_zip(st.session_state.collected_laws, base_law_name)
+            compression = select_zip_compression()
+            artifact_name = f"merged_zip:{base_law_name}:{compression}"
+            if export_artifact_requested(artifact_name, "📦 통합 ZIP 준비"):
+                zip_data = get_export_artifact(
+                    artifact_name,
+                    lambda: exporter.export_merged_zip(
+                        st.session_state.collected_laws, base_law_name,
+                        compression=compression, merged_markdown=get_merged_markdown()
+                    )
+                )
 
-            st.download_button(
-                label="📦 통합 ZIP 다운로드 (Merge + 개별)",
-                data=zip_data,
-                file_name=f"{base_law_name or '법령'}_체계도_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
-                mime="application/zip",
-                use_container_width=True
-            )
+                st.download_button(
+                    label="📦 통합 ZIP 다운로드 (Merge + 개별)",
+                    data=zip_data,
+                    file_name=f"{base_law_name or '법령'}_체계도_{file_timestamp}.zip",
+                    mime="application/zip",
+                    use_container_width=True
+                )
 
         elif merge_format == "Markdown 단일 파일":
             # Markdown 단일 파일
-            merged_md = exporter.export_merged_markdown(st.session_state.collected_laws, base_law_name)
+            merged_md = get_merged_markdown()
+            # 다운로드 버튼에 str을 넘기면 재실행마다 다시 인코딩하므로 bytes로 한 번만 변환
+            merged_md_bytes = get_export_artifact(
+                f"merged_markdown_bytes:{base_law_name}",
+                lambda: merged_md.encode('utf-8')
+            )
 
             # 파일 크기 표시
-            file_size = len(merged_md.encode('utf-8'))
+            file_size = len(merged_md_bytes)
             st.caption(f"📊 예상 파일 크기: {file_size:,} bytes ({file_size/1024:.1f} KB)")
 
             st.download_button(
                 label="📄 통합 Markdown 다운로드",
-                data=merged_md,
-                file_name=f"{base_law_name or '법령'}_체계도_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                data=merged_md_bytes,
+                file_name=f"{base_law_name or '법령'}_체계도_{file_timestamp}.md",
                 mime="text/markdown",
                 use_container_width=True
             )
 
             # 미리보기
             with st.expander("📄 내용 미리보기 (처음 2000자)"):
-                st.markdown(merged_md[:2000] + "..." if len(merged_md) > 2000 else merged_md)
+                st.markdown(truncate_text(merged_md, 2000))
 
         else:  # JSON 단일 파일
-            # JSON 데이터
-            json_data = {
-                'collection_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            # JSON 데이터 (법령 본문은 법령별로 직렬화)
+            json_header = {
+                'collection_date': collection_date,
                 'base_law_name': base_law_name,
                 'total_laws': total_laws,
-                'hierarchy_info': hierarchy_info,
-                'laws': st.session_state.collected_laws
+                'hierarchy_info': hierarchy_info
             }
-            json_content = json.dumps(json_data, ensure_ascii=False, indent=2)
+            artifact_name = f"merged_json:{base_law_name}"
+            json_content = get_export_artifact(
+                artifact_name,
+                lambda: exporter.export_collection_json(st.session_state.collected_laws, json_header)
+            )
+            data, file_name, mime = select_gzip_download(
+                artifact_name, json_content,
+                f"{base_law_name or '법령'}_체계도_{file_timestamp}.json", "application/json"
+            )
 
             # 파일 크기 표시
-            file_size = len(json_content.encode('utf-8'))
+            file_size = len(data)
             st.caption(f"📊 예상 파일 크기: {file_size:,} bytes ({file_size/1024:.1f} KB)")
 
             st.download_button(
                 label="📄 통합 JSON 다운로드",
-                data=json_content,
-                file_name=f"{base_law_name or '법령'}_체계도_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
+                data=data,
+                file_name=file_name,
+                mime=mime,
                 use_container_width=True
             )
 
     elif download_option == "개별 파일 (ZIP)":
         # ZIP 다운로드
-        zip_data = exporter.export_to_zip(st.session_state.collected_laws)
-        
-        st.download_button(
-            label="📦 ZIP 다운로드 (JSON+TXT+MD)",
-            data=zip_data,
-            file_name=f"laws_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
-            mime="application/zip",
-            use_container_width=True
-        )
+        compression = select_zip_compression()
+        artifact_name = f"zip:{compression}"
+        if export_artifact_requested(artifact_name, "📦 ZIP 준비 (JSON+TXT+MD)"):
+            zip_data = get_export_artifact(
+                artifact_name,
+                lambda: exporter.export_to_zip(st.session_state.collected_laws, compression=compression)
+            )
+            
+            st.download_button(
+                label="📦 ZIP 다운로드 (JSON+TXT+MD)",
+                data=zip_data,
+                file_name=f"laws_{file_timestamp}.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
     else:
         # 통합 파일 - 명확한 형식 선택
         st.info("📌 단일 파일로 모든 법령을 통합하여 다운로드합니다.")
@@ -5089,33 +6107,44 @@ def display_download_section():
         
         # 형식별 내보내기 처리
         if file_format == "JSON":
-            content = exporter.export_single_file(st.session_state.collected_laws, 'json')
+            export_format = 'json'
             mime = "application/json"
             ext = "json"
         elif file_format == "Markdown":
-            content = exporter.export_single_file(st.session_state.collected_laws, 'markdown')
+            export_format = 'markdown'
             mime = "text/markdown"
             ext = "md"
         else:  # Text
-            content = exporter.export_single_file(st.session_state.collected_laws, 'text')
+            export_format = 'text'
             mime = "text/plain"
             ext = "txt"
+
+        artifact_name = f"single:{export_format}"
+        content = get_export_artifact(
+            artifact_name,
+            lambda: exporter.export_single_file(st.session_state.collected_laws, export_format)
+        )
+        data, file_name, mime = select_gzip_download(
+            artifact_name, content, f"all_laws_{file_timestamp}.{ext}", mime
+        )
         
         # 파일 크기 표시
-        file_size = len(content.encode('utf-8'))
+        file_size = len(data)
         st.caption(f"📊 예상 파일 크기: {file_size:,} bytes")
         
         st.download_button(
             label=f"💾 {file_format} 통합 파일 다운로드 (.{ext})",
-            data=content,
-            file_name=f"all_laws_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}",
+            data=data,
+            file_name=file_name,
             mime=mime,
             use_container_width=True
         )
         
         # 미리보기 옵션
         with st.expander("📄 내용 미리보기 (처음 1000자)"):
-            st.text(content[:1000] + "..." if len(content) > 1000 else content)
+            # 한글은 글자당 최대 4바이트이므로 앞부분만 디코딩
+            preview = content[:4000].decode('utf-8', errors='ignore')
+            st.text(truncate_text(preview, 1000))
 
     file_grouped = {
         key: laws
@@ -5127,50 +6156,32 @@ def display_download_section():
         st.subheader("🗂️ 파일별 Markdown 묶음")
         st.caption("업로드한 각 파일별로 통합된 Markdown 문서를 ZIP으로 제공합니다.")
 
-        file_bundle = exporter.export_markdown_by_file(
-            file_grouped,
-            st.session_state.get('file_extractions', {})
-        )
+        # 요청이 있을 때만 생성 (이후 재실행에서는 캐시 사용)
+        if export_artifact_requested("markdown_by_file", "🗂️ 파일별 Markdown 묶음 준비"):
+            file_bundle = get_export_artifact(
+                "markdown_by_file",
+                lambda: exporter.export_markdown_by_file(
+                    file_grouped,
+                    st.session_state.get('file_extractions', {})
+                )
+            )
 
-        st.download_button(
-            label="🗂️ 파일별 Markdown ZIP 다운로드",
-            data=file_bundle,
-            file_name=f"file_grouped_markdown_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
-            mime="application/zip",
-            use_container_width=True
-        )
+            st.download_button(
+                label="🗂️ 파일별 Markdown ZIP 다운로드",
+                data=file_bundle,
+                file_name=f"file_grouped_markdown_{file_timestamp}.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
 
-    # 수집 결과 상세
-    with st.expander("📊 수집 결과 상세"):
-        for law_id, law in st.session_state.collected_laws.items():
-            emoji = "📋" if law.get('is_admin_rule', False) else "📖"
-            st.subheader(f"{emoji} {law['law_name']}")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.write(f"조문: {len(law.get('articles', []))}개")
-            with col2:
-                st.write(f"부칙: {len(law.get('supplementary_provisions', []))}개")
-            with col3:
-                st.write(f"별표: {len(law.get('attachments', []))}개")
-            with col4:
-                # 별표/별첨 텍스트 길이
-                att_chars = sum(len(att.get('content', '')) for att in law.get('attachments', []))
-                if att_chars > 0:
-                    st.write(f"별표 텍스트: {att_chars:,}자")
-            
-            # 샘플 조문
-            if law.get('articles'):
-                st.write("**샘플 조문:**")
-                sample = law['articles'][0]
-                st.text(f"{sample['number']} {sample.get('title', '')}")
-                st.text(sample['content'][:200] + "...")
-            
-            # 별표/별첨 목록
-            if law.get('attachments'):
-                st.write("**별표/별첨:**")
-                for att in law['attachments']:
-                    st.write(f"  - {att['type']} {att.get('number', '')}: {att.get('title', '')} ({len(att.get('content', ''))}자)")
+    # 수집 결과 상세 - 접힌 expander도 매 재실행마다 내용을 전송하므로 켰을 때만 렌더링
+    # (수집 결과마다 한 번만 생성하여 하나의 Markdown으로 렌더링)
+    if st.toggle("📊 수집 결과 상세 보기", key="show_collection_detail"):
+        with st.container(border=True):
+            st.markdown(get_export_artifact(
+                "detail_report",
+                lambda: build_collection_detail_markdown(st.session_state.collected_laws)
+            ))
 
 
 def main():